@@ -0,0 +1,590 @@
+"""
+Support of ``asyncio``. Requires Python 3.5+.
+
+.. code::
+
+    from arango.aio import AsyncConnection
+
+    async def main():
+        conn = AsyncConnection(db="test")
+        doc = await conn.collection.test.documents.create({"x": 1})
+
+        async for doc in conn.query("FOR d IN test RETURN d"):
+            print(doc.body)
+
+"""
+import asyncio
+import inspect
+import logging
+import time
+
+from .core import Connection, Response
+from .cursor import Cursor
+from .collection import Collections, Collection
+from .document import Documents, Document, BulkResult, OperationResult
+from .exceptions import DocumentAlreadyCreated, DocumentNotFound, \
+    DocuemntUpdateError, InvalidCollectionId, AqlQueryError
+from .utils import chunks, parse_meta
+from .clients.asyncioclient import AsyncioClient
+
+__all__ = ("AsyncConnection", "AsyncCursor", "AsyncCollection",
+           "AsyncDocuments", "AsyncDocument")
+
+logger = logging.getLogger(__name__)
+
+
+async def gather_map(func, items, workers=1):
+    """
+    Async alternative of :py:func:`arango.utils.parallel_map`:
+    run coroutine function ``func`` for ``items`` with at most
+    ``workers`` coroutines at once. Return list of results
+    in the same order as ``items``.
+    """
+    results = []
+    pending = []
+
+    for item in items:
+        pending.append(func(item))
+
+        if len(pending) >= max(workers, 1):
+            results.extend(await asyncio.gather(*pending))
+            pending = []
+
+    if pending:
+        results.extend(await asyncio.gather(*pending))
+
+    return results
+
+
+async def gather_each(func, items, workers=1):
+    """
+    Like :py:func:`gather_map` but results of ``func``
+    are not kept
+    """
+    pending = []
+
+    for item in items:
+        pending.append(func(item))
+
+        if len(pending) >= max(workers, 1):
+            await asyncio.gather(*pending)
+            pending = []
+
+    if pending:
+        await asyncio.gather(*pending)
+
+
+class AsyncDocument(Document):
+    """
+    :py:class:`arango.document.Document` with awaitable
+    ``load``, ``create``, ``update``, ``save`` and ``delete``.
+    Async documents are never loaded lazily.
+    """
+    LAZY_LOAD_HANDLERS = []
+
+    @classmethod
+    async def load(cls, connection, meta=None, id=None):
+        if isinstance(meta, dict) and "_id" in meta:
+            id = meta.get("_id")
+
+        if id is None:
+            raise DocumentNotFound("id equal to None, can't load")
+
+        response = await connection.get(
+            cls.READ_DOCUMENT_PATH.format(id),
+            _expect_raw=True)
+
+        if response.status != 200:
+            raise DocumentNotFound(
+                "Sorry, document with handle `{0}` "
+                "not exist in database".format(id))
+
+        return cls.wrap(connection, response.data)
+
+    async def create(self, body, createCollection=False, **kwargs):
+        if self._id is not None:
+            raise DocumentAlreadyCreated(
+                "This document already created with id {0}".format(self.id)
+            )
+
+        params = {"collection": self.collection.cid}
+
+        if createCollection is True:
+            params.update({"createCollection": True})
+
+        params.update(kwargs)
+
+        response = await self.connection.post(
+            self.connection.qs(self.DOCUMENT_PATH, **params),
+            data=body)
+
+        if response.status in [200, 201, 202]:
+            self._body = body
+            self._track_changes()
+            parse_meta(self, response)
+
+            if getattr(self.connection, "identity_map", None) is not None:
+                self.connection.identity_map.add(self)
+
+            return self
+
+        return None
+
+    async def update(self, newData, save=True, **kwargs):
+        super(AsyncDocument, self).update(newData, save=False)
+
+        if save is True:
+            return await self.save(**kwargs)
+
+        return True
+
+    async def save(self, full=False, **kwargs):
+        method, params, data = self._save_request(full)
+        self._invalidate_cache()
+
+        path = self.UPDATE_DOCUMENT_PATH.format(self.id)
+        if params:
+            path = self.connection.qs(path, **params)
+
+        response = await getattr(self.connection, method)(
+            path, data=data, **kwargs)
+
+        if response.status in [200, 201, 202]:
+            self._rev = response.data.get("_rev")
+            self._track_changes()
+            return self
+
+        raise DocuemntUpdateError(
+            response.get("errorMessage", "Unknown error"))
+
+    async def delete(self):
+        self._invalidate_cache()
+
+        if getattr(self.connection, "identity_map", None) is not None:
+            self.connection.identity_map.discard(self._id)
+
+        response = await self.connection.delete(
+            self.DELETE_DOCUMENT_PATH.format(self.id))
+
+        if response.status == 202:
+            self._id = None
+            self._rev = None
+            self._body = None
+            return True
+
+        return False
+
+
+class AsyncDocuments(Documents):
+    """
+    Documents proxy where all operations
+    are coroutines. ``workers`` of bulk operations
+    is a number of concurrent requests.
+    """
+    document_cls = AsyncDocument
+
+    @property
+    async def count(self):
+        return await self.collection.count()
+
+    def __len__(self):
+        raise TypeError("Use `await documents.count` instead")
+
+    def __call__(self, *args, **kwargs):
+        raise TypeError(
+            "Resultset is not supported by asyncio connection, "
+            "use `async for` with `connection.query` instead")
+
+    def buffered_writer(self, *args, **kwargs):
+        raise TypeError(
+            "Buffered writer is not supported by asyncio connection")
+
+    async def update(self, ref_or_document, *args, **kwargs):
+        if not issubclass(type(ref_or_document), Document):
+            doc = await self.load(ref_or_document)
+        else:
+            doc = ref_or_document
+
+        return await doc.update(*args, **kwargs)
+
+    async def load(self, doc_id):
+        return await AsyncDocument.load(self.connection, id=doc_id)
+
+    async def create_bulk(self, docs, batch=100, workers=1, max_bytes=None):
+        request = self._bulk_request(docs, batch, max_bytes)
+
+        if request is None:
+            return False
+
+        path, header, parts = request
+        result = BulkResult()
+
+        async def send(chunk):
+            offset, chunk = chunk
+
+            try:
+                response = await self.connection.post(
+                    path, data=b"\n".join(header + chunk),
+                    ignore_request_args=True)
+            except Exception as e:
+                logger.error("Can't import chunk of %s documents",
+                             len(chunk), exc_info=True)
+                response = e
+
+            result.add(offset, len(chunk), response)
+
+        await gather_each(send, parts, workers)
+
+        return result
+
+    async def load_many(self, refs, chunk_size=1000, workers=1):
+        refs = [ref._id if issubclass(type(ref), Document) else ref
+                for ref in refs]
+
+        async def load(chunk):
+            return await self.connection.query(
+                self.LOAD_MANY_QUERY, bindVars=self._load_many_vars(chunk),
+                batchSize=len(chunk), raw=True).all()
+
+        rows = []
+        for chunk in await gather_map(
+                load, chunks(refs, chunk_size), workers):
+            rows.extend(chunk)
+
+        return self._document_list(refs, rows)
+
+    async def delete_many(self, refs, chunk_size=1000, workers=1,
+                          **options):
+        docs, keys = self._delete_keys(refs)
+
+        result = await self._run_many(
+            self.DELETE_MANY_QUERY, "keys", keys, chunk_size, workers,
+            options)
+
+        return self._deleted(docs, result)
+
+    async def _modify_many(self, operation, items, chunk_size, workers,
+                           options):
+        # NB: ``update_many`` and ``replace_many`` return this coroutine
+        docs, rows = self._modify_rows(items)
+
+        result = await self._run_many(
+            self.UPDATE_MANY_QUERY, "items", rows, chunk_size, workers,
+            options, operation=operation)
+
+        return self._modified(docs, result)
+
+    async def _run_many(self, query, name, values, chunk_size, workers,
+                        options, operation=None):
+        query, bind_vars = self._many_query(query, options, operation)
+
+        async def run(chunk):
+            chunk_vars = {name: chunk}
+            chunk_vars.update(bind_vars)
+
+            try:
+                return chunk, await self.connection.query(
+                    query, bindVars=chunk_vars, batchSize=len(chunk),
+                    raw=True).all(), None
+            except (AqlQueryError, IOError) as e:
+                logger.error("Can't process chunk of %s documents",
+                             len(chunk), exc_info=True)
+                return chunk, [], e
+
+        result = OperationResult()
+
+        for chunk, rows, error in await gather_map(
+                run, chunks(values, chunk_size), workers):
+            self._collect_many(result, chunk, rows, error)
+
+        return result
+
+
+class AsyncCollection(Collection):
+    """
+    :py:class:`arango.collection.Collection` where every
+    method which talk to database is a coroutine.
+    """
+    documents_cls = AsyncDocuments
+
+    async def info(self, resource=""):
+        if resource not in self.INFO_ALLOWED_RESOURCES:
+            resource = ""
+
+        response = await self.connection.get(
+            self.COLLECTION_DETAILS_PATH.format(self.name, resource))
+
+        return response.data
+
+    async def create(self, waitForSync=False,
+                     type=Collections.COLLECTION_DOCUMENTS, **kwargs):
+        params = {"waitForSync": waitForSync,
+                  "name": self.name,
+                  "type": type}
+        params.update(kwargs)
+
+        response = await self.connection.post(
+            self.CREATE_COLLECTION_PATH, data=params)
+
+        if response.status == 200:
+            return self
+
+        return None
+
+    async def count(self):
+        response = await self.info(resource="count")
+        return response.get("count", 0)
+
+    def __len__(self):
+        raise TypeError("Use `await collection.count()` instead")
+
+    async def delete(self):
+        response = await self.connection.delete(
+            self.DELETE_COLLECTION_PATH.format(self.name))
+
+        return response.status == 200
+
+    async def rename(self, name=None):
+        if name is None or name == "":
+            raise InvalidCollectionId(
+                "Please, provide correct collection name")
+
+        response = await self.connection.post(
+            self.RENAME_COLLECTION_PATH.format(self.name),
+            data={"name": name})
+
+        if not response.is_error:
+            self.connection.collection.rename_collection(self, name)
+            return True
+
+        return False
+
+    async def properties(self, **props):
+        url = self.PROPERTIES_COLLECTION_PATH.format(self.name)
+        origin = (await self.connection.get(url)).data
+
+        if not props:
+            return origin
+
+        if isinstance(origin, dict):
+            origin.update(props)
+
+        return (await self.connection.put(url, data=origin)).data
+
+    @property
+    def query(self):
+        query = super(AsyncCollection, self).query
+        query.cursor_cls = AsyncCursor
+        return query
+
+
+class AsyncCollections(Collections):
+    collection_cls = AsyncCollection
+
+    async def __call__(self, *args, **kwargs):
+        response = await self.connection.get(self.COLLECTIONS_LIST_URL)
+
+        return [c.get("name") for c in response.get("collections", [])]
+
+
+class AsyncCursor(Cursor):
+    """
+    Cursor for ``async for`` loops. ``wrapper`` may be
+    either regular function or coroutine function.
+    By default rows are wrapped into :py:class:`AsyncDocument`
+    without additional requests.
+    """
+
+    def __init__(self, connection, query, wrapper=None, **kwargs):
+        super(AsyncCursor, self).__init__(
+            connection, query,
+            wrapper=wrapper or self.wrap, **kwargs)
+
+    @staticmethod
+    def wrap(connection, item):
+        if isinstance(item, dict):
+            return AsyncDocument.wrap(connection, item)
+
+        return item
+
+    async def _wrap(self, item):
+        result = self.convert(item)
+
+        if inspect.isawaitable(result):
+            result = await result
+
+        return result
+
+    def __iter__(self):
+        raise TypeError("Use `async for` with AsyncCursor")
+
+    @property
+    async def first(self):
+        if not self._dataset:
+            await self.bulk()
+
+        try:
+            return await self._wrap(self._dataset[0])
+        except IndexError:
+            return None
+
+    @property
+    async def last(self):
+        if not self._dataset:
+            await self.bulk()
+
+        try:
+            return await self._wrap(self._dataset[-1])
+        except IndexError:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            try:
+                item = self._dataset.popleft()
+            except IndexError:
+                if not self._has_more:
+                    raise StopAsyncIteration
+
+                await self.bulk()
+                continue
+
+            self._position += 1
+            return await self._wrap(item)
+
+    async def bulk(self):
+        if self._closed:
+            raise AqlQueryError("Cursor is closed")
+
+        started = time.time()
+
+        if not self._cursor_id:
+            response = await self.connection.post(
+                self.CREATE_CURSOR_PATH, data=self.params)
+        else:
+            response = await self.connection.put(
+                self.READ_NEXT_BATCH_PATH.format(self._cursor_id))
+
+        self.parse_bulk(response)
+        self.observe(response, time.time() - started)
+
+    async def all(self):
+        """
+        Fetch all results into list
+        """
+        return [item async for item in self]
+
+    async def len(self):
+        """
+        Awaitable alternative of ``len(cursor)``
+        """
+        if self._count is None and not self.started:
+            await self.bulk()
+
+        if self._count is None:
+            raise TypeError(
+                "Count of results is unknown, create cursor "
+                "with `count=True` or use `count_query()`")
+
+        return self._count
+
+    async def count_query(self):
+        """
+        Awaitable alternative of :py:meth:`Cursor.count_query`
+        """
+        if self._count is None:
+            self._count = self.parse_length(await self.connection.post(
+                self.CREATE_CURSOR_PATH, data=self.length_params))
+
+        return self._count
+
+    def __len__(self):
+        raise TypeError("Use `await cursor.len()` instead")
+
+    def __bool__(self):
+        raise TypeError("Use `await cursor.len()` instead")
+
+    async def close(self):
+        is_open = self.is_open
+
+        self._closed = True
+        self._has_more = False
+        self._dataset.clear()
+        self.connection.cursors.discard(self)
+
+        if not is_open:
+            return False
+
+        response = await self.connection.delete(
+            self.DELETE_CURSOR_PATH.format(self._cursor_id))
+
+        return response.status == 202
+
+    def __enter__(self):
+        raise TypeError("Use `async with` with AsyncCursor")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __del__(self):
+        # NB: can't await request here, server will
+        # delete cursor after timeout
+        pass
+
+
+class AsyncConnection(Connection):
+    """
+    Connection to ArangoDB for ``asyncio`` applications.
+    HTTP methods (``get``, ``post``, ``put``, ``delete``) are
+    coroutines and by default :py:class:`AsyncioClient` is used.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["client"] = kwargs.get("client") or AsyncioClient
+        super(AsyncConnection, self).__init__(*args, **kwargs)
+
+    def requests_factory(self, method="get"):
+        req = getattr(self.client, method)
+
+        async def requests_factory_wrapper(path, **kwargs):
+            url, kw, args, expect_raw = self.prepare_request(
+                method, path, kwargs)
+
+            return Response(
+                url, await req(url, **kw), args=args, expect_raw=expect_raw,
+                codec=self.codec)
+
+        return requests_factory_wrapper
+
+    @property
+    def version(self):
+        raise NotImplementedError(
+            "Use `await connection.get_version()` instead")
+
+    async def get_version(self):
+        from .core import ArangoVersion
+
+        response = await self.get(
+            self.qs(self.VERSION_PATH, details="true"),
+            ignore_request_args=True)
+
+        return ArangoVersion(response.data)
+
+    @property
+    def collection(self):
+        if not self._collection:
+            self._collection = AsyncCollections(self)
+
+        return self._collection
+
+    def query(self, *args, **kwargs):
+        return AsyncCursor(self, *args, **kwargs)
+
+    def __repr__(self):
+        return "<AsyncConnection to ArangoDB ({0})>".format(self.url())
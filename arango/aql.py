@@ -133,6 +133,8 @@ class AQLQuery(object):
     """
     An abstraction layer to generate simple AQL queries.
     """
+    cursor_cls = Cursor
+
     def __init__(self, connection=None, collection=None, no_cache=False):
         self.collection = collection
         self.connection = connection
@@ -464,17 +466,32 @@ class AQLQuery(object):
         self._built_query = query
         return query
 
-    def execute(self, wrapper=None):
+    def execute(self, wrapper=None, raw=False, fields=None):
         """
         Execute query: create cursor, put binded variables
-        and return instance of :py:attr:`arango.cursor.Cursor` object
+        and return instance of :py:attr:`arango.cursor.Cursor` object.
+
+        With ``raw=True`` cursor yields decoded values without
+        wrapping them into documents, ``fields`` (list of names)
+        makes cursor yield tuples of values of these fields.
+
+        .. code::
+
+            for name, email in c.test.query.execute(
+                    fields=("name", "email")):
+                print(name, email)
+
         """
-        self.cursor_args.update({"bindVars": self.bind_vars})
+        # NB: arguments of this call shouldn't affect next ones
+        cursor_args = dict(self.cursor_args, bindVars=self.bind_vars)
         if wrapper is not None:
-            self.cursor_args.update({"wrapper": wrapper})
+            cursor_args.update({"wrapper": wrapper})
+
+        if raw or fields:
+            cursor_args.update({"raw": True, "fields": fields})
 
-        return Cursor(
-            self.connection, self.build_query(), **self.cursor_args)
+        return self.cursor_cls(
+            self.connection, self.build_query(), **cursor_args)
 
     def __repr__(self):
         return "<AQLQuery: {}>".format(self.build_query())
@@ -0,0 +1,259 @@
+import logging
+
+from .core import RequestChunk, Response
+from .cursor import Cursor
+from .document import Document
+from .exceptions import BatchError
+from .utils import parse_meta, proxied_document_ref
+
+__all__ = ("Batch", "BatchPart")
+
+logger = logging.getLogger(__name__)
+
+
+class BatchPart(object):
+    """
+    Single request queued within :py:class:`Batch`.
+    ``response`` is available after batch was sent.
+    """
+
+    def __init__(self, chunk, callback=None):
+        self.chunk = chunk
+        self.callback = callback
+        self.response = None
+
+    @property
+    def is_sent(self):
+        return self.response is not None
+
+    def resolve(self, response):
+        self.response = response
+
+        if self.callback is not None:
+            self.callback(response)
+
+    def __repr__(self):
+        return "<BatchPart #{0}: {1} {2}>".format(
+            self.chunk.part_num, self.chunk.method, self.chunk.url)
+
+
+class Batch(object):
+    """
+    Collect requests and send them to ArangoDB in one
+    round trip using **HTTP Batch API**.
+
+    .. code::
+
+        with c.connection.batch() as batch:
+            doc = batch.create(c.test, {"name": "John"})
+            batch.update(other_doc, {"name": "Jane"})
+            batch.delete(old_doc)
+            cursor = batch.query("FOR d IN test RETURN d")
+
+        # batch sent, all objects are resolved
+        print(doc.id)
+
+    - ``size`` - maximum number of parts in single batch
+      request, by default all parts sent at once
+    """
+    BATCH_PATH = "/_api/batch"
+    BOUNDARY = "XXXarangopythonbatchXXX"
+
+    def __init__(self, connection, size=None):
+        self.connection = connection
+        self.size = size
+        self.parts = []
+        self.errors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.send()
+
+    def __len__(self):
+        return len(self.parts)
+
+    def add(self, method, path, data=None, callback=None):
+        """
+        Queue request with ``method`` to ``path``.
+        ``data`` will be encoded to JSON in case it's ``dict``
+        or ``list``. ``callback`` called with ``Response``
+        when batch will be sent.
+        """
+        if isinstance(data, (dict, list)):
+            data = self.connection.codec.dumps(data)
+
+        part = BatchPart(
+            RequestChunk(
+                path, body=data, method=method,
+                boundary=self.BOUNDARY, part_num=len(self.parts) + 1),
+            callback=callback)
+
+        self.parts.append(part)
+        return part
+
+    def create(self, collection, body, **kwargs):
+        """
+        Queue creation of document with ``body`` in
+        ``collection``. Return :py:class:`arango.document.Document`
+        which will get ``id`` and ``rev`` after batch sent.
+        """
+        doc = Document(collection=collection, connection=self.connection)
+        params = {"collection": collection.cid}
+        params.update(kwargs)
+
+        def created(response):
+            if response.status in [200, 201, 202]:
+                doc._body = body
+                doc._track_changes()
+                parse_meta(doc, response)
+
+        self.add("POST",
+                 self.connection.qs(Document.DOCUMENT_PATH, **params),
+                 data=body, callback=created)
+
+        return doc
+
+    def update(self, document, data, **kwargs):
+        """
+        Update ``document`` with ``data`` (like
+        :py:meth:`arango.document.Document.update`) and
+        queue saving of it.
+        """
+        document.update(data, save=False)
+        method, params, body = document._save_request()
+        params = dict(params, **kwargs)
+
+        def saved(response):
+            document._invalidate_cache()
+
+            if response.status in [200, 201, 202]:
+                document._rev = response.data.get("_rev")
+                document._track_changes()
+
+        self.add(method.upper(),
+                 self.path(Document.UPDATE_DOCUMENT_PATH.format(
+                     document.id), params),
+                 data=body, callback=saved)
+
+        return document
+
+    def delete(self, ref_or_document):
+        """
+        Queue deletion of document. Instance of
+        ``Document`` will be cleaned up after batch sent.
+        """
+        handle = proxied_document_ref(ref_or_document)
+
+        def deleted(response):
+            self._invalidate(handle)
+
+            if response.status == 202 and \
+                    issubclass(type(ref_or_document), Document):
+                ref_or_document._id = None
+                ref_or_document._rev = None
+                ref_or_document._body = None
+
+        return self.add(
+            "DELETE",
+            Document.DELETE_DOCUMENT_PATH.format(handle),
+            callback=deleted)
+
+    def _invalidate(self, handle):
+        """
+        Drop document with ``handle`` from the document
+        cache and identity map of the connection
+        """
+        cache = getattr(self.connection, "document_cache", None)
+        if cache is not None:
+            cache.invalidate(handle)
+
+        identity_map = getattr(self.connection, "identity_map", None)
+        if identity_map is not None:
+            identity_map.discard(handle)
+
+    def query(self, *args, **kwargs):
+        """
+        Queue AQL query. Arguments are the same
+        as for :py:class:`arango.cursor.Cursor`. Return
+        cursor which contain first batch of results when
+        batch sent; next batches fetched as usual.
+        """
+        cursor = Cursor(self.connection, *args, **kwargs)
+
+        self.add("POST", Cursor.CREATE_CURSOR_PATH,
+                 data=cursor.params, callback=cursor.parse_bulk)
+
+        return cursor
+
+    def path(self, path, params):
+        if not params:
+            return path
+
+        return self.connection.qs(path, **params)
+
+    def send(self):
+        """
+        Send all queued parts and resolve them.
+        Return list of ``Response`` objects.
+        """
+        pending = [part for part in self.parts if not part.is_sent]
+        size = self.size or len(pending)
+        responses = []
+
+        for start in range(0, len(pending), size or 1):
+            responses.extend(self._send(pending[start:start + size]))
+
+        return responses
+
+    def _send(self, parts):
+        chunks = [part.chunk for part in parts]
+        client = self.connection.client
+
+        response = self.connection.post(
+            self.BATCH_PATH,
+            data=client.multipart(chunks, boundary=self.BOUNDARY),
+            headers={"Content-Type": "multipart/form-data; "
+                                     "boundary={0}".format(self.BOUNDARY)},
+            _expect_raw=True)
+
+        if response.is_error:
+            raise BatchError(response)
+
+        by_id = dict(client.parse_multipart(
+            response.response.text, self.BOUNDARY))
+        responses = []
+        failure = None
+
+        for part in parts:
+            http_response = by_id.get(str(part.chunk.part_num))
+
+            if http_response is None:
+                logger.error("No response for %s within batch", part)
+                continue
+
+            part_response = Response(
+                part.chunk.url, http_response, codec=self.connection.codec)
+
+            if part_response.status >= 400:
+                self.errors.append(part)
+
+            try:
+                part.resolve(part_response)
+            except Exception as e:
+                failure = failure or e
+
+            responses.append(part_response)
+
+        # NB: raise error from callbacks (like ``AqlQueryError``)
+        # only when all other parts resolved
+        if failure is not None:
+            raise failure
+
+        return responses
+
+    def __repr__(self):
+        return "<Batch with {0} parts for {1}>".format(
+            len(self.parts), self.connection)
@@ -0,0 +1,109 @@
+import time
+import threading
+
+from collections import OrderedDict
+
+__all__ = ("DocumentCache",)
+
+
+class DocumentCache(object):
+    """
+    Bounded LRU cache of documents keyed by document
+    handle which store body together with ``_rev``.
+
+    - ``maxsize`` - maximum number of cached documents
+    - ``ttl`` - seconds during which cached document returned
+      without any request. After that document revalidated
+      with ``If-None-Match`` request and unchanged document
+      cost ``304 Not Modified`` without body. By default
+      documents are revalidated on every load.
+
+    .. code::
+
+        conn = Connection(document_cache=DocumentCache(maxsize=10000))
+
+        doc = conn.collection.test.documents.load("test/1")
+        print(conn.document_cache.stats())
+
+    """
+
+    def __init__(self, maxsize=1000, ttl=0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def get(self, handle):
+        """
+        Return tuple ``(rev, body, fresh)`` or ``None``
+        in case document is not cached. Stale documents
+        (``fresh`` is ``False``) should be revalidated.
+        """
+        with self._lock:
+            entry = self._entries.pop(handle, None)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries[handle] = entry
+            rev, body, stored = entry
+            fresh = self.ttl and time.time() - stored < self.ttl
+
+            if fresh:
+                self.hits += 1
+
+            return rev, body, bool(fresh)
+
+    def put(self, handle, rev, body):
+        with self._lock:
+            self._entries.pop(handle, None)
+            self._entries[handle] = rev, body, time.time()
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidated(self, handle):
+        """
+        Mark document as not modified on the server
+        """
+        with self._lock:
+            entry = self._entries.get(handle)
+            self.revalidations += 1
+
+            if entry is not None:
+                self._entries[handle] = entry[0], entry[1], time.time()
+
+    def invalidate(self, handle):
+        with self._lock:
+            self._entries.pop(handle, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, handle):
+        return handle in self._entries
+
+    def __repr__(self):
+        return "<DocumentCache {0}/{1}>".format(
+            len(self._entries), self.maxsize)
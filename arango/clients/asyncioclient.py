@@ -0,0 +1,247 @@
+import ssl
+import asyncio
+import logging
+import weakref
+
+from urllib.parse import urlsplit
+
+from .base import RequestsBase
+from .pool import RemoteDisconnected, is_stale
+
+__all__ = ("AsyncioClient",)
+
+logger = logging.getLogger("arango.asyncio")
+
+
+class AsyncConnectionPool(object):
+    """
+    Keep-alive connections to single ``host:port`` for one
+    event loop. Number of requests in flight is limited
+    by ``limit``, other requests wait for free slot.
+    """
+
+    def __init__(self, host, port, is_https=False, limit=100):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if is_https else None
+        self.limit = limit
+
+        self._idle = []
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self):
+        """
+        Return tuple ``(reader, writer, reused)``
+        """
+        while self._idle:
+            reader, writer = self._idle.pop()
+
+            if not reader.at_eof():
+                return reader, writer, True
+
+            writer.close()
+
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl)
+
+        return reader, writer, False
+
+    def release(self, reader, writer, reusable=True):
+        if reusable and len(self._idle) < self.limit:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def urlopen(self, method, path, body=None, headers=None):
+        """
+        Perform request and return tuple
+        ``(status, reason, headers, content)``.
+
+        Request is retried over fresh connection only in case
+        reused one was closed by the server while idle, before
+        status line arrived (see :py:func:`arango.clients.pool.is_stale`).
+        """
+        async with self._semaphore:
+            while True:
+                reader, writer, reused = await self.acquire()
+
+                try:
+                    writer.write(self.build_request(
+                        method, path, body, headers))
+                    await writer.drain()
+
+                    line = await reader.readline()
+
+                    if not line:
+                        raise RemoteDisconnected(
+                            "Remote end closed connection without response")
+                except Exception as e:
+                    self.release(reader, writer, reusable=False)
+
+                    if reused and is_stale(e):
+                        logger.debug(
+                            "Stale connection to %s:%s, reconnecting",
+                            self.host, self.port)
+                        continue
+
+                    raise
+
+                try:
+                    status, reason, heads, content, keep_alive = \
+                        await self.read_response(reader, line)
+                except Exception:
+                    self.release(reader, writer, reusable=False)
+                    raise
+
+                self.release(reader, writer, reusable=keep_alive)
+                return status, reason, heads, content
+
+    def build_request(self, method, path, body=None, headers=None):
+        body = body or b""
+        lines = ["{0} {1} HTTP/1.1".format(method, path),
+                 "Host: {0}:{1}".format(self.host, self.port),
+                 "Content-Length: {0}".format(len(body))]
+
+        for name, value in (headers or {}).items():
+            lines.append("{0}: {1}".format(name, value))
+
+        return "\r\n".join(lines).encode("latin-1") + b"\r\n\r\n" + body
+
+    async def read_response(self, reader, line):
+        """
+        Read response which starts with status ``line``
+        """
+        proto, status, reason = (
+            line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+
+            if line in ("\r\n", "\n", ""):
+                break
+
+            name, value = line.split(":", 1)
+            headers[name.strip()] = value.strip()
+
+        lowered = {k.lower(): v for k, v in headers.items()}
+        keep_alive = lowered.get("connection", "").lower() != "close"
+
+        status = int(status)
+
+        if status in (204, 304) or status < 200:
+            # responses without body
+            content = b""
+        elif lowered.get("transfer-encoding", "").lower() == "chunked":
+            content = b""
+
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+
+                if size == 0:
+                    await reader.readline()
+                    break
+
+                content += await reader.readexactly(size)
+                await reader.readline()
+        elif "content-length" in lowered:
+            content = await reader.readexactly(
+                int(lowered["content-length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        return status, reason, headers, content, keep_alive
+
+    def close(self):
+        for reader, writer in self._idle:
+            writer.close()
+
+        self._idle = []
+
+
+class AsyncioClient(RequestsBase):
+    """
+    Non-blocking HTTP client on top of ``asyncio`` streams.
+    All methods are coroutines which return the same
+    responses as other clients.
+    """
+    limit = 100
+
+    # event loop -> {(scheme, host, port): AsyncConnectionPool}
+    _pools = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def config(cls, encoding=None, limit=None):
+        if encoding is not None:
+            cls.encoding = encoding
+
+        if limit is not None:
+            cls.limit = limit
+
+    @classmethod
+    def pool(cls, scheme, host, port):
+        pools = cls._pools.setdefault(asyncio.get_event_loop(), {})
+        key = (scheme, host, port)
+
+        if key not in pools:
+            pools[key] = AsyncConnectionPool(
+                host, port, is_https=(scheme == "https"), limit=cls.limit)
+
+        return pools[key]
+
+    @classmethod
+    async def request(cls, method, url, data=None, headers=None):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+
+        if parts.query:
+            path = "{0}?{1}".format(path, parts.query)
+
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode(cls.encoding)
+
+        pool = cls.pool(
+            parts.scheme, parts.hostname,
+            parts.port or (443 if parts.scheme == "https" else 80))
+
+        status, message, headers, content = await pool.urlopen(
+            method, path, body=data, headers=headers)
+
+        return cls.build_response(status, message, headers, content)
+
+    @classmethod
+    def headers(cls, headers=None):
+        """
+        Default headers of requests with body
+        """
+        result = {"Content-Type": "application/json"}
+        result.update(headers or {})
+
+        return result
+
+    @classmethod
+    async def get(cls, url, headers=None, **kwargs):
+        return await cls.request("GET", url, headers=headers)
+
+    @classmethod
+    async def post(cls, url, data=None, headers=None):
+        return await cls.request(
+            "POST", url, data=data or "",
+            headers=cls.headers(headers))
+
+    @classmethod
+    async def put(cls, url, data=None, headers=None):
+        return await cls.request(
+            "PUT", url, data=data or "",
+            headers=cls.headers(headers))
+
+    @classmethod
+    async def patch(cls, url, data=None, headers=None):
+        return await cls.request(
+            "PATCH", url, data=data or "",
+            headers=cls.headers(headers))
+
+    @classmethod
+    async def delete(cls, url, data=None):
+        return await cls.request("DELETE", url)
@@ -1,24 +1,53 @@
 
-__all__ = ("RequestsBase",)
+__all__ = ("RequestsBase", "ArangoHttpResponse")
+
+
+class ArangoHttpResponse(object):
+    """
+    Compact HTTP response shared by all clients.
+
+    Raw ``bytes`` body available as ``content`` and
+    decoded lazily into ``text`` on first access.
+    """
+    __slots__ = ("status_code", "message", "headers",
+                 "content", "encoding", "_text")
+
+    def __init__(self, status_code, message, headers, body,
+                 encoding="utf-8"):
+        self.status_code = status_code
+        self.message = message
+        self.headers = headers
+        self.encoding = encoding
+
+        # NB: keep raw body to let codecs decode
+        # ``bytes`` directly
+        if isinstance(body, bytes):
+            self.content, self._text = body, None
+        else:
+            self.content, self._text = None, body
+
+    @property
+    def text(self):
+        if self._text is None and self.content is not None:
+            self._text = self.content.decode(self.encoding)
+
+        return self._text
+
+    def __repr__(self):
+        return "<ArangoHttpResponse {0} {1}>".format(
+            self.status_code, self.message)
 
 
 class RequestsBase(object):
     """
     Base class to implement HTTP client
     """
+    encoding = "utf-8"
+
     @classmethod
     def build_response(cls, status, message, headers, body):
-        # NB: py3k
-        if str(type(body)) == "<class 'bytes'>":
-            body = body.decode("utf-8")
-
-        d = {
-            "text": body,
-            "headers": headers,
-            "message": message,
-            "status_code": status}
-
-        return type('ArangoHttpResponse', (object,), d)
+        return ArangoHttpResponse(
+            status, message, headers, body, encoding=cls.encoding)
 
     def get(*args, **kwargs):
         raise NotImplementedError
@@ -29,12 +58,61 @@ class RequestsBase(object):
     def put(*args, **kwargs):
         raise NotImplementedError
 
+    def patch(*args, **kwargs):
+        raise NotImplementedError
+
     def delete(*args, **kwargs):
         raise NotImplementedError
 
-    def multipart(requests):
+    @classmethod
+    def multipart(cls, requests, boundary=None):
         """
         Method to collecto multiple requests and
         send it as a batch using **HttpBatch API**.
+
+        ``requests`` is a list of
+        :py:class:`arango.core.RequestChunk` instances.
+        Return body of the batch request.
+        """
+        boundary = boundary or requests[0].boundary
+
+        return "".join(
+            "--{0}{1}{2}".format(boundary, request.CRLF, request.build())
+            for request in requests) + "--{0}--".format(boundary)
+
+    @classmethod
+    def parse_multipart(cls, content, boundary):
+        """
+        Split response of **HttpBatch API** into parts.
+        Return list of tuples ``(content_id, response)``
         """
-        pass
+        parts = []
+
+        for chunk in content.split("--{0}".format(boundary)):
+            if chunk.startswith("\r\n"):
+                chunk = chunk[2:]
+
+            if not chunk.strip() or chunk.startswith("--"):
+                continue
+
+            part_headers, http = chunk.split("\r\n\r\n", 1)
+            part_headers = cls.parse_headers(part_headers)
+
+            head, body = (http.split("\r\n\r\n", 1) + [""])[:2]
+            status, heads = (head.split("\r\n", 1) + [""])[:2]
+            headers = cls.parse_headers(heads)
+
+            if body.endswith("\r\n"):
+                body = body[:-2]
+
+            proto, status, message = (status.split(" ", 2) + [""])[:3]
+            parts.append((
+                part_headers.get("Content-Id"),
+                cls.build_response(int(status), message, headers, body)))
+
+        return parts
+
+    @classmethod
+    def parse_headers(cls, heads):
+        return dict([[part.strip() for part in h.split(":", 1)]
+                     for h in heads.split("\r\n") if ":" in h])
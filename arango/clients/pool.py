@@ -0,0 +1,263 @@
+import time
+import errno
+import socket
+import logging
+import threading
+
+try:
+    from httplib import HTTPConnection, HTTPSConnection, \
+        BadStatusLine as RemoteDisconnected
+except ImportError:
+    # for Python 3
+    from http.client import HTTPConnection, HTTPSConnection, \
+        RemoteDisconnected
+
+__all__ = ("ConnectionPool", "PoolManager")
+
+logger = logging.getLogger("arango.pool")
+
+# errors of connection which was closed by the server while idle
+STALE_ERRNOS = (errno.EPIPE, errno.ECONNRESET, errno.ECONNABORTED)
+
+
+def is_stale(error):
+    """
+    ``True`` in case ``error`` means that server closed
+    connection before request was received, so it's safe
+    to send request again. Timeouts are never retried.
+    """
+    if isinstance(error, RemoteDisconnected):
+        return True
+
+    return isinstance(error, socket.error) and \
+        not isinstance(error, socket.timeout) and \
+        error.errno in STALE_ERRNOS
+
+
+class ConnectionPool(object):
+    """
+    Bounded pool of persistent (keep-alive) HTTP connections
+    to single ``host:port``.
+
+    - ``maxsize`` - maximum number of idle connections kept in
+      the pool. In case ``block`` is ``True`` it's also maximum number
+      of connections opened at the same time.
+    - ``block`` - wait for released connection instead of opening
+      new one when ``maxsize`` connections already in use
+    - ``idle_timeout`` - seconds after which idle connection
+      will be closed and evicted from the pool
+    - ``timeout`` - socket timeout passed to connection
+    """
+
+    def __init__(self, host, port, is_https=False, maxsize=10,
+                 block=False, idle_timeout=60.0, timeout=None):
+        self.host = host
+        self.port = port
+        self.is_https = is_https
+        self.maxsize = maxsize
+        self.block = block
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        # list of tuples ``(connection, released_at)``,
+        # most recently released connection is the last one
+        self._idle = []
+        self._in_use = 0
+        self._closed = False
+        self._lock = threading.Condition(threading.Lock())
+
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "evicted": 0,
+            "discarded": 0,
+            "waited": 0}
+
+    @property
+    def connection_cls(self):
+        return HTTPSConnection if self.is_https else HTTPConnection
+
+    def _new_connection(self):
+        kwargs = {}
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        self._stats["created"] += 1
+        return self.connection_cls(self.host, self.port, **kwargs)
+
+    def _evict(self, now=None):
+        """
+        Close connections which are idle for more
+        than ``idle_timeout`` seconds. Lock should be acquired.
+        """
+        now = now or time.time()
+        alive = []
+
+        for conn, released in self._idle:
+            if now - released > self.idle_timeout:
+                self._stats["evicted"] += 1
+                conn.close()
+            else:
+                alive.append((conn, released))
+
+        self._idle = alive
+
+    def checkout(self):
+        """
+        Get connection from the pool or open new one.
+        Return tuple ``(connection, reused)``
+        """
+        with self._lock:
+            self._evict()
+
+            while (self.block and not self._idle and
+                   self._in_use >= self.maxsize):
+                self._stats["waited"] += 1
+                self._lock.wait()
+                self._evict()
+
+            self._in_use += 1
+
+            if self._idle:
+                conn, _ = self._idle.pop()
+                self._stats["reused"] += 1
+                return conn, True
+
+            return self._new_connection(), False
+
+    def checkin(self, conn, reusable=True):
+        """
+        Return connection to the pool. Connection will be
+        closed in case it's not ``reusable`` or pool is full.
+        """
+        with self._lock:
+            self._in_use -= 1
+
+            if (reusable and not self._closed and
+                    len(self._idle) < self.maxsize):
+                self._idle.append((conn, time.time()))
+            else:
+                self._stats["discarded"] += 1
+                conn.close()
+
+            self._lock.notify()
+
+    def urlopen(self, method, path, body=None, headers=None):
+        """
+        Perform request over pooled connection and
+        return tuple ``(status, reason, headers, content)``.
+
+        Request is retried over fresh connection in case reused
+        one was closed by the server while idle, before any
+        response arrived (see :py:func:`is_stale`).
+        """
+        headers = headers or {}
+
+        while True:
+            conn, reused = self.checkout()
+
+            try:
+                conn.request(method, path, body, headers)
+                response = conn.getresponse()
+            except Exception as e:
+                self.checkin(conn, reusable=False)
+
+                if reused and is_stale(e):
+                    logger.debug(
+                        "Stale connection to %s:%s, reconnecting",
+                        self.host, self.port)
+                    continue
+
+                raise
+
+            try:
+                content = response.read()
+            except Exception:
+                self.checkin(conn, reusable=False)
+                raise
+
+            self.checkin(conn, reusable=not response.will_close)
+
+            return (response.status, response.reason,
+                    dict(response.getheaders()), content)
+
+    def close(self):
+        """
+        Close all idle connections. Connections which are
+        in use will be closed when released.
+        """
+        with self._lock:
+            self._closed = True
+
+            for conn, _ in self._idle:
+                conn.close()
+
+            self._idle = []
+
+    def stats(self):
+        """
+        Return ``dict`` with current state of the pool
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                "maxsize": self.maxsize,
+                "idle": len(self._idle),
+                "in_use": self._in_use})
+
+        return stats
+
+    def __repr__(self):
+        return "<ConnectionPool {0}:{1} ({2} idle, {3} in use)>".format(
+            self.host, self.port, len(self._idle), self._in_use)
+
+
+class PoolManager(object):
+    """
+    Keep separate :py:class:`ConnectionPool` for every
+    scheme, host and port. Keyword arguments are passed
+    to every new pool.
+    """
+    pool_cls = ConnectionPool
+
+    def __init__(self, **pool_kwargs):
+        self.pool_kwargs = pool_kwargs
+        self.pools = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **pool_kwargs):
+        """
+        Change settings of the pools. Existing pools
+        will be closed to apply new settings.
+        """
+        self.pool_kwargs.update(pool_kwargs)
+        self.clear()
+
+    def pool(self, scheme, host, port):
+        key = (scheme, host, port)
+
+        with self._lock:
+            if key not in self.pools:
+                self.pools[key] = self.pool_cls(
+                    host, port, is_https=(scheme == "https"),
+                    **self.pool_kwargs)
+
+            return self.pools[key]
+
+    def clear(self):
+        with self._lock:
+            pools, self.pools = self.pools, {}
+
+        for pool in pools.values():
+            pool.close()
+
+    def stats(self):
+        """
+        Return stats of all pools as ``dict`` where key
+        is ``host:port`` string
+        """
+        with self._lock:
+            pools = list(self.pools.items())
+
+        return {"{0}:{1}".format(host, port): pool.stats()
+                for (scheme, host, port), pool in pools}
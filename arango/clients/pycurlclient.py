@@ -1,28 +1,57 @@
-try:
-    import StringIO
-except ImportError:
-    # python3
-    from io import StringIO
+import threading
+
+from io import BytesIO
 
 import pycurl
 
 from .base import RequestsBase
 
-__all__ = ("PyCurlClient",)
+__all__ = ("PyCurlClient", "CurlPool")
 
-CONTINUE_HEADER = "HTTP/1.1 100 (Continue)"
+CONTINUE_HEADER = b"HTTP/1.1 100 (Continue)"
 
 
-def performer(func):
+class CurlPool(object):
     """
-    Decorator to simplify work with PyCURL
+    Pool of reusable ``pycurl.Curl`` handles.
+
+    Handles are ``reset()`` before returning to the pool, which
+    clears options but keeps libcurl connection and DNS
+    caches, so next requests to the same host reuse
+    already opened connections.
     """
-    def wrap(cls, *args, **kwargs):
-        client, buf = func(cls, *args, **kwargs)
 
-        return PyCurlClient.build_response(
-            *PyCurlClient.perform(client, buf))
-    return wrap
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+        self._handles = []
+        self._lock = threading.Lock()
+
+    def checkout(self):
+        with self._lock:
+            if self._handles:
+                return self._handles.pop()
+
+        return pycurl.Curl()
+
+    def checkin(self, handle):
+        handle.reset()
+
+        with self._lock:
+            if len(self._handles) < self.maxsize:
+                self._handles.append(handle)
+                return
+
+        handle.close()
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+
+        for handle in handles:
+            handle.close()
+
+    def __len__(self):
+        return len(self._handles)
 
 
 class PyCurlClient(RequestsBase):
@@ -34,10 +63,12 @@ class PyCurlClient(RequestsBase):
 
     encoding = "utf-8"
 
+    handles = CurlPool()
+
     @classmethod
     def client(cls, url):
-        client = pycurl.Curl()
-        buf = StringIO.StringIO()
+        client = cls.handles.checkout()
+        buf = BytesIO()
 
         if cls.DEBUG:
             client.setopt(pycurl.VERBOSE, True)
@@ -52,66 +83,133 @@ class PyCurlClient(RequestsBase):
 
         return client, buf
 
+    @classmethod
+    def prepare(cls, method, url, data=None, headers=None):
+        """
+        Create handle for request with ``method`` to ``url``
+        but not perform it. Return tuple ``(client, buf)``
+        """
+        client, buf = cls.client(url)
+        data = data or b""
+
+        if not isinstance(data, bytes):
+            data = data.encode(cls.encoding)
+
+        if method == "post":
+            client.setopt(pycurl.POST, True)
+            client.setopt(pycurl.POSTFIELDS, data)
+        elif method == "put":
+            client.setopt(pycurl.PUT, True)
+            client.setopt(pycurl.UPLOAD, True)
+            client.setopt(pycurl.READFUNCTION, BytesIO(data).read)
+            client.setopt(pycurl.INFILESIZE, len(data))
+        elif method == "patch":
+            client.setopt(pycurl.CUSTOMREQUEST, "PATCH")
+            client.setopt(pycurl.POSTFIELDS, data)
+        elif method == "delete":
+            client.setopt(pycurl.CUSTOMREQUEST, "DELETE")
+
+        if headers:
+            client.setopt(pycurl.HTTPHEADER, [
+                "{0}: {1}".format(name, value)
+                for name, value in headers.items()])
+
+        return client, buf
+
     @classmethod
     def perform(cls, client, buf):
-        client.perform()
-        client.close()
+        try:
+            client.perform()
+        finally:
+            cls.handles.checkin(client)
 
         return cls.parse_response(buf)
 
+    @classmethod
+    def multi(cls, requests):
+        """
+        Perform many requests concurrently within
+        current thread using ``pycurl.CurlMulti``.
+
+        ``requests`` is a list of tuples ``(method, url)``,
+        ``(method, url, data)`` or ``(method, url, data, headers)``.
+        Return list of responses in the same order as ``requests``.
+        """
+        multi = pycurl.CurlMulti()
+        prepared = [cls.prepare(*request) for request in requests]
+
+        for client, buf in prepared:
+            multi.add_handle(client)
+
+        try:
+            active = len(prepared)
+
+            while active:
+                ret, active = multi.perform()
+
+                if ret == pycurl.E_CALL_MULTI_PERFORM:
+                    continue
+
+                if active:
+                    multi.select(1.0)
+
+            while True:
+                queued, succeed, failed = multi.info_read()
+
+                if failed:
+                    client, errno, message = failed[0]
+                    raise pycurl.error(errno, message)
+
+                if not queued:
+                    break
+        finally:
+            for client, buf in prepared:
+                multi.remove_handle(client)
+                cls.handles.checkin(client)
+
+            multi.close()
+
+        return [cls.build_response(*cls.parse_response(buf))
+                for client, buf in prepared]
+
     @classmethod
     def parse_response(cls, buf):
         response = buf.getvalue()
 
         if CONTINUE_HEADER in response:
-            response = response.split("\r\n\r\n", 1)[-1]
+            response = response.split(b"\r\n\r\n", 1)[-1]
 
-        headers, body = response.split("\r\n\r\n", 1)
-        status, heads = headers.split("\r\n", 1)
+        headers, body = response.split(b"\r\n\r\n", 1)
+        status, heads = headers.decode(cls.encoding).split("\r\n", 1)
 
         # NB: mimetools.Message too slow
-        headers = dict([map(str.strip, h.split(":", 1))
+        headers = dict([[part.strip() for part in h.split(":", 1)]
                         for h in heads.split("\r\n") if h])
 
         proto, status, message = status.split(" ", 2)
         return int(status), message, headers, body
 
     @classmethod
-    @performer
-    def get(cls, url):
-        return cls.client(url)
+    def get(cls, url, headers=None, **kwargs):
+        return cls.build_response(
+            *cls.perform(*cls.prepare("get", url, headers=headers)))
 
     @classmethod
-    @performer
-    def post(cls, url, data=None):
-        client, buf = cls.client(url)
-
-        client.setopt(pycurl.POST, True)
-        data = data or ""
-        client.setopt(pycurl.POSTFIELDS, data.encode(cls.encoding))
-
-        return client, buf
+    def post(cls, url, data=None, headers=None):
+        return cls.build_response(
+            *cls.perform(*cls.prepare("post", url, data, headers)))
 
     @classmethod
-    @performer
     def delete(cls, url, data=None):
-        client, buf = cls.client(url)
-
-        client.setopt(pycurl.CUSTOMREQUEST, 'delete')
-
-        return client, buf
+        return cls.build_response(
+            *cls.perform(*cls.prepare("delete", url, data)))
 
     @classmethod
-    @performer
-    def put(cls, url, data=None):
-        data = data or ""
+    def put(cls, url, data=None, headers=None):
+        return cls.build_response(
+            *cls.perform(*cls.prepare("put", url, data, headers)))
 
-        content = StringIO.StringIO(data.encode(cls.encoding))
-        client, buf = cls.client(url)
-
-        client.setopt(pycurl.PUT, True)
-        client.setopt(pycurl.UPLOAD, True)
-        client.setopt(pycurl.READFUNCTION, content.read)
-        client.setopt(pycurl.INFILESIZE, len(data))
-
-        return client, buf
+    @classmethod
+    def patch(cls, url, data=None, headers=None):
+        return cls.build_response(
+            *cls.perform(*cls.prepare("patch", url, data, headers)))
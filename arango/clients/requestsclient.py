@@ -27,40 +27,53 @@ class RequestsClient(RequestsBase):
         cls._config.update(kwargs)
 
     @classmethod
-    def get(cls, url, **kwargs):
-        r = sess.get(url, **cls._config)
+    def get(cls, url, headers=None, **kwargs):
+        r = sess.get(url, headers=headers, **cls._config)
 
         return cls.build_response(
             r.status_code,
             r.reason,
             r.headers,
-            r.text)
+            r.content)
 
     @classmethod
-    def post(cls, url, data=None):
+    def post(cls, url, data=None, headers=None):
         if data is None:
             data = ""
 
-        r = sess.post(url, data=data, **cls._config)
+        r = sess.post(url, data=data, headers=headers, **cls._config)
 
         return cls.build_response(
             r.status_code,
             r.reason,
             r.headers,
-            r.text)
+            r.content)
 
     @classmethod
-    def put(cls, url, data=None):
+    def put(cls, url, data=None, headers=None):
         if data is None:
             data = ""
 
-        r = sess.put(url, data=data, **cls._config)
+        r = sess.put(url, data=data, headers=headers, **cls._config)
 
         return cls.build_response(
             r.status_code,
             r.reason,
             r.headers,
-            r.text)
+            r.content)
+
+    @classmethod
+    def patch(cls, url, data=None, headers=None):
+        if data is None:
+            data = ""
+
+        r = sess.patch(url, data=data, headers=headers, **cls._config)
+
+        return cls.build_response(
+            r.status_code,
+            r.reason,
+            r.headers,
+            r.content)
 
     @classmethod
     def delete(cls, url, data=None):
@@ -70,4 +83,4 @@ class RequestsClient(RequestsBase):
             r.status_code,
             r.reason,
             r.headers,
-            r.text)
+            r.content)
@@ -1,43 +1,34 @@
 import logging
-import functools
 try:
-    from urllib2 import urlopen, HTTPError, Request
+    from urlparse import urlsplit
 except ImportError:
     # for Python 3
-    from urllib.request import Request, urlopen
-    from urllib.error import HTTPError
+    from urllib.parse import urlsplit
 
 from .base import RequestsBase
+from .pool import PoolManager
 
 __all__ = ("Urllib2Client",)
 
 logger = logging.getLogger("arango.urllib")
 
 
-def safe_request(func):
-    """
-    Handle 404 errors and so on
-    """
-    @functools.wraps(func)
-    def wrap(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except HTTPError as e:
-            content = e.read()
-            e.close()
-            return RequestsBase.build_response(
-                e.code, e.msg, e.headers, content)
-
-    return wrap
-
-
 class Urllib2Client(RequestsBase):
     """
     If no PyCURL bindings available or
     client forced by hands. Quite useful for PyPy.
+
+    Requests are sent over persistent (keep-alive)
+    connections from :py:class:`arango.clients.pool.ConnectionPool`
+    so TCP handshake happens only once per pooled connection.
+    Pools can be tuned via ``config``::
+
+        Urllib2Client.config(maxsize=20, idle_timeout=30)
+
     """
     _config = {}
-    encoding = "utf-8"
+
+    pools = PoolManager()
 
     @classmethod
     def config(cls, encoding=None, **kwargs):
@@ -46,70 +37,78 @@ class Urllib2Client(RequestsBase):
         if encoding is not None:
             cls.encoding = encoding
 
+        if kwargs:
+            cls.pools.configure(**kwargs)
+
+    @classmethod
+    def stats(cls):
+        """
+        Statistics of connection pools, ``dict`` where
+        key is ``host:port`` string
+        """
+        return cls.pools.stats()
+
     @classmethod
-    def parse_response(cls, r, content=None):
-        headers = {}
+    def request(cls, method, url, data=None, headers=None):
+        parts = urlsplit(url)
+        path = parts.path or "/"
 
-        if "dict" in r.headers.__dict__:
-            headers.update(r.headers.__dict__["dict"])
-        else:
-            # Python3
-            headers.update(dict(r.headers.raw_items()))
+        if parts.query:
+            path = "{0}?{1}".format(path, parts.query)
 
-        content = content.decode(cls.encoding)
-        return cls.build_response(r.code, r.msg, headers, content)
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode(cls.encoding)
+
+        pool = cls.pools.pool(
+            parts.scheme, parts.hostname,
+            parts.port or (443 if parts.scheme == "https" else 80))
+
+        status, message, headers, content = pool.urlopen(
+            method, path, body=data, headers=headers)
+
+        return cls.build_response(status, message, headers, content)
+
+    @classmethod
+    def headers(cls, headers=None):
+        """
+        Default headers of requests with body
+        """
+        result = {"Content-Type": "application/json"}
+        result.update(headers or {})
+
+        return result
 
     @classmethod
-    @safe_request
-    def get(cls, url, **kwargs):
-        response = urlopen(url)
-        content = response.read()
-        response.close()
-        return cls.parse_response(response, content=content)
+    def get(cls, url, headers=None, **kwargs):
+        return cls.request("GET", url, headers=headers)
 
     @classmethod
-    @safe_request
-    def post(cls, url, data=None):
+    def post(cls, url, data=None, headers=None):
         if data is None:
             data = ""
 
-        req = Request(url)
-        req.add_header('Content-Type', 'application/json')
-        if hasattr(req, 'add_data'):
-            req.add_data(data.encode(cls.encoding))
-        else:
-            req.data = data.encode(cls.encoding)
-
-        response = urlopen(req, **cls._config)
-        content = response.read()
-        response.close()
-
-        return cls.parse_response(response, content=content)
+        return cls.request(
+            "POST", url, data=data,
+            headers=cls.headers(headers))
 
     @classmethod
-    @safe_request
-    def put(cls, url, data=None):
+    def put(cls, url, data=None, headers=None):
         if data is None:
             data = ""
 
-        req = Request(url)
-        req.add_header('Content-Type', 'application/json')
-        req.add_data(data.encode(cls.encoding))
-        req.get_method = lambda: "put"
-        response = urlopen(req)
+        return cls.request(
+            "PUT", url, data=data,
+            headers=cls.headers(headers))
 
-        content = response.read()
-        response.close()
+    @classmethod
+    def patch(cls, url, data=None, headers=None):
+        if data is None:
+            data = ""
 
-        return cls.parse_response(response, content=content)
+        return cls.request(
+            "PATCH", url, data=data,
+            headers=cls.headers(headers))
 
     @classmethod
-    @safe_request
     def delete(cls, url, data=None):
-        req = Request(url)
-        req.get_method = lambda: "delete"
-        response = urlopen(req)
-        content = response.read()
-        response.close()
-
-        return cls.parse_response(response, content=content)
+        return cls.request("DELETE", url)
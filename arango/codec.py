@@ -0,0 +1,123 @@
+import json as stdlib_json
+
+from .utils import json
+
+__all__ = ("Codec", "JSONCodec", "OrjsonCodec", "get_codec",
+           "default_codec")
+
+
+class Codec(object):
+    """
+    Base class of JSON codecs. Codec should be able
+    to encode data into ``str`` (``dumps``) or ``bytes``
+    (``dumpb``) and decode both ``str`` and ``bytes``
+    (``loads``).
+    """
+    name = None
+    encoding = "utf-8"
+
+    def dumps(self, obj):
+        raise NotImplementedError
+
+    def dumpb(self, obj):
+        return self.dumps(obj).encode(self.encoding)
+
+    def loads(self, data):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return "<{0} codec>".format(self.name)
+
+
+class JSONCodec(Codec):
+    """
+    Codec on top of ``json``-compatible module
+    like ``json``, ``simplejson`` or ``ujson``
+    """
+
+    def __init__(self, module=None, name=None):
+        self.module = module or stdlib_json
+        self.name = name or self.module.__name__
+
+    def dumps(self, obj):
+        return self.module.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, bytes) and not isinstance(data, str):
+            data = data.decode(self.encoding)
+
+        return self.module.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """
+    Codec on top of ``orjson``, which works
+    with ``bytes`` natively
+    """
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self.module = orjson
+
+    def dumps(self, obj):
+        return self.module.dumps(obj).decode(self.encoding)
+
+    def dumpb(self, obj):
+        return self.module.dumps(obj)
+
+    def loads(self, data):
+        return self.module.loads(data)
+
+
+def _module_codec(name):
+    def factory():
+        return JSONCodec(__import__(name), name=name)
+
+    return factory
+
+
+CODECS = {
+    "json": lambda: JSONCodec(stdlib_json, name="json"),
+    "simplejson": _module_codec("simplejson"),
+    "ujson": _module_codec("ujson"),
+    "orjson": OrjsonCodec,
+}
+
+# NB: the same module as ``arango.utils.json``
+default_codec = JSONCodec(json)
+
+
+def get_codec(codec=None):
+    """
+    Get codec instance by:
+
+     - name: ``json``, ``simplejson``, ``ujson`` or ``orjson``
+       (raise ``ImportError`` in case library is not installed)
+     - instance of :py:class:`Codec`
+     - any object with ``dumps`` and ``loads`` methods
+
+    By default ``simplejson`` used if it's installed
+    and ``json`` otherwise.
+    """
+    if codec is None:
+        return default_codec
+
+    if isinstance(codec, Codec):
+        return codec
+
+    if isinstance(codec, type) and issubclass(codec, Codec):
+        return codec()
+
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(
+                "Unknown codec `{0}`. Possible values are: {1}".format(
+                    codec, ", ".join(sorted(CODECS))))
+
+        return CODECS[codec]()
+
+    if hasattr(codec, "dumps") and hasattr(codec, "loads"):
+        return JSONCodec(codec)
+
+    raise ValueError("Codec should provide `dumps` and `loads`")
@@ -1,3 +1,4 @@
+import time
 import logging
 
 from .document import Documents
@@ -17,6 +18,8 @@ class Collections(object):
     COLLECTION_DOCUMENTS, COLLECTION_EDGES = 2, 3
     COLLECTIONS_LIST_URL = "/_api/collection"
 
+    collection_cls = None
+
     def __init__(self, connection):
         self.connection = connection
         self.collections = {}
@@ -53,7 +56,8 @@ class Collections(object):
 
         self.collections[name] = self.collections.get(
             name,
-            Collection(connection=self.connection, name=name))
+            (self.collection_cls or Collection)(
+                connection=self.connection, name=name))
 
         return self.collections.get(name)
 
@@ -106,6 +110,11 @@ class Collection(object):
 
     INFO_ALLOWED_RESOURCES = ["count", "figures"]
 
+    documents_cls = Documents
+
+    # seconds during which result of ``count()`` is cached
+    count_ttl = 0
+
     def __init__(self, connection=None, name=None, id=None,
                  createCollection=True, response=None):
         self.connection = connection
@@ -119,6 +128,7 @@ class Collection(object):
         self._documents = None
         self._edges = None
         self._index = None
+        self._count = None
 
     def __repr__(self):
         return "<Collection '{0}' for {1}>".format(self.name, self.connection)
@@ -170,7 +180,7 @@ class Collection(object):
         Technically return instance of :ref:`documents proxy` object
         """
         if self._documents is None:
-            self._documents = Documents(collection=self)
+            self._documents = self.documents_cls(collection=self)
 
         return self._documents
 
@@ -247,12 +257,34 @@ class Collection(object):
 
         return None
 
-    def count(self):
+    def count(self, ttl=None):
         """
-        Get count of all documents in collection
+        Get count of all documents in collection.
+
+        Count is cached during ``ttl`` seconds (by
+        default ``count_ttl`` of the collection) which
+        is useful for dashboards which poll lengths.
+
+        .. code::
+
+            c.test.count_ttl = 5
+            len(c.test.documents)  # request
+            len(c.test.documents)  # cached
+
         """
+        ttl = self.count_ttl if ttl is None else ttl
+
+        if ttl and self._count is not None:
+            count, fetched_at = self._count
+
+            if time.time() - fetched_at < ttl:
+                return count
+
         response = self.info(resource="count")
-        return response.get("count", 0)
+        count = response.get("count", 0)
+        self._count = count, time.time()
+
+        return count
 
     def __len__(self):
         """
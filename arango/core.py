@@ -1,4 +1,5 @@
 import logging
+import weakref
 
 try:
     from urllib import urlencode
@@ -6,7 +7,10 @@ except ImportError:
     # python3 fix
     from urllib.parse import urlencode
 
-from .utils import json
+from .cache import DocumentCache
+from .codec import get_codec
+from .session import Session
+from .tuning import BatchSizeTuner
 from .clients import Client
 from .cursor import Cursor
 from .db import Database
@@ -40,20 +44,38 @@ class Connection(object):
         "get",
         "put",
         "post",
+        "patch",
         "delete"
     )
 
     def __init__(self, host="localhost",
                  port=8529, is_https=False,
-                 client=None, db=None, **kwargs):
+                 client=None, db=None, codec=None, document_cache=None,
+                 batch_tuner=None, **kwargs):
         """
          - ``client`` - this param provide ability
            to customize HTTP client
+         - ``codec`` - JSON codec to encode requests and
+           decode responses, see :py:func:`arango.codec.get_codec`
+         - ``document_cache`` - ``True`` or instance of
+           :py:class:`arango.cache.DocumentCache` to cache
+           loaded documents
+         - ``batch_tuner`` - instance of
+           :py:class:`arango.tuning.BatchSizeTuner` which choose
+           size of batches for cursors with ``batchSize="auto"``
         """
         self.host = host
         self.port = port
         self.is_https = is_https
         self.client = client or Client
+        self.codec = get_codec(codec)
+        self.document_cache = DocumentCache() \
+            if document_cache is True else document_cache
+        self.identity_map = None
+        self.batch_tuner = batch_tuner or BatchSizeTuner()
+
+        # cursors which hold resources on the server
+        self.cursors = weakref.WeakSet()
         self.additional_args = kwargs
         self._collection = None
         self._database_name = db
@@ -78,6 +100,43 @@ class Connection(object):
             )
         )
 
+    def prepare_request(self, method, path, kwargs):
+        """
+        Build URL and keyword arguments for HTTP client.
+        Return tuple ``(url, kwargs, request_args, expect_raw)``
+
+        To avoid auto JSON encoding of `data` keywords
+        pass `rawData=True` argument
+        """
+        url = "{0}{1}".format(self.url(), path)
+        logger.debug(
+            "'{method}' request to '{url}'".format(
+                method=method,
+                url=url
+            ))
+
+        # Py 2.7 only, yeah!
+        kw = {k: v for k, v in self.additional_args.items()}
+        kw.update(kwargs)
+        ignore_request_args = kw.pop("ignore_request_args", False)
+
+        # NB: don't pass `data` argument in case
+        # it's empty
+        if "data" in kw and kw.get("data") == {}:
+            kw.pop("data")
+
+        expect_raw = kw.pop("_expect_raw", False)
+
+        # Encode automatically data for POST/PUT
+        if ("data" in kw and
+            isinstance(kw.get("data"), (dict, list)) and
+                not kw.pop("rawData", False)):
+            kw["data"] = self.codec.dumps(kw.get("data"))
+
+        return (url, kw,
+                kw if ignore_request_args is False else None,
+                expect_raw)
+
     def requests_factory(self, method="get"):
         """Factory of requests wrapped around HTTP library
         and pass custom arguments provided by init of connection"""
@@ -85,38 +144,12 @@ class Connection(object):
         req = getattr(self.client, method)
 
         def requests_factory_wrapper(path, **kwargs):
-            """To avoid auto JSON encoding of `data` keywords
-            pass `rawData=True` argument
-            """
-            url = "{0}{1}".format(self.url(), path)
-            logger.debug(
-                "'{method}' request to '{url}'".format(
-                    method=method,
-                    url=url
-                ))
-
-            # Py 2.7 only, yeah!
-            kw = {k: v for k, v in self.additional_args}
-            kw.update(kwargs)
-            ignore_request_args = kw.pop("ignore_request_args", False)
-
-            # NB: don't pass `data` argument in case
-            # it's empty
-            if "data" in kw and kw.get("data") == {}:
-                kw.pop("data")
-
-            expect_raw = kw.pop("_expect_raw", False)
-
-            # Encode automatically data for POST/PUT
-            if ("data" in kw and
-                isinstance(kw.get("data"), (dict, list)) and
-                    not kw.pop("rawData", False)):
-                kw["data"] = json.dumps(kw.get("data"))
+            url, kw, args, expect_raw = self.prepare_request(
+                method, path, kwargs)
 
             return Response(
-                url, req(url, **kw),
-                args=kw if ignore_request_args is False else None,
-                expect_raw=expect_raw)
+                url, req(url, **kw), args=args, expect_raw=expect_raw,
+                codec=self.codec)
 
         return requests_factory_wrapper
 
@@ -143,6 +176,19 @@ class Connection(object):
             port=self.port,
             db_prefix=self.database.prefix if db_prefix else "")
 
+    @property
+    def pool_stats(self):
+        """
+        Statistics of connection pool to this server
+        in case HTTP client support pooling,
+        empty ``dict`` otherwise
+        """
+        if not hasattr(self.client, "stats"):
+            return {}
+
+        return self.client.stats().get(
+            "{0}:{1}".format(self.host, self.port), {})
+
     def qs(self, path, **params):
         """Encode params  as GET argumentd and concat it with path"""
         return "{0}?{1}".format(path, urlencode(params))
@@ -174,6 +220,30 @@ class Connection(object):
         """
         return Cursor(self, *args, **kwargs)
 
+    @property
+    def open_cursors(self):
+        """
+        List of cursors which are not exhausted or
+        closed and still hold resources on the server
+        """
+        return [cursor for cursor in list(self.cursors) if cursor.is_open]
+
+    def session(self):
+        """
+        Identity map of documents within ``with`` block,
+        see :py:class:`arango.session.Session`
+        """
+        return Session(self)
+
+    def batch(self, size=None):
+        """
+        Collect requests and send them in one round trip
+        using **HTTP Batch API**. See :py:class:`arango.batch.Batch`
+        """
+        from .batch import Batch
+
+        return Batch(self, size=size)
+
     def __repr__(self):
         return "<Connection to ArangoDB ({0})>".format(self.url())
 
@@ -182,10 +252,17 @@ class Response(dict):
     """
     Representation of HTTP response with
     additional fields to make response more readable.
+
+    Body of the response decoded only once and shared
+    between ``dict`` interface and ``data`` property.
+    In case ``expect_raw`` is ``True`` body is decoded
+    only when ``data`` accessed.
     """
-    def __init__(self, url, response, args=None, expect_raw=False):
+    def __init__(self, url, response, args=None, expect_raw=False,
+                 codec=None):
         self.url = url
         self.response = response
+        self.codec = codec or get_codec()
         self.status = response.status_code
         self.args = args or {}
         self.message = ""
@@ -193,9 +270,10 @@ class Response(dict):
 
         try:
             if expect_raw is False:
-                self.update({k: v
-                             for k, v in
-                             json.loads(response.text).items()})
+                self._data = self.decode()
+
+                if isinstance(self._data, dict):
+                    self.update(self._data)
 
         except (TypeError, ValueError) as e:
             msg = u"Can't parse response from ArangoDB:"\
@@ -210,12 +288,36 @@ class Response(dict):
     def data(self):
         if self._data is None:
             try:
-                self._data = json.loads(self.response.text)
+                self._data = self.decode()
             except TypeError:
                 self._data = {}
 
         return self._data
 
+    def decode(self):
+        """
+        Decode body of the response, raw ``bytes``
+        are passed to codec as is
+        """
+        content = getattr(self.response, "content", None)
+
+        if isinstance(content, bytes):
+            return self.codec.loads(content)
+
+        return self.codec.loads(self.response.text)
+
+    @property
+    def size(self):
+        """
+        Size of the body of the response
+        """
+        content = getattr(self.response, "content", None)
+
+        if isinstance(content, bytes):
+            return len(content)
+
+        return len(self.response.text or "")
+
     @property
     def is_error(self):
         if self.status not in [200, 201]:
@@ -228,12 +330,24 @@ class Response(dict):
 
 
 class Resultset(object):
+    """
+    Lazy set of results of the ``base`` (like
+    :py:class:`arango.document.Documents`). ``first``,
+    ``last`` and ``len()`` are resolved by separate small
+    requests and cached until window of the
+    resultset (``limit``, ``offset``, ``order_by``) changed.
+    """
+
     def __init__(self, base, *args, **kwargs):
         self._args = args
         self._kwargs = kwargs
 
         self._limit = None
         self._offset = 0
+        self._order = ()
+        self._after = None
+        self._raw = False
+        self._fields = None
 
         self.base = base
         self.results = []
@@ -243,6 +357,7 @@ class Resultset(object):
         self._response = None
         self._count = None
         self._data = None
+        self._cache = {}
 
     @property
     def response(self):
@@ -258,6 +373,10 @@ class Resultset(object):
             self.base.prepare_resultset(
                 self, args=self._args, kwargs=self._kwargs)
 
+    def _reset(self):
+        self._count = None
+        self._cache = {}
+
     @property
     def count(self):
         return len(self)
@@ -276,33 +395,204 @@ class Resultset(object):
 
     def limit(self, limit=0):
         self._limit = limit
+        self._reset()
         return self
 
     def offset(self, offset=0):
         self._offset = offset
+        self._reset()
         return self
 
+    def order_by(self, *fields):
+        """
+        Sort results by ``fields``, field name
+        prefixed by ``-`` means descending order
+
+        .. code::
+
+            c.test.documents().order_by("-age", "name").first
+
+        """
+        self._order = fields
+        self._reset()
+        return self
+
+    def raw(self, *fields):
+        """
+        Yield decoded values instead of documents,
+        or tuples of ``fields`` values if specified
+        """
+        self._raw = True
+        self._fields = fields or None
+        self._reset()
+        return self
+
+    def after(self, value, field="_key"):
+        """
+        Keyset pagination: only results where ``field``
+        (``_key`` or indexed attribute) is greater than
+        ``value``, ordered by ``field``. Unlike ``offset``
+        server doesn't skip previous documents.
+
+        .. code::
+
+            page = c.test.documents().after(last_key)[:100]
+
+        """
+        self._after = field, value
+        self._order_by_field(field)
+        self._reset()
+        return self
+
+    def _order_by_field(self, field):
+        """
+        Sort results by ``field`` first in case
+        they are not sorted by it yet
+        """
+        if not any(f.lstrip("-") == field for f in self._order):
+            self._order = (field,) + tuple(self._order)
+
+    def pages(self, size, field="_key"):
+        """
+        Iterate over resultset by pages (lists) of ``size``
+        items using keyset pagination by ``field``. Window
+        of the resultset (``offset`` and ``limit``) is applied
+        to all pages together.
+        """
+        if self._raw and self._fields and field not in self._fields:
+            raise ValueError(
+                "Field `{0}` should be one of fields of "
+                "the resultset".format(field))
+
+        remaining = self._limit
+        rs = self.clone()
+        rs._order_by_field(field)
+
+        while remaining is None or remaining > 0:
+            count = size if remaining is None else min(size, remaining)
+
+            # NB: ``iter`` to avoid ``len()`` call within ``list``
+            page = list(iter(rs[:count]))
+
+            if page:
+                yield page
+
+            if len(page) < count:
+                break
+
+            if remaining is not None:
+                remaining -= len(page)
+
+            # next pages start after the last item,
+            # without offset of the resultset
+            rs = self.clone()
+            rs._limit = None
+            rs._offset = 0
+            rs.after(self._field_value(page[-1], field), field)
+
+    def _field_value(self, item, field):
+        if self._fields:
+            return item[self._fields.index(field)]
+
+        return item.get(field)
+
+    def clone(self):
+        rs = self.__class__(self.base, *self._args, **self._kwargs)
+        rs._limit = self._limit
+        rs._offset = self._offset
+        rs._order = self._order
+        rs._after = self._after
+        rs._raw = self._raw
+        rs._fields = self._fields
+        rs.max_repr_items = self.max_repr_items
+        return rs
+
+    def __getitem__(self, index):
+        """
+        Get single item by index or ``Resultset``
+        for part of results by slice
+        """
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        if index < 0:
+            index += len(self)
+
+        items = self._fetch(index, 1) if index >= 0 else []
+
+        if not items:
+            raise IndexError("Resultset index out of range")
+
+        return items[0]
+
+    def _slice(self, index):
+        start, stop, step = index.start or 0, index.stop, index.step
+
+        if start < 0 or (stop is not None and stop < 0):
+            start, stop, step = index.indices(len(self))
+
+        window = self._limit
+
+        if stop is None:
+            stop = window if window else len(self)
+        elif window:
+            stop = min(stop, window)
+
+        if stop <= start:
+            return []
+
+        rs = self.clone()
+        rs._offset = (self._offset or 0) + start
+        rs._limit = stop - start
+
+        if step not in (None, 1):
+            return list(rs)[::step]
+
+        return rs
+
+    def _fetch(self, offset, count, reverse=False):
+        """
+        Get ``count`` items starting from ``offset``
+        within the resultset by single request
+        """
+        return list(self.base.fetch(self, offset, count, reverse=reverse))
+
     @property
     def first(self):
         """Return only first element from response"""
-        self.limit(1)
-        try:
-            return list(self)[0]
-        except IndexError:
-            return None
+        if "first" not in self._cache:
+            items = self._fetch(0, 1)
+            self._cache["first"] = items[0] if items else None
+
+        return self._cache["first"]
 
     @property
     def last(self):
-        """Return last element from response"""
-        total = len(self.base._cursor(self))
-        try:
-            return list(self.limit(1).offset(total - 1))[0]
-        except IndexError:
-            return None
+        """
+        Return last element from response. Single query
+        with reversed order in case resultset is ordered
+        and has no window, otherwise count of results is
+        requested and last element is fetched with
+        ``LIMIT n - 1, 1``, which is ``O(n)`` on the server.
+        """
+        if "last" in self._cache:
+            return self._cache["last"]
+
+        # NB: with order and without window last element
+        # is first one in reversed order
+        if self._order and not self._limit and not self._offset and \
+                not self._after:
+            items = self._fetch(0, 1, reverse=True)
+        else:
+            total = len(self)
+            items = self._fetch(total - 1, 1) if total else []
+
+        self._cache["last"] = items[0] if items else None
+        return self._cache["last"]
 
     def __len__(self):
         if self._count is None:
-            self._count = len(self.base._cursor(self))
+            self._count = self.base.resultset_length(self)
 
         return self._count
 
@@ -313,7 +603,7 @@ class Resultset(object):
     def __repr__(self):
         suff = ""
         items = []
-        for i, item in enumerate(self):
+        for i, item in enumerate(self._fetch(0, self.max_repr_items + 2)):
             if i > self.max_repr_items:
                 suff = "... more"
                 break
@@ -336,20 +626,21 @@ class RequestChunk(object):
     part_num = 1
     method = "GET"
 
-    def __init__(self, url, body, method=None, headers=None,
+    def __init__(self, url, body=None, method=None, headers=None,
                  boundary=None, part_num=1):
         self.part_num = part_num
-        self.headers = headers or self.headers
+        self.headers = list(headers or self.headers)
         self.boundary = boundary or self.boundary
         self.url = url
         self.method = method or self.method
+        self.body = body or ""
 
     def build(self):
-        self.headers.append(
+        headers = self.headers + [
             ("Content-Type", "application/x-arango-batchpart"),
-            ("Content-Id", self.part_num))
+            ("Content-Id", self.part_num)]
         headers = self.CRLF.join("{0}: {1}".format(name, value)
-                                 for name, value in self.headers)
+                                 for name, value in headers)
 
         request = "{headers}{crlf}{crlf}"\
                   "{method} {url} HTTP/1.1{crlf}{crlf}{body}{crlf}"
@@ -358,5 +649,5 @@ class RequestChunk(object):
             crlf=self.CRLF,
             headers=headers,
             url=self.url,
-            method=self.method,
-            body=self.body)  # TODO: encode it
+            method=self.method.upper(),
+            body=self.body)
@@ -1,4 +1,14 @@
+import time
 import logging
+import threading
+
+from collections import deque
+
+try:
+    from Queue import Queue, Full
+except ImportError:
+    # for Python 3
+    from queue import Queue, Full
 
 from .document import Document
 from .exceptions import AqlQueryError
@@ -26,31 +36,79 @@ class Cursor(object):
             result set (optional). Calculating the
             "count" attribute might have a performance
             penalty for some queries so this option
-            is turned off by default.
+            is turned off by default. Without it
+            ``len(cursor)`` is known only for exhausted
+            cursors, see :py:meth:`count_query`.
 
     - ``batchSize`` - maximum number of result documents to be
                 transferred from the server to the client in
                 one roundtrip (optional).
                 If this attribute is not set, a server-controlled
-                default value will be used.
+                default value will be used. With ``"auto"`` size
+                is chosen by ``connection.batch_tuner``
+                (see :py:class:`arango.tuning.BatchSizeTuner`).
     - ``bindVars`` - key/value list of bind parameters (optional).
-    - ``wrapper`` - by default it's ``Document.load``
-              class, wrap result into
+    - ``wrapper`` - by default it's ``Document.hydrate``
+              which wrap documents from result into
+              ``Document`` without additional requests
+    - ``prefetch`` - number of next batches fetched in background
+              thread while current batch is consumed (optional).
+              By default batches are fetched only when
+              current batch is exhausted.
+    - ``raw`` - yield decoded values as is, without
+              ``wrapper`` (optional).
+    - ``fields`` - names of fields to yield as ``tuple``
+              instead of whole row, implies ``raw`` (optional).
+    - ``ttl`` - seconds after which server delete cursor
+              if it's not used (optional).
+    - ``stream`` - execute query lazily on the server, so
+              results are not materialized at once (optional).
+    - ``options`` - dict with other server options of the
+              query, e.g. ``fullCount`` or ``maxRuntime`` (optional).
+
+    Cursor which is not exhausted should be closed to free
+    resources on the server:
+
+    .. code::
+
+        with c.query("FOR d IN test RETURN d") as cursor:
+            for doc in cursor:
+                if doc.body["x"] == 1:
+                    break
+
     """
     CREATE_CURSOR_PATH = "/_api/cursor"
     DELETE_CURSOR_PATH = "/_api/cursor/{0}"
     READ_NEXT_BATCH_PATH = "/_api/cursor/{0}"
+    LENGTH_QUERY = "RETURN LENGTH({0})"
+    BATCHES_HISTORY = 100
 
     def __init__(self, connection, query,
-                 count=True, batchSize=None, bindVars=None,
-                 wrapper=Document.load):
+                 count=False, batchSize=None, bindVars=None,
+                 wrapper=Document.hydrate, prefetch=0, raw=False, fields=None,
+                 ttl=None, stream=False, options=None):
         self.connection = connection
         self.query = query
 
         # boolean flag: show count in results or not
         self.count = count
         self.wrapper = wrapper
+        self.fields = tuple(fields) if fields else None
+        self.raw = raw or self.fields is not None
+        self.tuner = None
+
+        if batchSize == "auto":
+            self.tuner = getattr(connection, "batch_tuner", None)
+            batchSize = self.tuner.size(query) \
+                if self.tuner is not None else None
+
         self.batchSize = batchSize
+        self.ttl = ttl
+        self.options = dict(options or {})
+
+        if stream:
+            self.options["stream"] = True
+
         self.bindVars = bindVars if \
             isinstance(bindVars, dict) else {}
 
@@ -65,10 +123,22 @@ class Cursor(object):
         self._has_more = True
 
         # data from current batch
-        self._dataset = []
+        self._dataset = deque()
+
+        # total count of results, ``None`` until known
+        self._count = None
 
-        # total count of results, extracted from Database
-        self._count = 0
+        # number of batches to fetch in background
+        self.prefetch = prefetch
+        self._prefetched = None
+        self._prefetch_stop = None
+
+        self._closed = False
+
+        # (rows, bytes, seconds) of last fetched batches
+        # and totals of all batches
+        self.batches = deque(maxlen=self.BATCHES_HISTORY)
+        self.totals = {"batches": 0, "rows": 0, "bytes": 0, "elapsed": 0.0}
 
     def bind(self, bind_vars):
         """
@@ -78,7 +148,13 @@ class Cursor(object):
         return self
 
     def __iter__(self):
-        return self
+        # NB: separate iterator without ``__len__``, so
+        # ``list(iter(cursor))`` doesn't count results
+        while True:
+            try:
+                yield self.next()
+            except StopIteration:
+                return
 
     @property
     def first(self):
@@ -89,7 +165,7 @@ class Cursor(object):
             self.bulk()
 
         try:
-            return self.wrapper(self.connection, self._dataset[0])
+            return self.convert(self._dataset[0])
         except IndexError:
             return None
 
@@ -103,7 +179,7 @@ class Cursor(object):
             self.bulk()
 
         try:
-            return self.wrapper(self.connection, self._dataset[-1])
+            return self.convert(self._dataset[-1])
         except IndexError:
             return None
 
@@ -111,53 +187,325 @@ class Cursor(object):
         """
         Iterator though resultset (lazy)
         """
+        while True:
+            try:
+                item = self._dataset.popleft()
+            except IndexError:
+                if not self._has_more:
+                    raise StopIteration
 
-        self._position += 1
-
-        try:
-            item = self._dataset.pop(0)
-            return self.wrapper(self.connection, item)
-        except IndexError:
-            if self._has_more:
                 self.bulk()
-                return self.next()
+                continue
+
+            self._position += 1
 
-        raise StopIteration
+            if self.raw:
+                return item if self.fields is None else self.pick(item)
+
+            return self.wrapper(self.connection, item)
 
     __next__ = next
 
+    def convert(self, item):
+        """
+        Convert single row from the batch into result
+        """
+        if not self.raw:
+            return self.wrapper(self.connection, item)
+
+        if self.fields is None:
+            return item
+
+        return self.pick(item)
+
+    def pick(self, item):
+        """
+        Get tuple of ``fields`` values from the row
+        """
+        if not isinstance(item, dict):
+            return (item,)
+
+        return tuple(item.get(name) for name in self.fields)
+
     def bulk(self):
         """
         Getting initial or next bulk of results from Database
         """
 
-        if not self._cursor_id:
-            response = self.connection.post(self.CREATE_CURSOR_PATH, data={
-                "query": self.query,
-                "count": self.count,
-                "batchSize": self.batchSize,
-                "bindVars": self.bindVars})
+        if self._closed:
+            raise AqlQueryError("Cursor is closed")
 
-            self._cursor_id = response.get("id", None)
+        if self._prefetched is not None:
+            response, error, elapsed = self._prefetched.get()
+
+            if error is not None:
+                raise error
+
+            self.parse_bulk(response)
+            self.observe(response, elapsed)
+            return
+
+        started = time.time()
+
+        if not self._cursor_id:
+            response = self.connection.post(
+                self.CREATE_CURSOR_PATH, data=self.params)
         else:
             response = self.connection.put(
                 self.READ_NEXT_BATCH_PATH.format(self._cursor_id))
 
+        self.parse_bulk(response)
+        self.observe(response, time.time() - started)
+
+        if self.prefetch and self._has_more:
+            self._start_prefetch()
+
+    def _start_prefetch(self):
+        """
+        Start background thread which read next batches
+        into queue bounded by ``prefetch`` batches
+        """
+        self._prefetched = Queue(maxsize=self.prefetch)
+        self._prefetch_stop = threading.Event()
+
+        thread = threading.Thread(
+            target=self._prefetch_worker,
+            args=(self.connection,
+                  self.READ_NEXT_BATCH_PATH.format(self._cursor_id),
+                  self._prefetched, self._prefetch_stop))
+        thread.daemon = True
+        thread.start()
+
+    @staticmethod
+    def _prefetch_worker(connection, path, queue, stop):
+        has_more = True
+
+        while has_more and not stop.is_set():
+            started = time.time()
+
+            try:
+                response = connection.put(path)
+                has_more = response.status in [200, 201] and \
+                    response.get("hasMore", False)
+                item = response, None, time.time() - started
+            except Exception as e:
+                logger.error("Can't prefetch batch from %s", path,
+                             exc_info=True)
+                has_more = False
+                item = None, e, None
+
+            # NB: don't block forever in case cursor abandoned
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    break
+                except Full:
+                    continue
+
+    def _stop_prefetch(self):
+        if self._prefetch_stop is not None:
+            self._prefetch_stop.set()
+
+    @property
+    def params(self):
+        """
+        Body of the request to create cursor
+        """
+        params = {
+            "query": self.query,
+            "count": self.count,
+            "batchSize": self.batchSize,
+            "bindVars": self.bindVars}
+
+        if self.ttl is not None:
+            params["ttl"] = self.ttl
+
+        if self.options:
+            params["options"] = self.options
+
+        return params
+
+    @property
+    def length_params(self):
+        """
+        Body of the request to count results of the query
+        """
+        return {
+            "query": self.LENGTH_QUERY.format(self.query),
+            "bindVars": self.bindVars}
+
+    def parse_length(self, response):
+        """
+        Get count of results from ``response``
+        to the query built with ``length_params``
+        """
         if response.status not in [200, 201]:
             raise AqlQueryError(
                 response.data.get("errorMessage", "Unknown error"),
                 num=response.data.get("errorNum", -1),
                 code=response.status)
 
+        result = response.get("result", None) or [0]
+        return int(result[0])
+
+    def parse_bulk(self, response):
+        """
+        Update state of the cursor from ``response``
+        with initial or next bulk of results
+        """
+        if response.status not in [200, 201]:
+            raise AqlQueryError(
+                response.data.get("errorMessage", "Unknown error"),
+                num=response.data.get("errorNum", -1),
+                code=response.status)
+
+        if not self._cursor_id:
+            self._cursor_id = response.get("id", None)
+
         self._has_more = response.get("hasMore", False)
-        self._count = int(response.get("count", 0))
-        self._dataset = response["result"] if "result" in response else []
+        self._dataset = deque(response.get("result", None) or [])
+
+        count = response.get("count", None)
+
+        if count is not None:
+            self._count = int(count)
+        elif not self._has_more:
+            # all batches are fetched
+            self._count = self._position + len(self._dataset)
+
+        # NB: server delete exhausted cursors automatically
+        registry = getattr(self.connection, "cursors", None)
+
+        if registry is not None:
+            if self._has_more:
+                registry.add(self)
+            else:
+                registry.discard(self)
+
+    def observe(self, response, elapsed):
+        """
+        Record batch which is just parsed from ``response``
+        and tune ``batchSize`` of next cursors for the query
+        """
+        rows = len(self._dataset)
+        size_bytes = response.size
+
+        self.batches.append((rows, size_bytes, elapsed))
+        self.totals["batches"] += 1
+        self.totals["rows"] += rows
+        self.totals["bytes"] += size_bytes
+        self.totals["elapsed"] += elapsed or 0.0
+
+        if self.tuner is None:
+            return
+
+        # NB: size chosen by the server is seen from full batches
+        size = self.batchSize or (rows if self._has_more else None)
+
+        if size:
+            self.tuner.observe(self.query, size, rows, size_bytes, elapsed)
+
+    @property
+    def is_open(self):
+        """
+        ``True`` in case cursor still hold resources
+        on the server
+        """
+        return bool(self._cursor_id and self._has_more and not self._closed)
+
+    def close(self):
+        """
+        Delete cursor on the server in case it's not
+        exhausted yet. Cursor can't be used after that.
+        """
+        is_open = self.is_open
+
+        self._stop_prefetch()
+        self._closed = True
+        self._has_more = False
+        self._dataset = deque()
+
+        registry = getattr(self.connection, "cursors", None)
+        if registry is not None:
+            registry.discard(self)
+
+        if not is_open:
+            return False
+
+        try:
+            response = self.connection.delete(
+                self.DELETE_CURSOR_PATH.format(self._cursor_id))
+        except Exception:
+            logger.warning("Can't delete cursor %s", self._cursor_id,
+                           exc_info=True)
+            return False
+
+        return response.status == 202
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # best effort: cursor may be collected
+        # during interpreter shutdown
+        try:
+            if self.is_open:
+                self.close()
+        except Exception:
+            pass
+
+    @property
+    def started(self):
+        """
+        ``True`` in case first batch is fetched
+        """
+        return bool(self._cursor_id) or not self._has_more
+
+    def count_query(self):
+        """
+        Get total count of results by separate
+        ``RETURN LENGTH(...)`` query in case it's not known yet.
+
+        .. note:: query is executed once again, so
+                  it shouldn't modify data
+        """
+        if self._count is None:
+            self._count = self.parse_length(self.connection.post(
+                self.CREATE_CURSOR_PATH, data=self.length_params))
+
+        return self._count
 
     def __len__(self):
-        if not self._cursor_id:
+        """
+        Total count of results. Known in case cursor created
+        with ``count=True`` or all batches are fetched,
+        otherwise ``TypeError`` raised (so ``list(cursor)``
+        works without count), use :py:meth:`count_query`.
+        """
+        if self._count is None and not self.started:
             self.bulk()
 
+        if self._count is None:
+            raise TypeError(
+                "Count of results is unknown, create cursor "
+                "with `count=True` or use `count_query()`")
+
         return self._count
 
+    def __bool__(self):
+        if self._count is None and not self.started:
+            self.bulk()
+
+        if self._count is None:
+            # there are more batches
+            return True
+
+        return self._count > 0
+
+    __nonzero__ = __bool__
+
     def __repr__(self):
         return "<ArangoDB Cursor Object: {0}>".format(self.query)
@@ -1,7 +1,6 @@
 import logging
 
 from .exceptions import DatabaseAlreadyExist, DatabaseSystemError
-from .utils import json
 
 __all__ = ("Cursor",)
 
@@ -31,7 +30,7 @@ class Database(object):
         """
 
         response = self.connection.client.post(
-            self.url(self.NO_DATABASE_PATH), data=json.dumps({
+            self.url(self.NO_DATABASE_PATH), data=self.connection.codec.dumps({
                 "name": self.name}))
 
         # update revision of the document
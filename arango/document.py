@@ -1,17 +1,88 @@
+import copy
 import logging
+import threading
+
+from itertools import chain
 
 from .mixins import ComparsionMixin, LazyLoadMixin
 from .exceptions import DocumentAlreadyCreated, \
     DocumentIncompatibleDataType, DocumentNotFound, \
-    DocuemntUpdateError
-from .utils import proxied_document_ref, parse_meta
-from .utils import json
+    DocuemntUpdateError, AqlQueryError
+from .utils import proxied_document_ref, parse_meta, chunks, \
+    parallel_map, parallel_each
 
-__all__ = ("Documents", "Document",)
+__all__ = ("Documents", "Document", "DocumentList", "BulkResult",
+           "OperationResult")
 
 logger = logging.getLogger(__name__)
 
 
+class DocumentList(list):
+    """
+    List of documents loaded by
+    :py:meth:`Documents.load_many`. ``missing`` contains
+    references to documents which are not found.
+    """
+
+    def __init__(self, items=(), missing=None):
+        super(DocumentList, self).__init__(items)
+        self.missing = missing or []
+
+
+class BulkResult(dict):
+    """
+    Result of :py:meth:`Documents.create_bulk`: counters
+    (``created``, ``errors``, ``empty``, ...) summed
+    across all chunks.
+
+     - ``chunks`` - number of sent chunks
+     - ``failures`` - list of ``(offset, size, response_or_exception)``
+       of chunks which were not imported
+    """
+    COUNTERS = ("created", "errors", "empty", "updated", "ignored")
+
+    def __init__(self):
+        super(BulkResult, self).__init__(
+            created=0, errors=0, empty=0, error=False)
+        self.chunks = 0
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def add(self, offset, size, response):
+        with self._lock:
+            self.chunks += 1
+
+            if isinstance(response, Exception) or response.status != 201:
+                self.failures.append((offset, size, response))
+                self["error"] = True
+                return
+
+            for name in self.COUNTERS:
+                if name in response.data:
+                    self[name] = self.get(name, 0) + response.data[name]
+
+            self["error"] = (
+                self["error"] or bool(response.data.get("error")))
+
+
+class OperationResult(dict):
+    """
+    Result of :py:meth:`Documents.update_many`,
+    :py:meth:`Documents.replace_many` and
+    :py:meth:`Documents.delete_many`: ``key -> revision``
+    of processed documents. ``errors`` contains
+    ``key -> error message`` of documents which
+    were not processed. Errors of single documents
+    are ignored by the server (``ignoreErrors``), so
+    reason (missing document, conflict, constraint
+    violation) is not known for them.
+    """
+
+    def __init__(self):
+        super(OperationResult, self).__init__()
+        self.errors = {}
+
+
 class Documents(object):
     """Proxy object to handle work with
     documents within collection instance
@@ -19,6 +90,22 @@ class Documents(object):
 
     DOCUMENTS_PATH = "/_api/document?collection={0}"
     BULK_INSERT_PATH = "/_api/import"
+    LOAD_MANY_QUERY = "FOR id IN @ids RETURN DOCUMENT(@@collection, id)"
+    UPDATE_MANY_QUERY = (
+        "FOR item IN @items {operation} item.key WITH item.body "
+        "IN @@collection OPTIONS {options} "
+        "RETURN {{key: NEW._key, rev: NEW._rev}}")
+    DELETE_MANY_QUERY = (
+        "FOR key IN @keys REMOVE key IN @@collection OPTIONS {options} "
+        "RETURN {{key: OLD._key, rev: OLD._rev}}")
+
+    # NB: AQL doesn't allow offset without count
+    MAX_COUNT = 2 ** 53
+
+    document_cls = None
+    # ``batchSize`` of cursors which iterate ``Resultset``,
+    # ``"auto"`` to choose it by ``connection.batch_tuner``
+    batch_size = None
 
     def __init__(self, collection=None):
         self.connection = collection.connection
@@ -39,31 +126,100 @@ class Documents(object):
     def count(self):
         """
         Get count of all documents in :ref:`collection`
+        (see :py:meth:`arango.collection.Collection.count`)
         """
+        return self.collection.count()
 
-        cursor = self.connection.query(
-            "FOR d IN {} RETURN d".format(
-                self.collection.cid),
-            count=True)
-        return len(cursor)
+    def resultset_length(self, rs):
+        """
+        Number of documents in ``Resultset``
+        calculated from count of documents in collection
+        """
+        if rs._after is not None:
+            query, bind_vars = self._query(rs, result="1")
+
+            count = self.connection.query(
+                "RETURN LENGTH({0})".format(query), bindVars=bind_vars,
+                raw=True).first or 0
+        else:
+            count = self.collection.count()
+
+        count = max(count - (rs._offset or 0), 0)
+
+        if rs._limit:
+            count = min(count, rs._limit)
+
+        return count
 
     def _cursor(self, rs):
+        if rs._limit or rs._offset:
+            query, bind_vars = self._query(
+                rs, offset=rs._offset, count=rs._limit or self.MAX_COUNT)
+        else:
+            query, bind_vars = self._query(rs)
+
         return self.connection.query(
-            "FOR d IN {} {} RETURN d".format(
-                self.collection.cid, self._limits(rs)),
-            count=True)
+            query, bindVars=bind_vars, batchSize=self.batch_size,
+            raw=rs._raw, fields=rs._fields)
 
-    def _limits(self, rs):
-        limit = ""
+    def _query(self, rs, offset=None, count=None, reverse=False,
+               result="d"):
+        """
+        Build AQL query and bind variables for ``Resultset``.
+        Limits passed as bind variables to reuse the same
+        query (and plan) for all pages.
+        """
+        bind_vars = {"@collection": self.collection.cid}
+        sort = []
+        conditions = []
+
+        if rs._after is not None:
+            field, value = rs._after
+            desc = any(f == "-" + field for f in rs._order)
+
+            conditions.append("FILTER d[@after_field] {0} @after".format(
+                "<" if desc else ">"))
+            bind_vars.update({"after_field": field, "after": value})
+
+        for n, field in enumerate(rs._order):
+            desc = field.startswith("-")
+            bind_vars["sort_{0}".format(n)] = field.lstrip("-")
+            sort.append("d[@sort_{0}] {1}".format(
+                n, "DESC" if desc != reverse else "ASC"))
+
+        query = "FOR d IN @@collection"
+
+        if conditions:
+            query += " " + " ".join(conditions)
+
+        if sort:
+            query += " SORT {0}".format(", ".join(sort))
+
+        if count is not None:
+            query += " LIMIT @offset, @count"
+            bind_vars.update({"offset": offset or 0, "count": count})
+
+        return "{0} RETURN {1}".format(query, result), bind_vars
+
+    def fetch(self, rs, offset, count, reverse=False):
+        """
+        Get ``count`` documents from ``offset`` within
+        ``Resultset`` by single query
+        """
+        start = rs._offset or 0
 
         if rs._limit:
-            limit = "LIMIT {}".format(rs._limit)
+            count = min(count, rs._limit - offset)
+
+        if count <= 0 or offset < 0:
+            return []
 
-            if rs._offset:
-                limit = "LIMIT {}, {}".format(
-                    rs._offset, rs._limit)
+        query, bind_vars = self._query(
+            rs, offset=start + offset, count=count, reverse=reverse)
 
-        return limit
+        return list(iter(self.connection.query(
+            query, bindVars=bind_vars, batchSize=count,
+            raw=rs._raw, fields=rs._fields)))
 
     def iterate(self, rs):
         """This method will be called within Resultset so
@@ -76,15 +232,24 @@ class Documents(object):
         """
         Shortcut for new documents creation
         """
-        doc = Document(
+        doc = (self.document_cls or Document)(
             collection=self.collection,
             connection=self.connection)
         return doc.create(*args, **kwargs)
 
-    def create_bulk(self, docs, batch=100):
+    def create_bulk(self, docs, batch=100, workers=1, max_bytes=None):
         """
         Insert bulk of documents using **HTTP Interface for bulk imports**.
 
+        ``docs`` may be any iterable (like generator) of documents,
+        path to NDJSON file or file object with one JSON document
+        per line. Documents are streamed by chunks of ``batch``
+        documents and at most ``max_bytes`` bytes per request,
+        chunks may be sent in parallel by ``workers`` threads.
+        Return :py:class:`BulkResult` with counters summed across
+        chunks (failed chunks listed in ``failures`` and ``error``
+        is set) or ``False`` in case there are no documents.
+
         .. testcode::
 
             docs = [
@@ -118,28 +283,126 @@ class Documents(object):
 
         """
 
+        request = self._bulk_request(docs, batch, max_bytes)
+
         # if no documents provided
-        if not docs:
+        if request is None:
             return False
 
+        path, header, parts = request
+        result = BulkResult()
+
+        def send(chunk):
+            offset, chunk = chunk
+
+            try:
+                response = self.connection.post(
+                    path, data=b"\n".join(header + chunk),
+                    ignore_request_args=True)
+            except Exception as e:
+                logger.error("Can't import chunk of %s documents",
+                             len(chunk), exc_info=True)
+                response = e
+
+            result.add(offset, len(chunk), response)
+
+        parallel_each(send, parts, workers)
+
+        return result
+
+    def _bulk_request(self, docs, batch, max_bytes):
+        """
+        Return path of the import, header line (for
+        **Headers and values import**) and chunks of
+        ``docs`` or ``None`` in case there are no documents
+        """
+        lines = self._bulk_lines(docs)
+
+        try:
+            first = next(lines)
+        except StopIteration:
+            return None
+
         qs_args = {
             "createCollection": "true",
             "collection": self.collection.cid}
 
+        header = []
+
         # if there's no headers/values import
-        if not isinstance(docs[0], (list, tuple)):
+        if not first.startswith(b"["):
             qs_args["type"] = "documents"  # we do not want to use array here!
+            lines = chain([first], lines)
+        else:
+            # NB: every chunk should start with attribute names
+            header = [first]
 
-        response = self.connection.post(
-            self.connection.qs(self.BULK_INSERT_PATH, **qs_args),
-            data=u"\n".join(json.dumps(doc) for doc in docs),
-            ignore_request_args=True)
+        path = self.connection.qs(self.BULK_INSERT_PATH, **qs_args)
 
-        # update revision of the document
-        if response.status == 201:
-            return response.data
+        return path, header, self._bulk_chunks(lines, batch, max_bytes)
 
-        return False
+    def buffered_writer(self, max_docs=1000, max_bytes=1024 * 1024,
+                        max_delay=1.0, max_pending=None):
+        """
+        Write-behind buffer which import created documents
+        in background, see :py:class:`arango.writer.BufferedWriter`
+        """
+        from .writer import BufferedWriter
+
+        return BufferedWriter(
+            self, max_docs=max_docs, max_bytes=max_bytes,
+            max_delay=max_delay, max_pending=max_pending)
+
+    def _bulk_lines(self, docs):
+        """
+        Iterate over encoded lines of import from
+        iterable of documents, NDJSON file path or file object
+        """
+        if isinstance(docs, str):
+            with open(docs, "rb") as f:
+                for line in self._bulk_lines(f):
+                    yield line
+
+            return
+
+        if not hasattr(docs, "read"):
+            codec = self.connection.codec
+
+            for doc in docs:
+                yield codec.dumpb(doc)
+
+            return
+
+        for line in docs:
+            if not isinstance(line, bytes):
+                line = line.encode(self.connection.codec.encoding)
+
+            line = line.strip()
+
+            if line:
+                yield line
+
+    def _bulk_chunks(self, lines, batch, max_bytes=None):
+        """
+        Split encoded ``lines`` into ``(offset, chunk)`` pairs
+        of at most ``batch`` lines and ``max_bytes`` bytes
+        """
+        offset = 0
+        chunk = []
+        size = 0
+
+        for line in lines:
+            if chunk and ((batch and len(chunk) >= batch) or (
+                    max_bytes and size + len(line) + 1 > max_bytes)):
+                yield offset, chunk
+                offset += len(chunk)
+                chunk, size = [], 0
+
+            chunk.append(line)
+            size += len(line) + 1
+
+        if chunk:
+            yield offset, chunk
 
     def delete(self, ref_or_document):
         """
@@ -150,7 +413,7 @@ class Documents(object):
 
         """
 
-        doc = Document(
+        doc = (self.document_cls or Document)(
             collection=self.collection,
             connection=self.connection,
             id=proxied_document_ref(ref_or_document)
@@ -187,6 +450,259 @@ class Documents(object):
         """
         return Document.load(self.connection, id=doc_id)
 
+    def load_many(self, refs, chunk_size=1000, workers=1):
+        """
+        Load documents by list of ids, keys or ``Document``
+        instances. Documents fetched by chunks of ``chunk_size``
+        references, one AQL query per chunk, and chunks may be
+        loaded in parallel by ``workers`` threads.
+
+        Return :py:class:`DocumentList` in the same order as
+        ``refs`` where missing documents are ``None``.
+
+        .. testcode::
+
+            ids = [c.test.documents.create({"x": n}).id for n in range(3)]
+            docs = c.test.documents.load_many(ids + ["test/unknown"])
+
+            assert [d.body["x"] for d in docs[:3]] == [0, 1, 2]
+            assert docs.missing == ["test/unknown"]
+
+        """
+        # NB: ``_id`` doesn't trigger lazy loading of documents
+        refs = [ref._id if issubclass(type(ref), Document) else ref
+                for ref in refs]
+
+        def load(chunk):
+            return list(iter(self.connection.query(
+                self.LOAD_MANY_QUERY, bindVars=self._load_many_vars(chunk),
+                batchSize=len(chunk), raw=True)))
+
+        rows = []
+        for chunk in parallel_map(load, chunks(refs, chunk_size), workers):
+            rows.extend(chunk)
+
+        return self._document_list(refs, rows)
+
+    def _load_many_vars(self, chunk):
+        return {"ids": chunk, "@collection": self.collection.cid}
+
+    def _document_list(self, refs, rows):
+        """
+        Wrap ``rows`` loaded for ``refs`` into
+        :py:class:`DocumentList`
+        """
+        wrap = (self.document_cls or Document).wrap
+        docs = DocumentList()
+
+        for ref, row in zip(refs, rows):
+            if row is None:
+                docs.missing.append(ref)
+                docs.append(None)
+            else:
+                docs.append(wrap(self.connection, row))
+
+        return docs
+
+    def update_many(self, items, chunk_size=1000, workers=1, **options):
+        """
+        Update many documents by single AQL ``UPDATE`` query
+        per chunk of ``chunk_size`` documents. ``items`` is either
+        ``dict`` or list of pairs ``reference -> patch`` or list
+        of ``Document`` instances (their ``body`` used as patch).
+        ``options`` (like ``waitForSync``, ``keepNull``,
+        ``mergeObjects``) passed to ``OPTIONS`` of the query,
+        with ``ignoreErrors=False`` chunk fails on first error.
+
+        Return :py:class:`OperationResult`.
+
+        .. testcode::
+
+            doc = c.test.documents.create({"x": 1})
+            result = c.test.documents.update_many({doc.id: {"x": 2}})
+
+            assert result[doc.id.split("/")[1]] is not None
+
+        """
+        return self._modify_many("UPDATE", items, chunk_size, workers,
+                                 options)
+
+    def replace_many(self, items, chunk_size=1000, workers=1, **options):
+        """
+        The same as :py:meth:`update_many` but replace
+        whole documents with ``REPLACE``
+        """
+        return self._modify_many("REPLACE", items, chunk_size, workers,
+                                 options)
+
+    def delete_many(self, refs, chunk_size=1000, workers=1, **options):
+        """
+        Delete many documents by ids, keys or ``Document``
+        instances with single AQL ``REMOVE`` query per chunk
+        of ``chunk_size`` documents.
+
+        Return :py:class:`OperationResult`.
+        """
+        docs, keys = self._delete_keys(refs)
+
+        result = self._run_many(
+            self.DELETE_MANY_QUERY, "keys", keys, chunk_size, workers,
+            options)
+
+        return self._deleted(docs, result)
+
+    def _delete_keys(self, refs):
+        """
+        Return keys of ``refs`` and ``Document`` instances among them
+        """
+        docs = {}
+        keys = []
+
+        for ref in refs:
+            key = self._key(ref)
+            keys.append(key)
+
+            if issubclass(type(ref), Document):
+                docs[key] = ref
+
+        return docs, keys
+
+    def _deleted(self, docs, result):
+        """
+        Clean up deleted ``docs`` and return ``result``
+        """
+        for key, doc in docs.items():
+            if key in result:
+                doc._id = None
+                doc._rev = None
+                doc._body = None
+
+        return result
+
+    def _modify_many(self, operation, items, chunk_size, workers, options):
+        docs, rows = self._modify_rows(items)
+
+        result = self._run_many(
+            self.UPDATE_MANY_QUERY, "items", rows, chunk_size, workers,
+            options, operation=operation)
+
+        return self._modified(docs, result)
+
+    def _modify_rows(self, items):
+        """
+        Return rows with key and body for every item
+        and ``Document`` instances among items
+        """
+        if isinstance(items, dict):
+            items = items.items()
+
+        docs = {}
+        rows = []
+
+        for item in items:
+            if issubclass(type(item), Document):
+                key, body = self._key(item), item._loaded_body()
+                docs[key] = item
+            else:
+                ref, body = item
+                key = self._key(ref)
+
+            rows.append({"key": key, "body": body})
+
+        return docs, rows
+
+    def _modified(self, docs, result):
+        """
+        Update revisions of modified ``docs`` and return ``result``
+        """
+        for key, doc in docs.items():
+            if key in result:
+                doc._rev = result[key]
+                doc._track_changes()
+
+        return result
+
+    def _run_many(self, query, name, values, chunk_size, workers, options,
+                  operation=None):
+        """
+        Run ``query`` for every chunk of ``values`` bound
+        as ``@name`` and collect results
+        """
+        query, bind_vars = self._many_query(query, options, operation)
+
+        def run(chunk):
+            chunk_vars = {name: chunk}
+            chunk_vars.update(bind_vars)
+
+            try:
+                return chunk, list(iter(self.connection.query(
+                    query, bindVars=chunk_vars, batchSize=len(chunk),
+                    raw=True))), None
+            except (AqlQueryError, IOError) as e:
+                logger.error("Can't process chunk of %s documents",
+                             len(chunk), exc_info=True)
+                return chunk, [], e
+
+        result = OperationResult()
+
+        for chunk, rows, error in parallel_map(
+                run, chunks(values, chunk_size), workers):
+            self._collect_many(result, chunk, rows, error)
+
+        return result
+
+    def _many_query(self, query, options, operation=None):
+        """
+        Format ``query`` with ``OPTIONS`` and return
+        it together with bind variables
+        """
+        bind_vars = {"@collection": self.collection.cid}
+        pairs = []
+
+        # NB: ``ignoreErrors`` may be overridden by ``options``
+        if "ignoreErrors" not in options:
+            pairs.append("ignoreErrors: true")
+
+        for option in sorted(options):
+            pairs.append("{0}: @option_{0}".format(option))
+            bind_vars["option_{0}".format(option)] = options[option]
+
+        query = query.format(
+            operation=operation,
+            options="{{{0}}}".format(", ".join(pairs)))
+
+        return query, bind_vars
+
+    def _collect_many(self, result, chunk, rows, error):
+        """
+        Add ``rows`` returned for ``chunk`` to ``result``
+        """
+        cache = getattr(self.connection, "document_cache", None)
+
+        for row in rows:
+            result[row["key"]] = row["rev"]
+
+            if cache is not None:
+                cache.invalidate("{0}/{1}".format(
+                    self.collection.cid, row["key"]))
+
+        for value in chunk:
+            key = value["key"] if isinstance(value, dict) else value
+
+            if key not in result:
+                result.errors[key] = str(error) if error else (
+                    "Document `{0}` is not processed (not found "
+                    "or rejected by the server)".format(key))
+
+    def _key(self, ref):
+        """
+        Get document key from id, key or ``Document``
+        """
+        if issubclass(type(ref), Document):
+            ref = ref._id
+
+        return str(ref).split("/")[-1]
+
 
 class Document(ComparsionMixin, LazyLoadMixin):
     """Particular instance of Document"""
@@ -194,6 +710,8 @@ class Document(ComparsionMixin, LazyLoadMixin):
     DOCUMENT_PATH = "/_api/document"
     DELETE_DOCUMENT_PATH = "/_api/document/{0}"
     UPDATE_DOCUMENT_PATH = "/_api/document/{0}"
+    # NB: nested objects of changed fields are replaced, not merged
+    PATCH_PARAMS = {"mergeObjects": "false", "keepNull": "true"}
     READ_DOCUMENT_PATH = "/_api/document/{0}"
 
     LAZY_LOAD_HANDLERS = ["id", "rev", "body", "get", "update", "delete"]
@@ -214,6 +732,14 @@ class Document(ComparsionMixin, LazyLoadMixin):
         self._rev = rev or None
         self._resource_url = resource_url
 
+        # top-level keys changed since last save,
+        # ``None`` means whole body should be saved
+        self._dirty = set()
+        # top-level values of the body as it was loaded or
+        # saved, and whether ``body`` was returned since then
+        self._snapshot = None
+        self._exposed = False
+
         self._lazy_loaded = True
 
         if id is not None or resource_url is not None:
@@ -235,13 +761,72 @@ class Document(ComparsionMixin, LazyLoadMixin):
 
     @classmethod
     def wrap(cls, connection, item):
+        session = getattr(connection, "identity_map", None)
+
+        if session is not None:
+            doc = session.get(item.get("_id"))
+
+            if isinstance(doc, cls):
+                # NB: keep local changes of the same revision
+                if doc._body is None or doc._rev != item.get("_rev"):
+                    doc._body = item
+                    doc._rev = item.get("_rev")
+                    doc._track_changes()
+
+                doc._lazy_loaded = True
+                return doc
+
         doc = cls(connection=connection,
                   id=item.get("_id"),
                   rev=item.get("_rev"))
         doc._body = item
+        doc._track_changes()
         doc._lazy_loaded = True
+
+        if session is not None:
+            session.add(doc)
+
+        return doc
+
+    @classmethod
+    def ref(cls, connection, id, collection=None):
+        """
+        Lazy document by handle ``id``. Within
+        :py:meth:`arango.core.Connection.session` return
+        already known instance of the document.
+        """
+        session = getattr(connection, "identity_map", None)
+        doc = session.get(id) if session is not None else None
+
+        if isinstance(doc, cls):
+            return doc
+
+        doc = cls(collection=collection, connection=connection, id=id)
+
+        if session is not None:
+            session.add(doc)
+
         return doc
 
+    @classmethod
+    def hydrate(cls, connection, item):
+        """
+        Default wrapper of :py:class:`arango.cursor.Cursor`.
+        Build document from row which query already returned
+        instead of reading it once again:
+
+         - full document (``_id`` and ``_rev``) wrapped as is
+         - partial projection (only ``_id``) loaded from database
+         - any other value returned without changes
+        """
+        if not isinstance(item, dict) or "_id" not in item:
+            return item
+
+        if "_rev" not in item:
+            return cls.load(connection, meta=item)
+
+        return cls.wrap(connection, item)
+
     @classmethod
     def load(cls, connection, meta=None, id=None):
         """
@@ -263,6 +848,17 @@ class Document(ComparsionMixin, LazyLoadMixin):
         if id is None:
             raise DocumentNotFound("id equal to None, can't load")
 
+        session = getattr(connection, "identity_map", None)
+        doc = session.get(id) if session is not None else None
+
+        if isinstance(doc, cls) and doc._body is not None:
+            return doc
+
+        cache = getattr(connection, "document_cache", None)
+
+        if cache is not None:
+            return cls._load_cached(connection, cache, id)
+
         response = connection.get(
             cls.READ_DOCUMENT_PATH.format(id),
             _expect_raw=True)
@@ -274,6 +870,47 @@ class Document(ComparsionMixin, LazyLoadMixin):
 
         return cls.wrap(connection, response.data)
 
+    @classmethod
+    def _load_cached(cls, connection, cache, id):
+        """
+        Load document via ``cache``, cached document
+        revalidated by its revision with ``If-None-Match``
+        """
+        entry = cache.get(id)
+        headers = None
+
+        if entry is not None:
+            rev, body, fresh = entry
+
+            if fresh:
+                return cls.wrap(connection, copy.deepcopy(body))
+
+            headers = {"If-None-Match": '"{0}"'.format(rev)}
+
+        response = connection.get(
+            cls.READ_DOCUMENT_PATH.format(id),
+            headers=headers,
+            _expect_raw=True)
+
+        if entry is not None and response.status == 304:
+            cache.revalidated(id)
+            return cls.wrap(connection, copy.deepcopy(body))
+
+        if response.status != 200:
+            cache.invalidate(id)
+            raise DocumentNotFound(
+                "Sorry, document with handle `{0}` "
+                "not exist in database".format(id))
+
+        cache.put(id, response.data.get("_rev"), response.data)
+        return cls.wrap(connection, copy.deepcopy(response.data))
+
+    def _invalidate_cache(self):
+        cache = getattr(self.connection, "document_cache", None)
+
+        if cache is not None and self._id is not None:
+            cache.invalidate(self._id)
+
     def lazy_loader(self):
         return Document.load(self.connection, id=self._id)
 
@@ -285,6 +922,60 @@ class Document(ComparsionMixin, LazyLoadMixin):
         """Set element by dict-like key"""
 
         self._body[name] = value
+        self._mark_dirty(name)
+
+    def _loaded_body(self):
+        """
+        Body of (lazily loaded) document which is not
+        considered as exposed to direct modification
+        """
+        self._handle_lazy()
+        return self._body
+
+    def _mark_dirty(self, *names):
+        if self._dirty is not None:
+            self._dirty.update(names)
+
+    def _track_changes(self):
+        """
+        Start tracking of changes from current body
+        (just loaded or saved)
+        """
+        self._dirty = set()
+        self._exposed = False
+        self._snapshot = (
+            dict(self._body) if isinstance(self._body, dict) else None)
+
+    @property
+    def changes(self):
+        """
+        Top-level fields of the document changed since last
+        save: by ``update``, ``doc[name] = value`` or directly
+        in ``body`` (nested objects returned by ``body`` are
+        considered changed). ``None`` in case whole document
+        should be saved: body was overwritten or some fields
+        were removed.
+        """
+        if self._dirty is None or self._snapshot is None or \
+                not isinstance(self._body, dict):
+            return None
+
+        snapshot = self._snapshot
+
+        if any(name not in self._body for name in snapshot):
+            return None
+
+        changes = dict((name, self._body[name]) for name in self._dirty)
+
+        for name, value in self._body.items():
+            if name in changes:
+                continue
+
+            if name not in snapshot or snapshot[name] is not value or \
+                    self._exposed and isinstance(value, (dict, list)):
+                changes[name] = value
+
+        return changes
 
     def __repr__(self):
         self._handle_lazy()
@@ -321,6 +1012,7 @@ class Document(ComparsionMixin, LazyLoadMixin):
         Setter for document body
         """
         self._body = value
+        self._dirty = None
 
     def get(self, name=None, default=None):
         """
@@ -345,9 +1037,16 @@ class Document(ComparsionMixin, LazyLoadMixin):
             return self._body[name]
 
         if isinstance(self._body, (list, tuple)) or name is None:
+            # whole body may be modified outside of the document
+            self._exposed = True
             return self._body
 
-        return self._body.get(name, default)
+        value = self._body.get(name, default)
+
+        if isinstance(value, (dict, list)):
+            self._mark_dirty(name)
+
+        return value
 
     def create(self, body, createCollection=False, **kwargs):
         """
@@ -384,8 +1083,12 @@ class Document(ComparsionMixin, LazyLoadMixin):
 
         if response.status in [200, 201, 202]:
             self._body = body
+            self._track_changes()
             parse_meta(self, response)
 
+            if getattr(self.connection, "identity_map", None) is not None:
+                self.connection.identity_map.add(self)
+
             return self
 
         return None
@@ -414,9 +1117,11 @@ class Document(ComparsionMixin, LazyLoadMixin):
         if issubclass(type(self._body), dict) and \
                 issubclass(type(newData), dict):
             self._body.update(newData)
+            self._mark_dirty(*newData)
         elif issubclass(type(self._body), list) and \
                 issubclass(type(newData), list):
             self._body.extend(newData)
+            self._dirty = None
         else:
             raise DocumentIncompatibleDataType(
                 "You trying to update document `{0}` with "
@@ -431,33 +1136,62 @@ class Document(ComparsionMixin, LazyLoadMixin):
 
         return True
 
-    def save(self, **kwargs):
+    def save(self, full=False, **kwargs):
         """
         Method to force save of the document.
 
+        Only changed fields (see :py:attr:`changes`) are sent with
+        ``PATCH`` request. Whole document is sent with ``PUT`` in
+        case ``full`` is ``True``, body was overwritten by ``body``
+        setter, some fields were removed or there are no changes.
+        Nested objects of changed fields are replaced, not merged.
+
         ``kwargs`` will be passed directly to ``requests``
         arguments.
         """
+        method, params, data = self._save_request(full)
+        self._invalidate_cache()
+
+        path = self.UPDATE_DOCUMENT_PATH.format(self.id)
+        if params:
+            path = self.connection.qs(path, **params)
 
-        response = self.connection.put(
-            self.UPDATE_DOCUMENT_PATH.format(self.id),
-            data=self.body,
-            **kwargs)
+        response = getattr(self.connection, method)(
+            path, data=data, **kwargs)
 
         # update revision of the document
         if response.status in [200, 201, 202]:
             self._rev = response.data.get("_rev")
+            self._track_changes()
             return self
 
         raise DocuemntUpdateError(
             response.get("errorMessage", "Unknown error"))
 
+    def _save_request(self, full=False):
+        """
+        Return HTTP method, query parameters and
+        data to save the document
+        """
+        body = self._loaded_body()
+        changes = None if full else self.changes
+
+        if changes:
+            return "patch", self.PATCH_PARAMS, changes
+
+        return "put", {}, body
+
     def delete(self):
         """
         Delete current document.
 
         Return ``True`` if success and ``False`` if not
         """
+        self._invalidate_cache()
+
+        if getattr(self.connection, "identity_map", None) is not None:
+            self.connection.identity_map.discard(self._id)
+
         response = self.connection.delete(
             self.DELETE_DOCUMENT_PATH.format(self.id)
         )
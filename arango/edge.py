@@ -7,7 +7,7 @@ from .document import Document
 from .exceptions import EdgeAlreadyCreated, EdgeNotYetCreated, \
     EdgeIncompatibleDataType, \
     DocumentIncompatibleDataType
-from .utils import proxied_document_ref, json
+from .utils import proxied_document_ref
 
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,12 @@ class Edges(object):
     def _cursor(self, rs):
         return []
 
+    def resultset_length(self, rs):
+        return len(self._cursor(rs))
+
+    def fetch(self, rs, offset, count, reverse=False):
+        return self._cursor(rs)
+
     def iterate(self, rs):
         """
         Execute to iterate results
@@ -136,11 +142,8 @@ class Edge(ComparsionMixin):
             return None
 
         if not self._from_document:
-            self._from_document = Document(
-                collection=self.collection,
-                connection=self.connection,
-                id=self._from
-            )
+            self._from_document = Document.ref(
+                self.connection, self._from, collection=self.collection)
 
         return self._from_document
 
@@ -154,11 +157,8 @@ class Edge(ComparsionMixin):
             return None
 
         if not self._to_document:
-            self._to_document = Document(
-                collection=self.collection,
-                connection=self.connection,
-                id=self._to
-            )
+            self._to_document = Document.ref(
+                self.connection, self._to, collection=self.collection)
 
         return self._to_document
 
@@ -273,7 +273,7 @@ class Edge(ComparsionMixin):
                 self.EDGE_PATH,
                 **params
             ),
-            data=json.dumps(body or {}))
+            data=self.connection.codec.dumps(body or {}))
 
         # define document ID
         if response.status in [200, 201, 202]:
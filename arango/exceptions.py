@@ -6,7 +6,7 @@ __all__ = ("InvalidCollectionId", "CollectionIdAlreadyExist",
            "DocumentNotFound", "EdgeNotYetCreated",
            "EdgeIncompatibleDataType", "EdgeNotFound",
            "DocuemntUpdateError", "AqlQueryError", "DatabaseAlreadyExist",
-           "DatabaseSystemError")
+           "DatabaseSystemError", "BatchError", "DocumentCreateError")
 
 
 class DatabaseSystemError(Exception):
@@ -81,3 +81,11 @@ class AqlQueryError(Exception):
 
 class DatabaseAlreadyExist(Exception):
     """Raises in case database already exists"""
+
+
+class BatchError(Exception):
+    """Raises in case batch request can't be processed"""
+
+
+class DocumentCreateError(Exception):
+    """Raises in case document can't be created by buffered import"""
@@ -15,21 +15,23 @@ class ComparsionMixin(object):
         if not issubclass(type(other), self.__class__):
             return False
 
-        if (self.body == other.body and self._id == other._id and
+        body, other_body = self._loaded_body(), other._loaded_body()
+
+        if (body == other_body and self._id == other._id and
                 self._rev == other._rev):
             return True
 
-        keys = lambda o: [key for key in o.body.keys()
-                          if key not in self.IGNORE_KEYS]
+        keys = lambda body: [key for key in body.keys()
+                             if key not in self.IGNORE_KEYS]
 
         # compare keys only
-        if keys(self) != keys(other):
+        if keys(body) != keys(other_body):
             return False
 
         # compare bodies but ignore sys keys
-        if (self.body is not None and other.body is not None):
-            for key in keys(other):
-                if self.body.get(key, None) != other.body.get(key, None):
+        if (body is not None and other_body is not None):
+            for key in keys(other_body):
+                if body.get(key, None) != other_body.get(key, None):
                     return False
 
         if (self._id is not None and self._rev is not None and
@@ -38,6 +40,13 @@ class ComparsionMixin(object):
 
         return True
 
+    def _loaded_body(self):
+        """
+        Body of the item to compare, classes which track
+        reads of ``body`` should override it
+        """
+        return self.body
+
 
 class LazyLoadMixin(object):
     """
@@ -0,0 +1,64 @@
+import weakref
+
+__all__ = ("Session",)
+
+
+class Session(object):
+    """
+    Identity map of documents: within session one
+    document handle maps to one live
+    :py:class:`arango.document.Document` instance. Documents
+    are kept by weak references, so unused documents
+    are freed as usual.
+
+    .. code::
+
+        with c.connection.session() as session:
+            for doc in c.query("FOR d IN test RETURN d"):
+                pass
+
+            # the same instance, without request
+            doc = c.test.documents.load(doc.id)
+
+    .. note:: session is attached to the connection, so
+              it's shared by all threads which use it.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.documents = weakref.WeakValueDictionary()
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = self.connection.identity_map
+        self.connection.identity_map = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.identity_map = self._previous
+        self._previous = None
+        self.clear()
+
+    def get(self, handle):
+        return self.documents.get(handle)
+
+    def add(self, document):
+        if document._id is not None:
+            self.documents[document._id] = document
+
+        return document
+
+    def discard(self, handle):
+        self.documents.pop(handle, None)
+
+    def clear(self):
+        self.documents.clear()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __contains__(self, handle):
+        return handle in self.documents
+
+    def __repr__(self):
+        return "<Session with {0} documents>".format(len(self))
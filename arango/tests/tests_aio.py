@@ -0,0 +1,384 @@
+import errno
+import threading
+
+from nose import SkipTest
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from arango.clients.base import RequestsBase
+from arango.exceptions import DocumentNotFound
+from arango.utils import json
+
+from .tests_base import TestsBase
+from .tests_pycurl import ThreadedHTTPServer, EchoHandler
+
+try:
+    import asyncio
+    from arango.aio import AsyncConnection, AsyncCursor, AsyncDocument
+    from arango.cache import DocumentCache
+    from arango.clients.asyncioclient import AsyncioClient, \
+        AsyncConnectionPool
+except (ImportError, SyntaxError):
+    asyncio = None
+
+
+class FakeAsyncClient(object):
+    """
+    Client which return prepared responses via futures
+    and record all requests
+    """
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def __getattr__(self, method):
+        def request(url, data=None, **kwargs):
+            self.requests.append((method, url, data))
+            status, body = self.responses[method].pop(0)
+
+            future = asyncio.Future()
+            future.set_result(RequestsBase.build_response(
+                status, "", {}, json.dumps(body)))
+            return future
+
+        return request
+
+
+class TestsAsyncBase(TestsBase):
+    def setUp(self):
+        if asyncio is None:
+            raise SkipTest
+
+        super(TestsAsyncBase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        super(TestsAsyncBase, self).tearDown()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def wait(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def connection(self, **responses):
+        client = FakeAsyncClient(responses)
+        return AsyncConnection(client=client), client
+
+
+class TestAsyncConnection(TestsAsyncBase):
+    def test_cursor(self):
+        conn, client = self.connection(
+            post=[(201, {"id": 1, "hasMore": True, "count": 3,
+                         "result": [{"_id": "test/1", "_rev": "1"},
+                                    {"_id": "test/2", "_rev": "2"}]})],
+            put=[(200, {"id": 1, "hasMore": False,
+                        "result": [{"_id": "test/3", "_rev": "3"}]})])
+
+        cursor = conn.query("FOR d IN test RETURN d")
+        assert_true(isinstance(cursor, AsyncCursor))
+
+        docs = self.wait(cursor.all())
+
+        assert_equal([doc.id for doc in docs], ["test/1", "test/2", "test/3"])
+        assert_true(all(isinstance(d, AsyncDocument) for d in docs))
+        assert_equal([r[0] for r in client.requests], ["post", "put"])
+
+    def test_cursor_len(self):
+        conn, client = self.connection(
+            post=[(201, {"id": 1, "hasMore": True, "result": [1, 2]}),
+                  (201, {"hasMore": False, "result": [5]})])
+
+        cursor = conn.query("FOR d IN test RETURN d", raw=True)
+
+        try:
+            self.wait(cursor.len())
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("count of results is not known")
+
+        assert_equal(len(client.requests), 1)
+        assert_equal(self.wait(cursor.count_query()), 5)
+        assert_equal(self.wait(cursor.len()), 5)
+
+    def test_cursor_close(self):
+        conn, client = self.connection(
+            post=[(201, {"id": 1, "hasMore": True, "result": [1, 2]})],
+            delete=[(202, {"id": 1})])
+
+        async def first():
+            async with conn.query("FOR d IN test RETURN d",
+                                  raw=True) as cursor:
+                async for item in cursor:
+                    return cursor, item
+
+        cursor, item = self.wait(first())
+
+        assert_equal(item, 1)
+        assert_false(cursor.is_open)
+        assert_equal(client.requests[-1][:2],
+                     ("delete", "http://localhost:8529/_api/cursor/1"))
+
+    def test_cursor_coroutine_wrapper(self):
+        conn, client = self.connection(
+            post=[(201, {"hasMore": False, "result": [1, 2]})])
+
+        def wrapper(connection, item):
+            future = asyncio.Future()
+            future.set_result(item * 10)
+            return future
+
+        cursor = conn.query("FOR d IN [1, 2] RETURN d", wrapper=wrapper)
+        assert_equal(self.wait(cursor.all()), [10, 20])
+
+    def test_document_crud(self):
+        conn, client = self.connection(
+            post=[(201, {"_id": "test/1", "_rev": "1"})],
+            patch=[(201, {"_id": "test/1", "_rev": "2"})],
+            get=[(200, {"_id": "test/1", "_rev": "2", "x": 2})],
+            delete=[(202, {"_id": "test/1", "_rev": "2"})])
+
+        docs = conn.collection.test.documents
+
+        doc = self.wait(docs.create({"x": 1}))
+        assert_equal(doc.id, "test/1")
+
+        self.wait(doc.update({"x": 2}))
+        assert_equal(doc.rev, "2")
+
+        loaded = self.wait(docs.load("test/1"))
+        assert_equal(loaded.body["x"], 2)
+
+        assert_true(self.wait(docs.delete(loaded)))
+        assert_equal(
+            [r[0] for r in client.requests],
+            ["post", "patch", "get", "delete"])
+        assert_equal(client.requests[1][2], '{"x": 2}')
+
+    def test_document_cache(self):
+        conn, client = self.connection(
+            patch=[(201, {"_id": "test/1", "_rev": "2"})],
+            delete=[(202, {"_id": "test/1", "_rev": "2"})])
+        conn.document_cache = DocumentCache()
+        conn.document_cache.put("test/1", "1", {"x": 1})
+
+        with conn.session() as session:
+            doc = AsyncDocument.wrap(
+                conn, {"_id": "test/1", "_rev": "1", "x": 1})
+            session.add(doc)
+
+            self.wait(doc.update({"x": 2}))
+            assert_false("test/1" in conn.document_cache)
+
+            conn.document_cache.put("test/1", "2", {"x": 2})
+            assert_true(self.wait(doc.delete()))
+
+            assert_false("test/1" in conn.document_cache)
+            assert_false("test/1" in session)
+
+    def test_create_bulk(self):
+        conn, client = self.connection(post=[
+            (201, {"created": 2, "errors": 0, "empty": 0, "error": False}),
+            (201, {"created": 1, "errors": 0, "empty": 0, "error": False})])
+
+        result = self.wait(conn.collection.test.documents.create_bulk(
+            [{"n": n} for n in range(3)], batch=2, workers=2))
+
+        assert_equal(result["created"], 3)
+        assert_equal(len(client.requests), 2)
+        assert_true("/_api/import" in client.requests[0][1])
+        assert_equal(client.requests[1][2], b'{"n": 2}')
+
+    def test_create_bulk_empty(self):
+        conn, client = self.connection()
+        assert_false(self.wait(
+            conn.collection.test.documents.create_bulk([])))
+
+    def test_load_many(self):
+        conn, client = self.connection(post=[
+            (201, {"hasMore": False, "result": [
+                {"_id": "test/1", "_rev": "1", "x": 1}, None]}),
+            (201, {"hasMore": False, "result": [
+                {"_id": "test/3", "_rev": "1", "x": 3}]})])
+
+        docs = self.wait(conn.collection.test.documents.load_many(
+            ["1", "2", "3"], chunk_size=2, workers=2))
+
+        assert_equal([d and d.body["x"] for d in docs], [1, None, 3])
+        assert_true(isinstance(docs[0], AsyncDocument))
+        assert_equal(docs.missing, ["2"])
+
+    def test_update_delete_many(self):
+        conn, client = self.connection(post=[
+            (201, {"hasMore": False, "result": [{"key": "1", "rev": "2"}]}),
+            (201, {"hasMore": False, "result": [{"key": "1", "rev": "2"}]})])
+        docs = conn.collection.test.documents
+
+        result = self.wait(docs.update_many({"test/1": {"x": 2}}))
+        assert_equal(result, {"1": "2"})
+        assert_true("UPDATE" in json.loads(client.requests[0][2])["query"])
+
+        result = self.wait(docs.delete_many(["test/1", "2"]))
+        assert_equal(result, {"1": "2"})
+        assert_equal(list(result.errors), ["2"])
+        assert_equal(json.loads(client.requests[1][2])["bindVars"]["keys"],
+                     ["1", "2"])
+
+    @raises(TypeError)
+    def test_resultset(self):
+        conn, client = self.connection()
+        conn.collection.test.documents()
+
+    @raises(TypeError)
+    def test_buffered_writer(self):
+        conn, client = self.connection()
+        conn.collection.test.documents.buffered_writer()
+
+    @raises(DocumentNotFound)
+    def test_document_not_found(self):
+        conn, client = self.connection(get=[(404, {"error": True})])
+        self.wait(conn.collection.test.documents.load("test/1"))
+
+    def test_collection(self):
+        conn, client = self.connection(
+            post=[(200, {"name": "test"})],
+            get=[(200, {"count": 5})])
+
+        c = conn.collection.test
+
+        assert_equal(self.wait(c.create()), c)
+        assert_equal(self.wait(c.count()), 5)
+        assert_true(
+            client.requests[-1][1].endswith("/_api/collection/test/count"))
+
+
+class TestAsyncioClient(TestsAsyncBase):
+    def setUp(self):
+        super(TestAsyncioClient, self).setUp()
+
+        self.server = ThreadedHTTPServer(("127.0.0.1", 0), EchoHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.base_url = "http://127.0.0.1:{0}".format(
+            self.server.server_address[1])
+
+    def tearDown(self):
+        super(TestAsyncioClient, self).tearDown()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_concurrent_requests(self):
+        urls = ["{0}/{1}".format(self.base_url, n) for n in range(10)]
+
+        responses = self.wait(asyncio.gather(
+            *[AsyncioClient.post(url, data='{"a": 1}') for url in urls]))
+
+        assert_equal([r.status_code for r in responses], [200] * 10)
+        assert_equal(
+            responses[3].text,
+            '{"method": "POST", "path": "/3", "body": "8"}')
+
+        pool = AsyncioClient.pool(
+            "http", "127.0.0.1", self.server.server_address[1])
+        assert_true(0 < len(pool._idle) <= 10)
+
+
+class FakeWriter(object):
+    def __init__(self, error=None):
+        self.error = error
+        self.data = b""
+        self.closed = False
+
+    def write(self, data):
+        if self.error is not None:
+            raise self.error
+
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncConnectionPool(TestsAsyncBase):
+    RESPONSE = b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}'
+
+    def pool(self, *connections):
+        """
+        Pool which return prepared ``(data, writer_error)``
+        connections, all of them except last one are reused
+        """
+        pool = AsyncConnectionPool("localhost", 8529)
+        pool.opened = []
+
+        async def acquire():
+            data, error = connections[len(pool.opened)]
+            reader = asyncio.StreamReader()
+            writer = FakeWriter(error)
+
+            if data is not None:
+                reader.feed_data(data)
+                reader.feed_eof()
+
+            pool.opened.append(writer)
+            return reader, writer, len(pool.opened) < len(connections)
+
+        pool.acquire = acquire
+        return pool
+
+    def test_retry_closed_before_response(self):
+        pool = self.pool(
+            (b"", None),
+            (None, ConnectionResetError(errno.ECONNRESET, "reset")),
+            (self.RESPONSE, None))
+
+        status, reason, headers, content = self.wait(
+            pool.urlopen("POST", "/_api/document", body=b"{}"))
+
+        assert_equal((status, content), (200, b"{}"))
+        assert_equal(len(pool.opened), 3)
+        assert_true(all(writer.closed for writer in pool.opened[:2]))
+
+    def test_no_retry_after_status_line(self):
+        pool = self.pool(
+            (b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n{}", None),
+            (self.RESPONSE, None))
+
+        try:
+            self.wait(pool.urlopen("POST", "/_api/document", body=b"{}"))
+        except asyncio.IncompleteReadError:
+            pass
+        else:
+            raise AssertionError("incomplete response is not raised")
+
+        assert_equal(len(pool.opened), 1)
+        assert_true(pool.opened[0].closed)
+
+    @raises(OSError)
+    def test_no_retry_unknown_error(self):
+        pool = self.pool(
+            (None, OSError("unknown")),
+            (self.RESPONSE, None))
+
+        try:
+            self.wait(pool.urlopen("PUT", "/_api/cursor/1"))
+        finally:
+            assert_equal(len(pool.opened), 1)
+
+    def test_response_without_body(self):
+        for status in (b"304 Not Modified", b"204 No Content"):
+            reader = asyncio.StreamReader()
+            # NB: connection is kept open by the server
+            reader.feed_data(b"ETag: \"1\"\r\n\r\n")
+
+            response = self.wait(asyncio.wait_for(
+                AsyncConnectionPool("localhost", 8529).read_response(
+                    reader, b"HTTP/1.1 " + status + b"\r\n"), 1))
+
+            assert_equal(response[0], int(status[:3]))
+            assert_equal(response[3], b"")
+            assert_true(response[4])
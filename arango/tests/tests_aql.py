@@ -3,7 +3,7 @@ import re
 from .tests_base import TestsBase
 
 from arango.aql import AQLQuery, F, V
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true
 
 
 def CLEANUP(s):
@@ -290,3 +290,27 @@ class TestAqlGeneration(TestsBase):
         assert_equal(
             q.cursor(batchSize=1).execute().batchSize,
             1)
+
+    def test_execute_raw(self):
+        q = AQLQuery(collection="user")
+        cursor = q.execute(fields=["name", "email"])
+
+        assert_equal(cursor.raw, True)
+        assert_equal(cursor.fields, ("name", "email"))
+        assert_equal(AQLQuery(collection="user").execute().raw, False)
+
+    def test_execute_args_per_call(self):
+        q = AQLQuery(collection="user").cursor(batchSize=5)
+
+        def wrapper(conn, item):
+            return item
+
+        cursor = q.execute(wrapper=wrapper, raw=True)
+        assert_true(cursor.raw)
+
+        cursor = q.execute()
+        assert_equal(cursor.raw, False)
+        assert_equal(cursor.fields, None)
+        assert_true(cursor.wrapper is not wrapper)
+        assert_equal(cursor.batchSize, 5)
+        assert_equal(q.cursor_args, {"batchSize": 5})
@@ -14,7 +14,7 @@ __all__ = ("TestsBase",)
 
 class TestsBase(unittest.TestCase):
 
-    methods = ["post", "put", "get", "delete"]
+    methods = ["post", "put", "patch", "get", "delete"]
 
     def setUp(self):
         if "NOSMOKE" in os.environ:
@@ -0,0 +1,191 @@
+from nose.tools import assert_equal, assert_true, raises
+
+from arango.cache import DocumentCache
+from arango.core import RequestChunk
+from arango.batch import Batch
+from arango.clients.base import RequestsBase
+from arango.exceptions import AqlQueryError, BatchError
+from arango.document import Document
+
+from .tests_base import TestsBase
+
+
+def batch_response(*parts):
+    """
+    Build body of the HTTP Batch API response
+    """
+    chunks = []
+
+    for num, (status, body) in enumerate(parts):
+        chunks.append(
+            "--{boundary}\r\n"
+            "Content-Type: application/x-arango-batchpart\r\n"
+            "Content-Id: {num}\r\n\r\n"
+            "HTTP/1.1 {status} OK\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            "Content-Length: {length}\r\n\r\n"
+            "{body}\r\n".format(
+                boundary=Batch.BOUNDARY, num=num + 1,
+                status=status, length=len(body), body=body))
+
+    return "".join(chunks) + "--{0}--".format(Batch.BOUNDARY)
+
+
+class TestRequestChunk(TestsBase):
+    def test_build(self):
+        chunk = RequestChunk(
+            "/_api/document?collection=test", body='{"a": 1}',
+            method="post", part_num=2)
+
+        assert_equal(
+            chunk.build(),
+            "Content-Type: application/x-arango-batchpart\r\n"
+            "Content-Id: 2\r\n\r\n"
+            "POST /_api/document?collection=test HTTP/1.1\r\n\r\n"
+            '{"a": 1}\r\n')
+
+    def test_multipart(self):
+        chunks = [RequestChunk("/_api/version", boundary="XX", part_num=n)
+                  for n in (1, 2)]
+
+        body = RequestsBase.multipart(chunks)
+
+        assert_true(body.startswith("--XX\r\nContent-Type"))
+        assert_true(body.endswith("--XX--"))
+        assert_equal(body.count("GET /_api/version HTTP/1.1"), 2)
+
+    def test_parse_multipart(self):
+        parts = RequestsBase.parse_multipart(
+            batch_response((201, '{"_id": "test/1"}'), (404, "{}")),
+            Batch.BOUNDARY)
+
+        assert_equal([num for num, r in parts], ["1", "2"])
+        assert_equal([r.status_code for num, r in parts], [201, 404])
+        assert_equal(parts[0][1].text, '{"_id": "test/1"}')
+
+
+class TestBatch(TestsBase):
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        self.c = self.conn.collection.test
+
+    def send(self, batch, *parts):
+        patcher = self.response_mock(
+            status_code=200, text=batch_response(*parts), method="post")
+        patcher.start()
+
+        try:
+            return batch.send()
+        finally:
+            patcher.stop()
+
+    def test_resolve_parts(self):
+        existing = Document.wrap(
+            self.conn, {"_id": "test/2", "_rev": "1", "x": 1})
+        removed = Document.wrap(self.conn, {"_id": "test/3", "_rev": "1"})
+
+        batch = self.conn.batch()
+        doc = batch.create(self.c, {"x": 1})
+        batch.update(existing, {"x": 2})
+        batch.delete(removed)
+        cursor = batch.query("FOR d IN test RETURN d")
+
+        assert_equal(len(batch), 4)
+        assert_equal(doc.id, None)
+
+        responses = self.send(
+            batch,
+            (201, '{"_id": "test/1", "_rev": "10"}'),
+            (201, '{"_id": "test/2", "_rev": "11"}'),
+            (202, '{"_id": "test/3", "_rev": "12"}'),
+            (201, '{"hasMore": false, "result": [1, 2]}'))
+
+        assert_equal(len(responses), 4)
+        assert_equal((doc.id, doc.rev), ("test/1", "10"))
+        assert_equal(doc.body, {"x": 1})
+        assert_equal((existing.rev, existing.body["x"]), ("11", 2))
+        assert_equal(removed.id, None)
+        assert_equal(list(cursor._dataset), [1, 2])
+        assert_equal(batch.errors, [])
+
+    def test_invalidate_cache(self):
+        self.conn.document_cache = DocumentCache()
+        updated = Document.wrap(
+            self.conn, {"_id": "test/2", "_rev": "1", "x": 1})
+
+        for handle in ("test/2", "test/3"):
+            self.conn.document_cache.put(handle, "1", {"x": 1})
+
+        batch = self.conn.batch()
+        batch.update(updated, {"x": 2})
+        batch.delete("test/3")
+
+        self.send(
+            batch,
+            (201, '{"_id": "test/2", "_rev": "2"}'),
+            (202, '{"_id": "test/3", "_rev": "2"}'))
+
+        assert_equal(len(self.conn.document_cache), 0)
+
+    def test_context_manager(self):
+        patcher = self.response_mock(
+            status_code=200,
+            text=batch_response((201, '{"_id": "test/1", "_rev": "1"}')),
+            method="post")
+        patcher.start()
+
+        with self.conn.batch() as batch:
+            doc = batch.create(self.c, {"x": 1})
+
+        patcher.stop()
+
+        assert_equal(doc.id, "test/1")
+        assert_true(all(part.is_sent for part in batch.parts))
+
+    def test_size(self):
+        batch = self.conn.batch(size=2)
+        docs = [batch.create(self.c, {"n": n}) for n in range(3)]
+
+        patcher = self.response_mock(
+            status_code=200,
+            text=batch_response(
+                (201, '{"_id": "test/a", "_rev": "1"}'),
+                (201, '{"_id": "test/b", "_rev": "1"}'),
+                (201, '{"_id": "test/c", "_rev": "1"}')),
+            method="post")
+        patcher.start()
+        responses = batch.send()
+        patcher.stop()
+
+        # parts are sent within two requests
+        assert_equal(len(responses), 3)
+        assert_equal([d.id for d in docs], ["test/a", "test/b", "test/c"])
+
+    @raises(AqlQueryError)
+    def test_query_error(self):
+        batch = self.conn.batch()
+        doc = batch.create(self.c, {"x": 1})
+        batch.query("FOR d IN")
+
+        try:
+            self.send(
+                batch,
+                (201, '{"_id": "test/1", "_rev": "1"}'),
+                (400, '{"error": true, "errorMessage": "syntax error"}'))
+        finally:
+            assert_equal(doc.id, "test/1")
+            assert_equal(len(batch.errors), 1)
+
+    @raises(BatchError)
+    def test_batch_error(self):
+        batch = self.conn.batch()
+        batch.create(self.c, {"x": 1})
+
+        patcher = self.response_mock(
+            status_code=400, text="{}", method="post")
+        patcher.start()
+
+        try:
+            batch.send()
+        finally:
+            patcher.stop()
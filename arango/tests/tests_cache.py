@@ -0,0 +1,119 @@
+import time
+
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from arango.cache import DocumentCache
+from arango.clients.base import RequestsBase
+from arango.core import Connection
+from arango.document import Document
+from arango.exceptions import DocumentNotFound
+from arango.utils import json
+
+from .tests_base import TestsBase
+
+
+class TestDocumentCache(TestsBase):
+    def test_lru(self):
+        cache = DocumentCache(maxsize=2)
+
+        cache.put("test/1", "1", {"x": 1})
+        cache.put("test/2", "1", {"x": 2})
+
+        # touch first document to keep it
+        cache.get("test/1")
+        cache.put("test/3", "1", {"x": 3})
+
+        assert_true("test/1" in cache)
+        assert_false("test/2" in cache)
+        assert_equal(cache.stats()["evictions"], 1)
+
+    def test_ttl(self):
+        cache = DocumentCache(ttl=60)
+        cache.put("test/1", "1", {"x": 1})
+
+        assert_equal(cache.get("test/1"), ("1", {"x": 1}, True))
+
+        cache.ttl = 0.01
+        time.sleep(0.02)
+
+        assert_equal(cache.get("test/1"), ("1", {"x": 1}, False))
+        assert_equal(cache.get("test/2"), None)
+        assert_equal(
+            (cache.hits, cache.misses), (1, 1))
+
+
+class TestCachedLoad(TestsBase):
+    def setUp(self):
+        super(TestCachedLoad, self).setUp()
+        self.conn = Connection(document_cache=True)
+        self.get = self.conn.client.get
+
+    def response(self, status, body=None):
+        return RequestsBase.build_response(
+            status, "", {}, json.dumps(body) if body is not None else b"")
+
+    def test_revalidate(self):
+        self.get.side_effect = [
+            self.response(200, {"_id": "test/1", "_rev": "1", "x": 1}),
+            self.response(304)]
+
+        doc = Document.load(self.conn, id="test/1")
+        doc.body["x"] = 2
+
+        same = Document.load(self.conn, id="test/1")
+
+        assert_equal(same.body, {"_id": "test/1", "_rev": "1", "x": 1})
+        assert_equal(self.get.call_args_list[0][1]["headers"], None)
+        assert_equal(
+            self.get.call_args_list[1][1]["headers"],
+            {"If-None-Match": '"1"'})
+
+        stats = self.conn.document_cache.stats()
+        assert_equal((stats["misses"], stats["revalidations"]), (1, 1))
+
+    def test_modified(self):
+        self.get.side_effect = [
+            self.response(200, {"_id": "test/1", "_rev": "1", "x": 1}),
+            self.response(200, {"_id": "test/1", "_rev": "2", "x": 2})]
+
+        Document.load(self.conn, id="test/1")
+        doc = Document.load(self.conn, id="test/1")
+
+        assert_equal((doc.rev, doc.body["x"]), ("2", 2))
+        assert_equal(self.conn.document_cache.get("test/1")[0], "2")
+
+    def test_fresh_hit(self):
+        self.conn.document_cache.ttl = 60
+        self.get.side_effect = [
+            self.response(200, {"_id": "test/1", "_rev": "1", "x": 1})]
+
+        Document.load(self.conn, id="test/1")
+        doc = Document.load(self.conn, id="test/1")
+
+        assert_equal(doc.body["x"], 1)
+        assert_equal(self.get.call_count, 1)
+        assert_equal(self.conn.document_cache.hits, 1)
+
+    @raises(DocumentNotFound)
+    def test_deleted(self):
+        self.get.side_effect = [
+            self.response(200, {"_id": "test/1", "_rev": "1"}),
+            self.response(404, {"error": True})]
+
+        Document.load(self.conn, id="test/1")
+
+        try:
+            Document.load(self.conn, id="test/1")
+        finally:
+            assert_false("test/1" in self.conn.document_cache)
+
+    def test_invalidate_on_save(self):
+        self.get.side_effect = [
+            self.response(200, {"_id": "test/1", "_rev": "1", "x": 1})]
+        self.conn.client.patch.return_value = self.response(
+            201, {"_rev": "2"})
+
+        doc = Document.load(self.conn, id="test/1")
+        doc.update({"x": 2})
+
+        assert_false("test/1" in self.conn.document_cache)
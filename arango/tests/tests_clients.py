@@ -0,0 +1,90 @@
+import gc
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from nose import SkipTest
+from nose.tools import assert_equal, assert_true, assert_false
+
+from arango.clients.base import RequestsBase, ArangoHttpResponse
+
+from .tests_base import TestsBase
+
+
+def dynamic_response(status, message, headers, body):
+    """
+    Previous implementation of ``build_response``
+    which create new class for every response
+    """
+    return type("ArangoHttpResponse", (object,), {
+        "text": body,
+        "headers": headers,
+        "message": message,
+        "status_code": status})
+
+
+class TestBuildResponse(TestsBase):
+    def test_record(self):
+        response = RequestsBase.build_response(
+            201, "Created", {"etag": "1"}, b'{"a": "\xd0\xb4"}')
+
+        assert_true(isinstance(response, ArangoHttpResponse))
+        assert_equal(response.status_code, 201)
+        assert_equal(response.message, "Created")
+        assert_equal(response.headers, {"etag": "1"})
+        assert_equal(response.content, b'{"a": "\xd0\xb4"}')
+        assert_equal(response.text, u'{"a": "д"}')
+        assert_false(hasattr(response, "__dict__"))
+
+    def test_text_body(self):
+        response = RequestsBase.build_response(200, "OK", {}, u"{}")
+
+        assert_equal(response.content, None)
+        assert_equal(response.text, u"{}")
+
+    def allocated(self, factory, number=1000):
+        if tracemalloc is None:
+            raise SkipTest
+
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            responses = [factory(200, "OK", {}, b"{}")
+                         for n in range(number)]
+            size, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert_equal(len(responses), number)
+        return size
+
+    def test_benchmark_allocation(self):
+        """
+        Per-request allocation of ``__slots__`` record should
+        be several times lower than dynamic class creation
+        """
+        record = self.allocated(RequestsBase.build_response)
+        dynamic = self.allocated(dynamic_response)
+
+        assert_true(
+            record * 4 < dynamic,
+            "Allocated {0} bytes for records, {1} bytes "
+            "for dynamic classes".format(record, dynamic))
+
+    def test_benchmark_speed(self):
+        args = (200, "OK", {}, b"{}")
+
+        record = min(timeit.repeat(
+            lambda: RequestsBase.build_response(*args),
+            number=2000, repeat=3))
+        dynamic = min(timeit.repeat(
+            lambda: dynamic_response(*args), number=2000, repeat=3))
+
+        assert_true(
+            record < dynamic,
+            "Records built in {0:.4f}s, dynamic classes "
+            "in {1:.4f}s".format(record, dynamic))
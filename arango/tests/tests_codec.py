@@ -0,0 +1,95 @@
+import json as stdlib_json
+
+from nose import SkipTest
+from nose.tools import assert_equal, assert_true, raises
+from mock import Mock
+
+from arango.core import Connection, Response
+from arango.codec import get_codec, default_codec, Codec, JSONCodec
+from arango.clients.base import RequestsBase
+from arango.utils import json
+
+from .tests_base import TestsBase
+
+
+class TestCodec(TestsBase):
+    data = {"a": 1, "b": [1, 2], "c": u"д"}
+
+    def test_default(self):
+        assert_true(get_codec() is default_codec)
+        assert_true(default_codec.module is json)
+
+    def test_by_name(self):
+        codec = get_codec("json")
+
+        assert_equal(codec.name, "json")
+        assert_equal(codec.loads(codec.dumps(self.data)), self.data)
+        assert_equal(codec.loads(codec.dumpb(self.data)), self.data)
+        assert_true(isinstance(codec.dumpb(self.data), bytes))
+
+    def test_orjson(self):
+        try:
+            codec = get_codec("orjson")
+        except ImportError:
+            raise SkipTest
+
+        assert_equal(codec.loads(codec.dumpb(self.data)), self.data)
+        assert_equal(stdlib_json.loads(codec.dumps(self.data)), self.data)
+
+    def test_user_supplied(self):
+        codec = get_codec(stdlib_json)
+        assert_true(isinstance(codec, JSONCodec))
+
+        class UpperCodec(Codec):
+            name = "upper"
+
+            def dumps(self, obj):
+                return stdlib_json.dumps(obj).upper()
+
+            def loads(self, data):
+                return stdlib_json.loads(data)
+
+        codec = get_codec(UpperCodec)
+        assert_equal(codec.dumps({"a": "b"}), '{"A": "B"}')
+
+        instance = UpperCodec()
+        assert_true(get_codec(instance) is instance)
+
+    @raises(ValueError)
+    def test_unknown(self):
+        get_codec("unknown")
+
+
+class TestConnectionCodec(TestsBase):
+    def test_requests_encoding(self):
+        codec = Mock(spec=Codec)
+        codec.dumps.return_value = "encoded"
+        conn = Connection(codec=codec)
+
+        assert_true(conn.codec is codec)
+
+        url, kw, args, expect_raw = conn.prepare_request(
+            "post", "/_api/document", {"data": {"a": 1}})
+
+        assert_equal(kw["data"], "encoded")
+        codec.dumps.assert_called_once_with({"a": 1})
+
+    def test_response_decode_bytes(self):
+        codec = Mock(spec=Codec)
+        codec.loads.return_value = {"_id": "test/1"}
+
+        response = Response(
+            "/", RequestsBase.build_response(
+                200, "OK", {}, b'{"_id": "test/1"}'),
+            codec=codec)
+
+        assert_equal(response["_id"], "test/1")
+        codec.loads.assert_called_once_with(b'{"_id": "test/1"}')
+
+    def test_create_bulk_bytes(self):
+        conn = Connection(codec="json")
+        conn.collection.test.documents.create_bulk([{"a": 1}, {"b": 2}])
+
+        assert_equal(
+            conn.client.post.call_args[1]["data"],
+            b'{"a": 1}\n{"b": 2}')
@@ -2,13 +2,17 @@ from nose.tools import assert_equal, assert_not_equal, \
     assert_true, assert_false, raises
 
 
-from mock import Mock
+import timeit
+
+from mock import Mock, patch
 
 from .tests_base import TestsBase
 
 from arango import create
 from arango.core import Connection, Response, Resultset
 from arango.clients import Client
+from arango.utils import json
+from arango.codec import default_codec
 
 
 class TestConnectionInit(TestsBase):
@@ -126,6 +130,61 @@ class TestResponse(TestsBase):
             1
         )
 
+    def test_decode_once(self):
+        text = json.dumps({"result": [{"_id": "test/1"}], "hasMore": False})
+
+        with patch.object(
+                default_codec, "loads", wraps=default_codec.loads) as loads:
+            response = self.response(status=201, text=text)
+
+            assert_equal(response["hasMore"], False)
+            assert_equal(response.data["result"], [{"_id": "test/1"}])
+            assert_true(response.data is response.data)
+            assert_true(response["result"] is response.data["result"])
+
+        assert_equal(loads.call_count, 1)
+
+    def test_decode_raw_lazily(self):
+        response_mock = Mock()
+        response_mock.status_code = 200
+        response_mock.text = '{"_id": "test/1"}'
+
+        with patch.object(
+                default_codec, "loads", wraps=default_codec.loads) as loads:
+            response = Response(self.url, response_mock, expect_raw=True)
+            assert_equal(loads.call_count, 0)
+
+            assert_equal(response.data, {"_id": "test/1"})
+            assert_equal(response.data, {"_id": "test/1"})
+
+        assert_equal(loads.call_count, 1)
+
+    def test_benchmark_large_batch(self):
+        """
+        Decoding of large cursor batch: response + ``data``
+        should cost about one ``json.loads`` instead of two
+        """
+        text = json.dumps({
+            "hasMore": True, "id": 1,
+            "result": [{"_id": "test/{0}".format(n), "_rev": str(n),
+                        "value": n, "name": "document {0}".format(n)}
+                       for n in range(5000)]})
+
+        def decode_twice():
+            json.loads(text)
+            json.loads(text)
+
+        def response_with_data():
+            self.response(status=201, text=text).data
+
+        twice = min(timeit.repeat(decode_twice, number=3, repeat=3))
+        once = min(timeit.repeat(response_with_data, number=3, repeat=3))
+
+        assert_true(
+            once < twice * 0.8,
+            "Response decoding took {0:.4f}s, double decoding "
+            "{1:.4f}s".format(once, twice))
+
 
 class TestResultset(TestsBase):
     def setUp(self):
@@ -153,8 +212,16 @@ class TestResultset(TestsBase):
         self.Base.iterate = iterate_mock
         self.Base.prepare_resultset = prepare_resultset_mock
 
+        def fetch_mock(rs, offset, count, reverse=False):
+            self.fetched.append((offset, count, reverse))
+            data = self.data[::-1] if reverse else self.data
+            return data[offset:offset + count]
+
+        self.fetched = []
+        self.Base.fetch = fetch_mock
+        self.Base.resultset_length = lambda rs: len(self.data)
+
         self.rs = Resultset(base=self.Base)
-        self.rs.base._cursor = lambda *a, **k: list(range(3))
 
     def test_init(self):
         rs = Resultset(self.Base, 1, 2, field=True, field2=False)
@@ -182,13 +249,61 @@ class TestResultset(TestsBase):
             self.data[0]
         )
 
-    def test_first_last_shourcut_exceed(self):
+    def test_last_shortcut(self):
+        assert_equal(self.rs.last, self.data[-1])
+        assert_equal(self.rs.last, self.data[-1])
 
-        def iterate_mock(arg):
-            for item in []:
-                yield item
+        # single request which is cached
+        assert_equal(self.fetched, [(2, 1, False)])
 
-        self.Base.iterate = iterate_mock
+    def test_last_ordered(self):
+        assert_equal(self.rs.order_by("-name").last, self.data[-1])
+        assert_equal(self.fetched, [(0, 1, True)])
+
+    def test_cache_reset(self):
+        assert_equal(self.rs.first, 0)
+
+        self.data = [5]
+        assert_equal(self.rs.first, 0)
+        assert_equal(self.rs.limit(1).first, 5)
+
+    def test_getitem(self):
+        self.data = list(range(10))
+
+        assert_equal(self.rs[3], 3)
+        assert_equal(self.rs[-1], 9)
+        assert_equal(self.fetched, [(3, 1, False), (9, 1, False)])
+
+    @raises(IndexError)
+    def test_getitem_out_of_range(self):
+        self.rs[3]
+
+    def test_slice(self):
+        rs = Resultset(self.Base).limit(5).offset(2)[1:10]
+
+        assert_true(isinstance(rs, Resultset))
+        assert_equal((rs._offset, rs._limit), (3, 4))
+
+        rs = self.rs[1:]
+        assert_equal((rs._offset, rs._limit), (1, 2))
+
+        rs = Resultset(self.Base).offset(2)[1:]
+        assert_equal((rs._offset, rs._limit), (3, 2))
+
+        rs = self.rs[-2:]
+        assert_equal((rs._offset, rs._limit), (1, 2))
+
+        assert_equal(self.rs[2:2], [])
+
+    def test_after(self):
+        rs = Resultset(self.Base).order_by("-age").after("k1")
+
+        assert_equal(rs._after, ("_key", "k1"))
+        assert_equal(rs._order, ("_key", "-age"))
+        assert_equal(rs.clone()._after, ("_key", "k1"))
+
+    def test_first_last_shourcut_exceed(self):
+        self.data = []
 
         rs = Resultset(base=self.Base)
 
@@ -207,6 +322,13 @@ class TestResultset(TestsBase):
             2
         )
 
+    def test_raw(self):
+        rs = Resultset(self.Base).raw("name", "email")
+
+        assert_equal(rs._raw, True)
+        assert_equal(rs._fields, ("name", "email"))
+        assert_equal(Resultset(self.Base).raw()._fields, None)
+
     def test_data(self):
         assert_equal(self.rs.data, None)
 
@@ -227,18 +349,15 @@ class TestResultset(TestsBase):
 
     def test_repr_large_resultset(self):
         dataset = list(range(self.rs.max_repr_items * 2))
-
-        def iterate_large_dataset(rs):
-            for item in dataset:
-                yield item
-
-        custom_base = Mock()
-        custom_base.iterate = iterate_large_dataset
+        self.data = dataset
 
         assert_equal(
-            str(Resultset(base=custom_base)),
+            str(Resultset(base=self.Base)),
             "<Resultset: {0}... more>".format(
                 ", ".join([
                     str(i) for i in dataset[:self.rs.max_repr_items + 1]])
             )
         )
+
+        # only items to show are fetched
+        assert_equal(self.fetched, [(0, self.rs.max_repr_items + 2, False)])
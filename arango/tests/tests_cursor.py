@@ -0,0 +1,363 @@
+import gc
+import threading
+import timeit
+
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from arango.clients.base import RequestsBase
+from arango.core import Response
+from arango.cursor import Cursor
+from arango.document import Document
+from arango.exceptions import AqlQueryError
+from arango.utils import json
+
+from .tests_base import TestsBase
+
+
+def cursor_response(status=201, **body):
+    return Response(
+        "/_api/cursor",
+        RequestsBase.build_response(status, "", {}, json.dumps(body)))
+
+
+class FakeConnection(object):
+    """
+    Connection which return prepared cursor batches
+    and record requests
+    """
+    def __init__(self, first, batches):
+        self.first = first
+        self.batches = list(batches)
+        self.requests = []
+        self.fetched = threading.Event()
+
+    def post(self, path, data=None, **kwargs):
+        self.requests.append(("post", path))
+        return self.first
+
+    def put(self, path, **kwargs):
+        self.requests.append(("put", path))
+        response = self.batches.pop(0)
+
+        if not self.batches:
+            self.fetched.set()
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+class TestCursor(TestsBase):
+    def connection(self, *batches):
+        first = cursor_response(
+            id=1, hasMore=True, count=6, result=[1, 2])
+
+        return FakeConnection(first, batches)
+
+    def cursor(self, conn, **kwargs):
+        return Cursor(
+            conn, "FOR d IN [1, 2, 3, 4, 5, 6] RETURN d",
+            wrapper=lambda conn, item: item, **kwargs)
+
+    def test_iterate(self):
+        conn = self.connection(
+            cursor_response(200, id=1, hasMore=True, result=[3, 4]),
+            cursor_response(200, id=1, hasMore=False, result=[5, 6]))
+
+        assert_equal(list(self.cursor(conn)), [1, 2, 3, 4, 5, 6])
+        assert_equal(
+            [r[0] for r in conn.requests], ["post", "put", "put"])
+
+    def test_raw(self):
+        conn = FakeConnection(
+            cursor_response(hasMore=False, result=[
+                {"_id": "test/1", "name": "John", "age": 30},
+                {"_id": "test/2", "name": "Jane"},
+                5]),
+            [])
+
+        cursor = Cursor(conn, "FOR d IN test RETURN d", raw=True)
+
+        assert_equal(cursor.first, {"_id": "test/1", "name": "John",
+                                    "age": 30})
+        assert_equal(list(cursor)[1:], [{"_id": "test/2", "name": "Jane"}, 5])
+
+    def test_raw_fields(self):
+        conn = FakeConnection(
+            cursor_response(hasMore=False, result=[
+                {"_id": "test/1", "name": "John", "age": 30},
+                {"_id": "test/2", "name": "Jane"}]),
+            [])
+
+        cursor = Cursor(conn, "FOR d IN test RETURN d",
+                        fields=["name", "age"])
+
+        assert_true(cursor.raw)
+        assert_equal(list(cursor), [("John", 30), ("Jane", None)])
+
+    def test_default_wrapper(self):
+        conn = FakeConnection(
+            cursor_response(hasMore=False, result=[
+                {"_id": "test/1", "_rev": "1", "name": "John"},
+                "John"]),
+            [])
+        conn.get = lambda *a, **kw: self.fail("Unexpected GET request")
+
+        doc, name = list(Cursor(conn, "FOR d IN test RETURN d"))
+
+        assert_true(isinstance(doc, Document))
+        assert_equal((doc.id, doc.rev), ("test/1", "1"))
+        assert_equal(doc.body["name"], "John")
+        assert_equal(name, "John")
+
+    def test_prefetch(self):
+        conn = self.connection(
+            cursor_response(200, id=1, hasMore=True, result=[3, 4]),
+            cursor_response(200, id=1, hasMore=False, result=[5, 6]))
+
+        cursor = self.cursor(conn, prefetch=2)
+
+        assert_equal(next(cursor), 1)
+
+        # all batches fetched in background
+        # while first one is not consumed yet
+        assert_true(conn.fetched.wait(5))
+        assert_equal(len(conn.requests), 3)
+
+        assert_equal(list(cursor), [2, 3, 4, 5, 6])
+        assert_equal(conn.requests[-1], ("put", "/_api/cursor/1"))
+
+    def test_prefetch_stops_on_last_batch(self):
+        conn = self.connection(
+            cursor_response(200, id=1, hasMore=False, result=[3]),
+            cursor_response(200, id=1, hasMore=False, result=[4]))
+
+        cursor = self.cursor(conn, prefetch=1)
+
+        assert_equal(list(cursor), [1, 2, 3])
+        assert_equal(len(conn.batches), 1)
+
+    @raises(AqlQueryError)
+    def test_prefetch_error(self):
+        conn = self.connection(
+            cursor_response(404, error=True, errorMessage="not found",
+                            code=404))
+
+        list(self.cursor(conn, prefetch=1))
+
+    @raises(IOError)
+    def test_prefetch_transport_error(self):
+        conn = self.connection(IOError("Connection reset"))
+
+        list(self.cursor(conn, prefetch=1))
+
+    def test_prefetch_stop(self):
+        conn = self.connection(
+            *[cursor_response(200, id=1, hasMore=True, result=[n])
+              for n in range(10)])
+
+        cursor = self.cursor(conn, prefetch=1)
+        assert_equal(next(cursor), 1)
+
+        cursor._stop_prefetch()
+        assert_true(len(conn.batches) >= 7)
+
+    def test_benchmark_large_batches(self):
+        """
+        Iteration over cursor should be linear: 5x more
+        items should cost about 5x more time, not 25x
+        """
+        def iterate(size):
+            batch = list(range(size))
+
+            def run():
+                conn = FakeConnection(
+                    cursor_response(id=1, hasMore=True, result=batch),
+                    [cursor_response(200, id=1, hasMore=False,
+                                     result=batch)])
+
+                for item in self.cursor(conn):
+                    pass
+
+            return min(timeit.repeat(run, number=1, repeat=3))
+
+        small = iterate(20000)
+        large = iterate(100000)
+
+        assert_true(
+            large < small * 10,
+            "Iteration isn't linear: {0:.4f}s for 40k items, "
+            "{1:.4f}s for 200k items".format(small, large))
+
+    def test_iterate_many_batches(self):
+        # NB: no recursion for long chains of empty batches
+        conn = self.connection(
+            *[cursor_response(200, id=1, hasMore=True, result=[])
+              for n in range(5000)] +
+            [cursor_response(200, id=1, hasMore=False, result=[3])])
+
+        assert_equal(list(self.cursor(conn)), [1, 2, 3])
+
+
+class TestCursorClose(TestsBase):
+    def setUp(self):
+        super(TestCursorClose, self).setUp()
+
+        self.conn.client.post.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({
+                "id": "15", "hasMore": True, "result": [1, 2]}))
+        self.conn.client.put.return_value = RequestsBase.build_response(
+            200, "", {}, json.dumps({
+                "id": "15", "hasMore": False, "result": [3]}))
+        self.conn.client.delete.return_value = RequestsBase.build_response(
+            202, "", {}, json.dumps({"id": "15"}))
+
+    def cursor(self):
+        return self.conn.query("FOR d IN [1, 2, 3] RETURN d", raw=True)
+
+    def test_close(self):
+        cursor = self.cursor()
+        assert_equal(next(cursor), 1)
+        assert_equal(self.conn.open_cursors, [cursor])
+
+        assert_true(cursor.close())
+        assert_true(self.conn.client.delete.call_args[0][0].endswith(
+            "/_api/cursor/15"))
+        assert_equal(self.conn.open_cursors, [])
+        assert_equal(list(cursor), [])
+
+        # second close does nothing
+        assert_false(cursor.close())
+        assert_equal(self.conn.client.delete.call_count, 1)
+
+    def test_exhausted(self):
+        cursor = self.cursor()
+        assert_equal(list(cursor), [1, 2, 3])
+
+        assert_equal(self.conn.open_cursors, [])
+        assert_false(cursor.close())
+        assert_false(self.conn.client.delete.called)
+
+    def test_context_manager(self):
+        with self.cursor() as cursor:
+            for item in cursor:
+                break
+
+        assert_false(cursor.is_open)
+        assert_true(self.conn.client.delete.called)
+
+    @raises(AqlQueryError)
+    def test_closed_before_fetch(self):
+        cursor = self.cursor()
+        cursor.close()
+        cursor.first
+
+    def test_garbage_collected(self):
+        self.cursor().first
+        gc.collect()
+
+        assert_true(self.conn.client.delete.called)
+        assert_equal(len(self.conn.cursors), 0)
+
+
+class TestCursorLength(TestsBase):
+    def response(self, status=201, **body):
+        return RequestsBase.build_response(status, "", {}, json.dumps(body))
+
+    def cursor(self, **kwargs):
+        return self.conn.query("FOR d IN test RETURN d", raw=True, **kwargs)
+
+    def sent(self, call):
+        return json.loads(call[1]["data"])
+
+    def test_params(self):
+        params = self.cursor().params
+        assert_false(params["count"])
+        assert_false("ttl" in params)
+        assert_false("options" in params)
+
+        params = self.cursor(
+            ttl=30, stream=True, options={"maxRuntime": 5}).params
+        assert_equal(params["ttl"], 30)
+        assert_equal(params["options"], {"maxRuntime": 5, "stream": True})
+
+    def test_len_from_count(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, count=10, result=[1, 2])
+
+        cursor = self.cursor(count=True)
+        assert_equal(len(cursor), 10)
+        assert_equal(self.conn.client.post.call_count, 1)
+        assert_true(self.sent(self.conn.client.post.call_args)["count"])
+
+    def test_len_single_batch(self):
+        self.conn.client.post.return_value = self.response(
+            hasMore=False, result=[1, 2, 3])
+
+        cursor = self.cursor()
+        assert_equal(next(cursor), 1)
+        assert_equal(len(cursor), 3)
+        assert_equal(self.conn.client.post.call_count, 1)
+
+    def test_len_query(self):
+        self.conn.client.post.side_effect = [
+            self.response(id="1", hasMore=True, result=[1, 2]),
+            self.response(hasMore=False, result=[25])]
+
+        cursor = self.cursor(bindVars={"x": 1})
+        assert_true(cursor)
+        assert_equal(cursor.count_query(), 25)
+        assert_equal(len(cursor), 25)
+        assert_equal(cursor.count_query(), 25)
+        assert_equal(self.conn.client.post.call_count, 2)
+
+        body = self.sent(self.conn.client.post.call_args)
+        assert_equal(body["query"], "RETURN LENGTH(FOR d IN test RETURN d)")
+        assert_equal(body["bindVars"], {"x": 1})
+
+        # first batch is not lost
+        assert_equal(next(cursor), 1)
+
+    def test_iterate_without_len(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1, 2])
+        self.conn.client.put.return_value = self.response(
+            200, id="1", hasMore=False, result=[3])
+
+        assert_equal(list(self.cursor()), [1, 2, 3])
+        assert_equal(self.conn.client.post.call_count, 1)
+
+    @raises(TypeError)
+    def test_len_unknown(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1, 2])
+
+        try:
+            len(self.cursor())
+        finally:
+            # no query to count results
+            assert_equal(self.conn.client.post.call_count, 1)
+
+    def test_len_exhausted(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1, 2])
+        self.conn.client.put.return_value = self.response(
+            200, id="1", hasMore=False, result=[3])
+
+        cursor = self.cursor()
+        assert_equal(list(cursor), [1, 2, 3])
+        assert_equal(len(cursor), 3)
+
+    def test_empty(self):
+        self.conn.client.post.return_value = self.response(
+            hasMore=False, result=[])
+
+        assert_false(self.cursor())
+
+    @raises(AqlQueryError)
+    def test_len_query_error(self):
+        self.conn.client.post.return_value = self.response(
+            400, error=True, errorNum=1501, errorMessage="syntax error")
+
+        self.cursor().count_query()
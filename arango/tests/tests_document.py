@@ -1,9 +1,15 @@
+import io
+import os
+import tempfile
+
 from .tests_base import TestsBase
 
 from nose.tools import assert_equal, raises, assert_false, \
     assert_not_equal, assert_true
 
-from arango.document import Document, Documents
+from arango.clients.base import RequestsBase
+from arango.document import Document, Documents, DocumentList, \
+    BulkResult, OperationResult
 from arango.utils import json
 from arango.exceptions import DocumentAlreadyCreated, \
     DocumentIncompatibleDataType, DocumentNotFound
@@ -75,6 +81,506 @@ class TestDocument(TestDocumentBase):
         assert_equal(type(self.d), Documents)
         assert_equal(type(self.c.docs), type(self.c.documents))
 
+    def test_documents_raw(self):
+        patcher = self.response_mock(
+            status_code=201,
+            text=json.dumps(dict(
+                hasMore=False, count=2,
+                result=[{"_id": "test/1", "name": "John"},
+                        {"_id": "test/2", "name": "Jane"}])),
+            method="post")
+
+        patcher.start()
+        names = list(self.d().raw("name"))
+        patcher.stop()
+
+        assert_equal(names, [("John",), ("Jane",)])
+
+    def test_hydrate(self):
+        doc = Document.hydrate(
+            self.conn, {"_id": "test/1", "_rev": "1", "x": 1})
+
+        assert_equal((doc.id, doc.rev, doc.body["x"]), ("test/1", "1", 1))
+        assert_equal(Document.hydrate(self.conn, {"x": 1}), {"x": 1})
+        assert_equal(Document.hydrate(self.conn, 5), 5)
+        assert_false(self.conn.client.get.called)
+
+    def test_hydrate_partial(self):
+        patcher = self.response_mock(
+            status_code=200,
+            text=json.dumps(dict(_id="test/1", _rev="1", x=1)),
+            method="get")
+
+        patcher.start()
+        doc = Document.hydrate(self.conn, {"_id": "test/1"})
+        patcher.stop()
+
+        assert_equal(doc.rev, "1")
+        assert_equal(doc.body["x"], 1)
+
+    def load_many_mock(self):
+        requests = []
+
+        def post(url, data=None, **kwargs):
+            body = json.loads(data)
+            requests.append(body)
+
+            result = [
+                {"_id": "test/{0}".format(key), "_rev": "1", "key": key}
+                if key != "missing" else None
+                for key in body["bindVars"]["ids"]]
+
+            return RequestsBase.build_response(
+                201, "", {}, json.dumps({"hasMore": False, "result": result}))
+
+        self.conn.client.post.side_effect = post
+        return requests
+
+    def test_load_many(self):
+        requests = self.load_many_mock()
+
+        docs = self.d.load_many(
+            ["1", "missing", Document(id="test/2"), "3", "4"], chunk_size=2)
+
+        assert_true(isinstance(docs, DocumentList))
+        assert_equal(
+            [d.body["key"] if d else None for d in docs],
+            ["1", None, "test/2", "3", "4"])
+        assert_equal(docs.missing, ["missing"])
+
+        assert_equal(
+            [r["bindVars"]["ids"] for r in requests],
+            [["1", "missing"], ["test/2", "3"], ["4"]])
+        assert_equal(requests[0]["bindVars"]["@collection"], "test")
+
+    def test_load_many_parallel(self):
+        requests = self.load_many_mock()
+        keys = [str(n) for n in range(100)]
+
+        docs = self.d.load_many(keys, chunk_size=10, workers=4)
+
+        assert_equal([d.body["key"] for d in docs], keys)
+        assert_equal(len(requests), 10)
+        assert_false(self.conn.client.get.called)
+
+    def bulk_mock(self, fail=()):
+        bodies = []
+
+        def post(url, data=None, **kwargs):
+            lines = data.split(b"\n")
+            bodies.append(lines)
+
+            if any(line in fail for line in lines):
+                return RequestsBase.build_response(
+                    400, "", {}, json.dumps({"error": True}))
+
+            return RequestsBase.build_response(
+                201, "", {}, json.dumps({
+                    "created": len(lines), "errors": 0, "empty": 0,
+                    "error": False}))
+
+        self.conn.client.post.side_effect = post
+        return bodies
+
+    def test_create_bulk_chunks(self):
+        bodies = self.bulk_mock()
+
+        result = self.d.create_bulk(
+            [{"n": n} for n in range(5)], batch=2)
+
+        assert_true(isinstance(result, BulkResult))
+        assert_equal(
+            result,
+            {"created": 5, "errors": 0, "empty": 0, "error": False})
+        assert_equal([len(lines) for lines in bodies], [2, 2, 1])
+        assert_equal(result.chunks, 3)
+        assert_equal(result.failures, [])
+
+    def test_create_bulk_headers_chunks(self):
+        bodies = self.bulk_mock()
+
+        self.d.create_bulk(
+            [["name"], ["a"], ["b"], ["c"]], batch=2)
+
+        assert_equal(
+            bodies,
+            [[b'["name"]', b'["a"]', b'["b"]'],
+             [b'["name"]', b'["c"]']])
+
+    def test_create_bulk_failures(self):
+        self.bulk_mock(fail=(b'{"n": 3}',))
+
+        result = self.d.create_bulk(
+            [{"n": n} for n in range(6)], batch=2, workers=3)
+
+        assert_equal(result["created"], 4)
+        assert_true(result["error"])
+
+        offset, size, response = result.failures[0]
+        assert_equal((offset, size, response.status), (2, 2, 400))
+
+    def test_create_bulk_all_failed(self):
+        self.bulk_mock(fail=(b'{"n": 0}',))
+
+        result = self.d.create_bulk([{"n": 0}, {"n": 1}])
+
+        assert_true(isinstance(result, BulkResult))
+        assert_true(result["error"])
+        assert_equal(result["created"], 0)
+
+        offset, size, response = result.failures[0]
+        assert_equal((offset, size, response.status), (0, 2, 400))
+        assert_equal(response.data, {"error": True})
+
+    def test_create_bulk_generator(self):
+        produced = []
+        seen = []
+
+        def docs():
+            for n in range(10):
+                produced.append(n)
+                yield {"n": n}
+
+        bodies = self.bulk_mock()
+        post = self.conn.client.post.side_effect
+
+        def tracking_post(url, data=None, **kwargs):
+            seen.append(len(produced))
+            return post(url, data=data, **kwargs)
+
+        self.conn.client.post.side_effect = tracking_post
+
+        result = self.d.create_bulk(docs(), batch=3)
+
+        assert_equal(result["created"], 10)
+        assert_equal([len(lines) for lines in bodies], [3, 3, 3, 1])
+        # NB: documents are consumed only when needed
+        assert_equal(seen, [4, 7, 10, 10])
+
+    def test_create_bulk_empty_generator(self):
+        assert_equal(self.d.create_bulk(iter([])), False)
+
+    def test_create_bulk_file(self):
+        bodies = self.bulk_mock()
+
+        fd, path = tempfile.mkstemp(suffix=".ndjson")
+        with os.fdopen(fd, "wb") as f:
+            f.write(b'{"n": 1}\n\n{"n": 2}\r\n{"n": 3}\n')
+
+        try:
+            result = self.d.create_bulk(path, batch=2)
+        finally:
+            os.remove(path)
+
+        assert_equal(result["created"], 3)
+        assert_equal(
+            bodies, [[b'{"n": 1}', b'{"n": 2}'], [b'{"n": 3}']])
+
+    def test_create_bulk_file_object(self):
+        bodies = self.bulk_mock()
+
+        self.d.create_bulk(
+            io.StringIO(u'["name"]\n["a"]\n["b"]\n'), batch=10)
+
+        assert_equal(bodies, [[b'["name"]', b'["a"]', b'["b"]']])
+
+    def test_create_bulk_max_bytes(self):
+        bodies = self.bulk_mock()
+
+        result = self.d.create_bulk(
+            [{"n": n} for n in range(10)], batch=None, max_bytes=20)
+
+        assert_equal(result["created"], 10)
+        assert_true(all(len(b"\n".join(lines)) <= 20 for lines in bodies))
+        assert_equal(len(bodies), 5)
+
+    def many_mock(self, missing=(), error_key=None):
+        requests = []
+
+        def post(url, data=None, **kwargs):
+            body = json.loads(data)
+            requests.append(body)
+            values = body["bindVars"].get("items") or \
+                body["bindVars"]["keys"]
+            keys = [v["key"] if isinstance(v, dict) else v for v in values]
+
+            if error_key in keys:
+                return RequestsBase.build_response(
+                    400, "", {}, json.dumps({
+                        "error": True, "errorNum": 1579,
+                        "errorMessage": "conflict"}))
+
+            return RequestsBase.build_response(
+                201, "", {}, json.dumps({
+                    "hasMore": False,
+                    "result": [{"key": key, "rev": "r" + key}
+                               for key in keys if key not in missing]}))
+
+        self.conn.client.post.side_effect = post
+        return requests
+
+    def test_update_many(self):
+        requests = self.many_mock(missing=("2",))
+
+        result = self.d.update_many(
+            [("test/1", {"x": 1}), ("2", {"x": 2}), ("3", {"x": 3})],
+            chunk_size=2, waitForSync=True)
+
+        assert_true(isinstance(result, OperationResult))
+        assert_equal(result, {"1": "r1", "3": "r3"})
+        assert_equal(list(result.errors), ["2"])
+
+        assert_equal(len(requests), 2)
+        assert_true("UPDATE item.key WITH item.body" in requests[0]["query"])
+        assert_true("waitForSync: @option_waitForSync"
+                    in requests[0]["query"])
+        assert_equal(
+            requests[0]["bindVars"],
+            {"@collection": "test", "option_waitForSync": True,
+             "items": [{"key": "1", "body": {"x": 1}},
+                       {"key": "2", "body": {"x": 2}}]})
+
+    def test_update_many_ignore_errors(self):
+        requests = self.many_mock(missing=("2",))
+
+        result = self.d.update_many(
+            {"1": {"x": 1}, "2": {"x": 2}}, ignoreErrors=False)
+
+        query = requests[0]["query"]
+        assert_equal(query.count("ignoreErrors:"), 1)
+        assert_true("ignoreErrors: @option_ignoreErrors" in query)
+        assert_equal(requests[0]["bindVars"]["option_ignoreErrors"], False)
+        assert_equal(
+            result.errors["2"],
+            "Document `2` is not processed "
+            "(not found or rejected by the server)")
+
+    def test_replace_many_documents(self):
+        requests = self.many_mock()
+
+        doc = Document(connection=self.conn)
+        doc._id, doc._body = "test/1", {"x": 1}
+
+        result = self.d.replace_many([doc])
+
+        assert_equal(result, {"1": "r1"})
+        assert_equal(doc._rev, "r1")
+        assert_true("REPLACE item.key" in requests[0]["query"])
+
+    def test_delete_many(self):
+        requests = self.many_mock(error_key="3")
+
+        result = self.d.delete_many(
+            ["test/1", "2", "3"], chunk_size=2, workers=2)
+
+        assert_equal(result, {"1": "r1", "2": "r2"})
+        assert_equal(result.errors, {"3": "conflict"})
+        assert_true(all("REMOVE key IN @@collection" in r["query"]
+                        for r in requests))
+
+    def count_mock(self, count=10):
+        self.conn.client.get.return_value = RequestsBase.build_response(
+            200, "", {}, json.dumps({"count": count}))
+
+    def test_count(self):
+        self.count_mock()
+
+        assert_equal(self.d.count, 10)
+        assert_equal(len(self.d), 10)
+
+        assert_true(self.conn.client.get.call_args[0][0].endswith(
+            "/_api/collection/test/count"))
+        assert_false(self.conn.client.post.called)
+
+    def test_resultset_length(self):
+        self.count_mock()
+
+        assert_equal(len(self.d()), 10)
+        assert_equal(len(self.d().limit(3)), 3)
+        assert_equal(len(self.d().limit(3).offset(8)), 2)
+        assert_equal(len(self.d().limit(3).offset(12)), 0)
+        assert_false(self.conn.client.post.called)
+
+    def test_count_ttl(self):
+        self.count_mock()
+        self.c.count_ttl = 60
+
+        assert_equal(self.d.count, 10)
+        self.count_mock(11)
+        assert_equal(self.d.count, 10)
+        assert_equal(self.conn.client.get.call_count, 1)
+
+        assert_equal(self.c.count(ttl=0), 11)
+
+    def query_mock(self):
+        queries = []
+
+        def post(url, data=None, **kwargs):
+            queries.append(json.loads(data))
+            return RequestsBase.build_response(
+                201, "", {}, json.dumps({
+                    "hasMore": False,
+                    "result": [{"_id": "test/1", "_rev": "1"}]}))
+
+        self.conn.client.post.side_effect = post
+        return queries
+
+    def test_resultset_first_last(self):
+        queries = self.query_mock()
+        self.count_mock(10)
+
+        rs = self.d().limit(5).offset(2)
+
+        assert_equal(rs.first.id, "test/1")
+        assert_equal(rs.last.id, "test/1")
+        rs.first, rs.last
+
+        assert_equal(
+            [q["query"] for q in queries],
+            ["FOR d IN @@collection LIMIT @offset, @count RETURN d"] * 2)
+        assert_equal(
+            [(q["bindVars"]["offset"], q["bindVars"]["count"])
+             for q in queries],
+            [(2, 1), (6, 1)])
+        assert_equal(queries[0]["bindVars"]["@collection"], "test")
+
+    def test_resultset_offset_without_limit(self):
+        queries = self.pages_mock(
+            ["k{0:02d}".format(n) for n in range(20)])
+        self.count_mock(20)
+
+        rs = self.d().offset(5)
+
+        assert_equal(rs[0]["_key"], "k05")
+        assert_equal(
+            [doc["_key"] for doc in rs[:3]], ["k05", "k06", "k07"])
+        assert_equal(len(rs), 15)
+        assert_equal(len(list(rs)), 15)
+        assert_equal(
+            [(q["bindVars"]["offset"], q["bindVars"]["count"])
+             for q in queries[:2]],
+            [(5, 1), (5, 3)])
+
+    def test_resultset_order_by(self):
+        queries = self.query_mock()
+
+        self.d().order_by("-age", "name").last
+
+        assert_equal(
+            queries[0]["query"],
+            "FOR d IN @@collection SORT d[@sort_0] ASC, d[@sort_1] DESC "
+            "LIMIT @offset, @count RETURN d")
+        assert_equal(
+            (queries[0]["bindVars"]["sort_0"],
+             queries[0]["bindVars"]["sort_1"]), ("age", "name"))
+        assert_false(self.conn.client.get.called)
+
+    def test_resultset_pages_query(self):
+        queries = self.query_mock()
+
+        list(self.d().limit(10).offset(0))
+        list(self.d().limit(10).offset(10))
+
+        assert_equal(queries[0]["query"], queries[1]["query"])
+        assert_equal(queries[1]["bindVars"]["offset"], 10)
+        assert_equal(queries[0]["batchSize"], None)
+
+    def test_resultset_after(self):
+        queries = self.query_mock()
+
+        self.d().after("k100")[:50].first
+
+        assert_equal(
+            queries[0]["query"],
+            "FOR d IN @@collection FILTER d[@after_field] > @after "
+            "SORT d[@sort_0] ASC LIMIT @offset, @count RETURN d")
+        assert_equal(
+            dict((k, v) for k, v in queries[0]["bindVars"].items()
+                 if k != "@collection"),
+            {"after_field": "_key", "after": "k100", "sort_0": "_key",
+             "offset": 0, "count": 1})
+
+    def pages_mock(self, keys):
+        queries = []
+
+        def post(url, data=None, **kwargs):
+            query = json.loads(data)
+            queries.append(query)
+            bind_vars = query["bindVars"]
+            desc = "d[@sort_0] DESC" in query["query"]
+
+            rows = sorted(keys, reverse=desc)
+
+            if "after" in bind_vars:
+                after = bind_vars["after"]
+                rows = [key for key in rows
+                        if (key < after if desc else key > after)]
+
+            rows = rows[bind_vars["offset"]:][:bind_vars["count"]]
+
+            return RequestsBase.build_response(
+                201, "", {}, json.dumps({
+                    "hasMore": False,
+                    "result": [{"_id": "test/" + key, "_rev": "1",
+                                "_key": key} for key in rows]}))
+
+        self.conn.client.post.side_effect = post
+        return queries
+
+    def test_resultset_pages(self):
+        queries = self.pages_mock(
+            ["k{0:02d}".format(n) for n in range(5)])
+
+        pages = list(self.d().pages(2))
+
+        assert_equal(
+            [[doc["_key"] for doc in page] for page in pages],
+            [["k00", "k01"], ["k02", "k03"], ["k04"]])
+
+        # NB: server never skip documents
+        assert_equal([q["bindVars"]["offset"] for q in queries], [0, 0, 0])
+        assert_equal(
+            [q["bindVars"].get("after") for q in queries],
+            [None, "k01", "k03"])
+
+    def test_resultset_pages_desc(self):
+        queries = self.pages_mock(
+            ["k{0:02d}".format(n) for n in range(5)])
+
+        pages = list(self.d().order_by("-_key").pages(2))
+
+        assert_equal(
+            [[doc["_key"] for doc in page] for page in pages],
+            [["k04", "k03"], ["k02", "k01"], ["k00"]])
+
+        for query in queries:
+            assert_true("SORT d[@sort_0] DESC LIMIT" in query["query"])
+
+    def test_resultset_pages_raw(self):
+        self.pages_mock(["k{0:02d}".format(n) for n in range(5)])
+
+        pages = list(self.d().raw("_key", "_rev").pages(3))
+
+        assert_equal(pages, [
+            [("k00", "1"), ("k01", "1"), ("k02", "1")],
+            [("k03", "1"), ("k04", "1")]])
+
+    @raises(ValueError)
+    def test_resultset_pages_raw_without_field(self):
+        list(self.d().raw("_rev").pages(3))
+
+    def test_resultset_pages_window(self):
+        queries = self.pages_mock(
+            ["k{0:02d}".format(n) for n in range(10)])
+
+        pages = list(self.d().limit(5).offset(2).pages(2))
+
+        assert_equal(
+            [[doc["_key"] for doc in page] for page in pages],
+            [["k02", "k03"], ["k04", "k05"], ["k06"]])
+        assert_equal([q["bindVars"]["offset"] for q in queries], [2, 0, 0])
+        assert_equal([q["bindVars"]["count"] for q in queries], [2, 2, 1])
+
     def test_document_create(self):
         body = dict(
             key="value",
@@ -273,7 +779,7 @@ class TestDocument(TestDocumentBase):
                 error=False,
                 code=201
             )),
-            method="put"
+            method="patch"
         )
 
         patcher.start()
@@ -294,6 +800,124 @@ class TestDocument(TestDocumentBase):
         assert_equal(doc.rev, 30967599)
         patcher.stop()
 
+    def test_save_changes_only(self):
+        doc = self.create_document({"name": "sample", "counter": 1})
+        response = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+        self.conn.client.patch.return_value = response
+        self.conn.client.put.return_value = response
+
+        doc["counter"] = 2
+        doc.update({"tags": ["a"]}, save=False)
+        assert_equal(doc.changes, {"counter": 2, "tags": ["a"]})
+
+        doc.save()
+
+        assert_equal(
+            json.loads(self.conn.client.patch.call_args[1]["data"]),
+            {"counter": 2, "tags": ["a"]})
+        assert_false(self.conn.client.put.called)
+        assert_equal(doc.changes, {})
+        assert_equal(doc.rev, "2")
+
+    def test_save_nested(self):
+        doc = self.create_document(
+            {"name": "sample", "address": {"city": "A", "zip": 1}})
+        self.conn.client.patch.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        doc.update({"address": {"city": "X"}})
+
+        url, kwargs = self.conn.client.patch.call_args
+        assert_true("mergeObjects=false" in url[0])
+        assert_true("keepNull=true" in url[0])
+        assert_equal(json.loads(kwargs["data"]),
+                     {"address": {"city": "X"}})
+
+        # nested value may be modified in place
+        doc["address"]["city"] = "Y"
+        assert_equal(doc.changes, {"address": {"city": "Y"}})
+
+    def test_save_mixed_changes(self):
+        doc = self.create_document({"name": "sample", "counter": 1})
+        self.conn.client.patch.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        doc["counter"] = 2
+        doc.body["name"] = "other"
+        assert_equal(doc.changes, {"name": "other", "counter": 2})
+
+        doc.save()
+
+        assert_equal(
+            json.loads(self.conn.client.patch.call_args[1]["data"]),
+            {"name": "other", "counter": 2})
+        assert_false(self.conn.client.put.called)
+        assert_equal(doc.changes, {})
+
+    def test_save_after_body_read(self):
+        doc = self.create_document(
+            {"name": "sample", "address": {"city": "A"}})
+        self.conn.client.patch.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        assert_equal(doc, doc)
+        assert_equal(doc.changes, {})
+
+        # nested objects returned by ``body`` may be modified in place
+        doc.body["address"]["city"] = "B"
+        assert_equal(doc.changes, {"address": {"city": "B"}})
+
+        doc.save()
+
+        assert_equal(
+            json.loads(self.conn.client.patch.call_args[1]["data"]),
+            {"address": {"city": "B"}})
+        assert_equal(doc.changes, {})
+
+    def test_save_removed_field(self):
+        doc = self.create_document({"name": "sample", "counter": 1})
+        self.conn.client.put.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        del doc.body["counter"]
+        assert_equal(doc.changes, None)
+
+        doc.save()
+
+        assert_equal(
+            json.loads(self.conn.client.put.call_args[1]["data"]),
+            {"name": "sample"})
+        assert_false(self.conn.client.patch.called)
+
+    def test_save_full(self):
+        doc = self.create_document({"name": "sample", "counter": 1})
+        self.conn.client.put.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        doc["counter"] = 2
+        doc.save(full=True)
+
+        assert_equal(
+            json.loads(self.conn.client.put.call_args[1]["data"]),
+            {"name": "sample", "counter": 2})
+        assert_false(self.conn.client.patch.called)
+
+    def test_save_overwritten_body(self):
+        doc = self.create_document({"name": "sample"})
+        self.conn.client.put.return_value = RequestsBase.build_response(
+            201, "", {}, json.dumps({"_rev": "2"}))
+
+        doc.body = {"other": 1}
+        assert_equal(doc.changes, None)
+
+        doc.save()
+
+        assert_equal(
+            json.loads(self.conn.client.put.call_args[1]["data"]),
+            {"other": 1})
+        assert_false(self.conn.client.patch.called)
+
     def test_delete_notfound(self):
         doc = self.create_document({})
 
@@ -0,0 +1,204 @@
+import errno
+import socket
+import threading
+
+from nose.tools import assert_equal, assert_true, assert_false, raises
+from mock import MagicMock, patch
+
+from arango.core import Connection
+from arango.clients.pool import ConnectionPool, PoolManager, \
+    RemoteDisconnected
+from arango.clients.urllib2client import Urllib2Client
+
+from .tests_base import TestsBase
+
+
+class FakeHTTPConnection(object):
+    """
+    Connection which emulate server responses without
+    touching network
+    """
+    instances = []
+
+    def __init__(self, host, port, **kwargs):
+        self.host = host
+        self.port = port
+        self.closed = False
+        self.requests = []
+        self.fail = False
+        self.will_close = False
+        FakeHTTPConnection.instances.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        if self.fail:
+            raise self.fail
+
+        self.requests.append((method, path, body, headers))
+
+    def getresponse(self):
+        response = MagicMock()
+        response.status = 200
+        response.reason = "OK"
+        response.will_close = self.will_close
+        response.getheaders.return_value = [
+            ("content-type", "application/json")]
+        response.read.return_value = b'{"path": "ok"}'
+
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnectionPool(ConnectionPool):
+    connection_cls = FakeHTTPConnection
+
+
+class TestConnectionPool(TestsBase):
+    def setUp(self):
+        super(TestConnectionPool, self).setUp()
+        FakeHTTPConnection.instances = []
+        self.pool = FakeConnectionPool("localhost", 8529, maxsize=2)
+
+    def test_reuse_connection(self):
+        for n in range(5):
+            status, reason, headers, content = self.pool.urlopen(
+                "GET", "/_api/version")
+
+            assert_equal(status, 200)
+            assert_equal(content, b'{"path": "ok"}')
+
+        assert_equal(len(FakeHTTPConnection.instances), 1)
+
+        stats = self.pool.stats()
+        assert_equal(stats["created"], 1)
+        assert_equal(stats["reused"], 4)
+        assert_equal(stats["idle"], 1)
+        assert_equal(stats["in_use"], 0)
+
+    def test_bounded_size(self):
+        conns = [self.pool.checkout()[0] for n in range(4)]
+
+        for conn in conns:
+            self.pool.checkin(conn)
+
+        stats = self.pool.stats()
+        assert_equal(stats["idle"], 2)
+        assert_equal(stats["discarded"], 2)
+        assert_equal(len([c for c in conns if c.closed]), 2)
+
+    def test_blocking_checkout(self):
+        pool = FakeConnectionPool(
+            "localhost", 8529, maxsize=1, block=True)
+        conn, _ = pool.checkout()
+
+        released = []
+
+        def worker():
+            released.append(pool.checkout()[0])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(0.05)
+
+        assert_equal(released, [])
+
+        pool.checkin(conn)
+        thread.join(1)
+
+        assert_equal(released, [conn])
+        assert_equal(pool.stats()["created"], 1)
+
+    def test_idle_eviction(self):
+        pool = FakeConnectionPool("localhost", 8529, idle_timeout=10)
+        conn, _ = pool.checkout()
+        pool.checkin(conn)
+
+        with patch("arango.clients.pool.time.time") as time_mock:
+            time_mock.return_value = pool._idle[0][1] + 11
+            new_conn, reused = pool.checkout()
+
+        assert_false(reused)
+        assert_true(conn.closed)
+        assert_equal(pool.stats()["evicted"], 1)
+
+    def test_will_close_is_not_reused(self):
+        class ClosingConnection(FakeHTTPConnection):
+            def getresponse(self):
+                response = super(ClosingConnection, self).getresponse()
+                response.will_close = True
+                return response
+
+        self.pool.connection_cls = ClosingConnection
+        self.pool.urlopen("GET", "/")
+
+        assert_equal(self.pool.stats()["idle"], 0)
+        assert_true(FakeHTTPConnection.instances[0].closed)
+
+    def test_stale_connection_retry(self):
+        for error in [socket.error(errno.ECONNRESET, "Connection reset"),
+                      socket.error(errno.EPIPE, "Broken pipe"),
+                      RemoteDisconnected("Remote end closed connection")]:
+            conn, _ = self.pool.checkout()
+            self.pool.checkin(conn)
+            conn.fail = error
+
+            status, reason, headers, content = self.pool.urlopen("GET", "/")
+
+            assert_equal(status, 200)
+            assert_true(conn.closed)
+
+        assert_equal(self.pool.stats()["created"], 4)
+
+    @raises(socket.timeout)
+    def test_timeout_is_not_retried(self):
+        conn, _ = self.pool.checkout()
+        self.pool.checkin(conn)
+        conn.fail = socket.timeout("timed out")
+
+        try:
+            self.pool.urlopen("POST", "/_api/cursor", body=b"{}")
+        finally:
+            assert_true(conn.closed)
+            assert_equal(self.pool.stats()["created"], 1)
+
+    @raises(socket.error)
+    def test_fresh_connection_error(self):
+        class FailingConnection(FakeHTTPConnection):
+            def request(self, *args, **kwargs):
+                raise socket.error("Connection refused")
+
+        pool = FakeConnectionPool("localhost", 8529)
+        pool.connection_cls = FailingConnection
+        pool.urlopen("GET", "/")
+
+
+class TestPoolManager(TestsBase):
+    def test_pool_per_host(self):
+        manager = PoolManager(maxsize=3)
+        manager.pool_cls = FakeConnectionPool
+
+        pool = manager.pool("http", "localhost", 8529)
+
+        assert_true(pool is manager.pool("http", "localhost", 8529))
+        assert_false(pool is manager.pool("http", "localhost", 8530))
+        assert_equal(pool.maxsize, 3)
+
+        assert_equal(
+            sorted(manager.stats().keys()),
+            ["localhost:8529", "localhost:8530"])
+
+    def test_connection_pool_stats(self):
+        manager = PoolManager()
+        manager.pool_cls = FakeConnectionPool
+
+        with patch.object(Urllib2Client, "pools", manager):
+            conn = Connection(client=Urllib2Client)
+            assert_equal(conn.pool_stats, {})
+
+            response = Urllib2Client.request(
+                "GET", conn.url() + "/_api/version")
+
+            assert_equal(response.status_code, 200)
+            assert_equal(response.text, '{"path": "ok"}')
+            assert_equal(conn.pool_stats["created"], 1)
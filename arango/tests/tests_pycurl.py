@@ -0,0 +1,103 @@
+import threading
+
+try:
+    from SocketServer import ThreadingMixIn
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+except ImportError:
+    # for Python 3
+    from socketserver import ThreadingMixIn
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from nose import SkipTest
+from nose.tools import assert_equal
+
+from .tests_base import TestsBase
+
+try:
+    from arango.clients.pycurlclient import PyCurlClient, CurlPool
+except ImportError:
+    PyCurlClient = None
+
+
+class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        content = u'{{"method": "{0}", "path": "{1}", "body": "{2}"}}'.format(
+            self.command, self.path, len(body)).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPyCurlClient(TestsBase):
+    def setUp(self):
+        if PyCurlClient is None:
+            raise SkipTest
+
+        super(TestPyCurlClient, self).setUp()
+
+        self.server = ThreadedHTTPServer(("127.0.0.1", 0), EchoHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.base_url = "http://127.0.0.1:{0}".format(
+            self.server.server_address[1])
+
+        self.handles = PyCurlClient.handles
+        PyCurlClient.handles = CurlPool(maxsize=2)
+
+    def tearDown(self):
+        super(TestPyCurlClient, self).tearDown()
+
+        PyCurlClient.handles.close()
+        PyCurlClient.handles = self.handles
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_handles_reused(self):
+        for n in range(3):
+            response = PyCurlClient.post(
+                self.base_url + "/_api/document", data='{"a": 1}')
+
+            assert_equal(response.status_code, 200)
+            assert_equal(
+                response.text,
+                '{"method": "POST", "path": "/_api/document", "body": "8"}')
+
+        assert_equal(len(PyCurlClient.handles), 1)
+
+    def test_multi(self):
+        requests = [
+            ("get", self.base_url + "/1"),
+            ("put", self.base_url + "/2", '{"b": 2}'),
+            ("delete", self.base_url + "/3")]
+
+        responses = PyCurlClient.multi(requests)
+
+        assert_equal(
+            [r.status_code for r in responses], [200, 200, 200])
+        assert_equal(
+            [r.text for r in responses],
+            ['{"method": "GET", "path": "/1", "body": "0"}',
+             '{"method": "PUT", "path": "/2", "body": "8"}',
+             '{"method": "DELETE", "path": "/3", "body": "0"}'])
+
+        # number of pooled handles is bounded
+        assert_equal(len(PyCurlClient.handles), 2)
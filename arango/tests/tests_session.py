@@ -0,0 +1,76 @@
+import gc
+
+from nose.tools import assert_equal, assert_false, assert_true
+
+from arango.clients.base import RequestsBase
+from arango.cursor import Cursor
+from arango.document import Document
+from arango.session import Session
+from arango.utils import json
+
+from .tests_base import TestsBase
+
+
+class TestSession(TestsBase):
+    def response(self, status, body):
+        return RequestsBase.build_response(status, "", {}, json.dumps(body))
+
+    def query(self, *rows):
+        self.conn.client.post.return_value = self.response(
+            201, {"hasMore": False, "result": list(rows)})
+
+        return list(Cursor(self.conn, "FOR d IN test RETURN d"))
+
+    def test_identity(self):
+        row = {"_id": "test/1", "_rev": "1", "x": 1}
+
+        with self.conn.session() as session:
+            assert_true(isinstance(session, Session))
+            assert_equal(self.conn.identity_map, session)
+
+            first, = self.query(dict(row))
+            second, = self.query(dict(row))
+
+            assert_true(first is second)
+            assert_true(Document.load(self.conn, id="test/1") is first)
+            assert_false(self.conn.client.get.called)
+
+        assert_equal(self.conn.identity_map, None)
+        assert_false(self.query(row)[0] is first)
+
+    def test_new_revision(self):
+        with self.conn.session():
+            doc, = self.query({"_id": "test/1", "_rev": "1", "x": 1})
+            doc["x"] = 5
+
+            same, = self.query({"_id": "test/1", "_rev": "1", "x": 1})
+            assert_equal(same.body["x"], 5)
+
+            same, = self.query({"_id": "test/1", "_rev": "2", "x": 2})
+            assert_true(same is doc)
+            assert_equal((doc.rev, doc.body["x"]), ("2", 2))
+
+    def test_weak_references(self):
+        with self.conn.session() as session:
+            self.query({"_id": "test/1", "_rev": "1"})
+            gc.collect()
+
+            assert_false("test/1" in session)
+
+    def test_ref(self):
+        with self.conn.session() as session:
+            doc, = self.query({"_id": "test/1", "_rev": "1"})
+
+            assert_true(Document.ref(self.conn, "test/1") is doc)
+            assert_true(
+                Document.ref(self.conn, "test/2") is session.get("test/2"))
+
+    def test_delete(self):
+        self.conn.client.delete.return_value = self.response(
+            202, {"_id": "test/1"})
+
+        with self.conn.session() as session:
+            doc, = self.query({"_id": "test/1", "_rev": "1"})
+            doc.delete()
+
+            assert_false("test/1" in session)
@@ -0,0 +1,124 @@
+from nose.tools import assert_equal, assert_true
+
+from arango.clients.base import RequestsBase
+from arango.cursor import Cursor
+from arango.tuning import BatchSizeTuner
+from arango.utils import json
+
+from .tests_base import TestsBase
+
+
+QUERY = "FOR d IN test RETURN d"
+
+
+class TestBatchSizeTuner(TestsBase):
+    def test_initial(self):
+        tuner = BatchSizeTuner(initial=50)
+        assert_equal(tuner.size(QUERY), 50)
+        assert_equal(BatchSizeTuner().size(QUERY), 100)
+
+    def test_grow(self):
+        tuner = BatchSizeTuner(initial=100, latency=1.0)
+
+        # fast batches: growth limited by factor
+        assert_equal(tuner.observe(QUERY, 100, 100, 1000, 0.01), 200)
+        assert_equal(tuner.observe(QUERY, 100, 100, 1000, 0.01), 400)
+        assert_equal(tuner.size(QUERY), 400)
+
+    def test_maximum(self):
+        tuner = BatchSizeTuner(initial=100, maximum=150, growth=10)
+        assert_equal(tuner.observe(QUERY, 100, 100, 100, 0.0), 150)
+
+    def test_shrink_by_latency(self):
+        tuner = BatchSizeTuner(initial=100, latency=0.1)
+        assert_equal(tuner.observe(QUERY, 100, 100, 1000, 1.0), 10)
+
+    def test_shrink_by_bytes(self):
+        tuner = BatchSizeTuner(initial=100, max_bytes=1000)
+        assert_equal(tuner.observe(QUERY, 100, 100, 4000, 0.0), 25)
+
+    def test_minimum(self):
+        tuner = BatchSizeTuner(initial=100, minimum=20, latency=0.1)
+        assert_equal(tuner.observe(QUERY, 100, 100, 1000, 100.0), 20)
+
+    def test_partial_batch(self):
+        tuner = BatchSizeTuner(initial=100)
+        assert_equal(tuner.observe(QUERY, 100, 10, 100, 0.0), 100)
+
+    def test_stats(self):
+        tuner = BatchSizeTuner(initial=100, maxsize=1)
+        tuner.observe("RETURN 1", 100, 1, 10, 0.0)
+        tuner.observe(QUERY, 100, 100, 1000, 0.01)
+        tuner.observe(QUERY, 200, 50, 500, 0.01)
+
+        stats = tuner.stats()
+        assert_equal(list(stats), [QUERY])
+        assert_equal(stats[QUERY]["batches"], 2)
+        assert_equal(stats[QUERY]["rows"], 150)
+        assert_equal(stats[QUERY]["bytes"], 1500)
+
+        tuner.reset()
+        assert_equal(len(tuner), 0)
+
+
+class TestCursorAutoBatchSize(TestsBase):
+    def response(self, status=201, **body):
+        return RequestsBase.build_response(status, "", {}, json.dumps(body))
+
+    def test_auto(self):
+        self.conn.batch_tuner = BatchSizeTuner(
+            initial=2, minimum=1, latency=60)
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1, 2])
+        self.conn.client.put.return_value = self.response(
+            200, id="1", hasMore=False, result=[3])
+
+        cursor = self.conn.query(QUERY, batchSize="auto", raw=True)
+        assert_equal(list(iter(cursor)), [1, 2, 3])
+
+        sent = json.loads(self.conn.client.post.call_args[1]["data"])
+        assert_equal(sent["batchSize"], 2)
+        assert_equal([rows for rows, size, elapsed in cursor.batches],
+                     [2, 1])
+
+        # next cursor for the same query use bigger batches
+        cursor = self.conn.query(QUERY, batchSize="auto", raw=True)
+        assert_equal(cursor.batchSize, 4)
+        assert_equal(list(cursor.batches), [])
+
+    def test_server_default(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1, 2, 3])
+        self.conn.client.put.return_value = self.response(
+            200, id="1", hasMore=False, result=[4])
+
+        self.conn.batch_tuner = BatchSizeTuner(initial=None)
+
+        cursor = self.conn.query(QUERY, batchSize="auto", raw=True)
+        assert_equal(cursor.batchSize, None)
+        assert_equal(list(iter(cursor)), [1, 2, 3, 4])
+
+        # size of full batch chosen by the server is tuned
+        stats = self.conn.batch_tuner.stats()[QUERY]
+        assert_equal(stats["batches"], 1)
+        assert_equal(stats["size"], 10)
+
+    def test_batches_history(self):
+        self.conn.client.post.return_value = self.response(
+            id="1", hasMore=True, result=[1])
+        self.conn.client.put.side_effect = [
+            self.response(200, id="1", hasMore=True, result=[1])
+            for n in range(149)] + [
+            self.response(200, id="1", hasMore=False, result=[1])]
+
+        cursor = self.conn.query(QUERY, raw=True)
+        assert_equal(len(list(iter(cursor))), 151)
+
+        assert_equal(len(cursor.batches), Cursor.BATCHES_HISTORY)
+        assert_equal(cursor.totals["batches"], 151)
+        assert_equal(cursor.totals["rows"], 151)
+
+    def test_fixed(self):
+        cursor = self.conn.query(QUERY, batchSize=10)
+        assert_equal(cursor.batchSize, 10)
+        assert_equal(cursor.tuner, None)
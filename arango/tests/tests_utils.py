@@ -1,6 +1,7 @@
 
-from nose.tools import assert_equal
-from arango.utils import json
+from nose.tools import assert_equal, raises
+from arango.utils import json, chunks, parallel_map, \
+    parallel_each
 
 from .tests_base import TestsBase
 
@@ -19,3 +20,29 @@ class TestsUtils(TestsBase):
             json.loads(result),
             resource
         )
+
+    def test_chunks(self):
+        assert_equal(chunks([1, 2, 3], 2), [[1, 2], [3]])
+        assert_equal(chunks([1, 2, 3], None), [[1, 2, 3]])
+        assert_equal(chunks([], 2), [])
+
+    def test_parallel_map(self):
+        assert_equal(
+            parallel_map(lambda x: x * 2, range(20), workers=4),
+            [x * 2 for x in range(20)])
+
+    @raises(ValueError)
+    def test_parallel_map_error(self):
+        def func(x):
+            if x == 5:
+                raise ValueError(x)
+            return x
+
+        parallel_map(func, range(10), workers=3)
+
+    def test_parallel_each(self):
+        seen = []
+
+        assert_equal(
+            parallel_each(seen.append, iter(range(20)), workers=4), None)
+        assert_equal(sorted(seen), list(range(20)))
@@ -0,0 +1,121 @@
+import threading
+
+from nose.tools import assert_equal, assert_false, assert_true, raises
+
+from arango.clients.base import RequestsBase
+from arango.exceptions import DocumentCreateError
+from arango.utils import json
+from arango.writer import BufferedWriter, DocumentHandle
+
+from .tests_base import TestsBase
+
+
+class TestBufferedWriter(TestsBase):
+    def setUp(self):
+        super(TestBufferedWriter, self).setUp()
+        self.docs = self.conn.collection.test.documents
+        self.bodies = []
+        self.fail_keys = set()
+        self.release = threading.Event()
+        self.release.set()
+
+        self.conn.client.post.side_effect = self.import_response
+
+    def import_response(self, url, data=None, **kwargs):
+        self.release.wait(5)
+
+        lines = [json.loads(line) for line in data.split(b"\n")]
+        self.bodies.append((url, lines))
+
+        details = [
+            "at position {0}: creating document failed".format(n)
+            for n, doc in enumerate(lines) if doc["_key"] in self.fail_keys]
+
+        return RequestsBase.build_response(201, "", {}, json.dumps({
+            "created": len(lines) - len(details),
+            "errors": len(details), "details": details}))
+
+    def test_flush_on_exit(self):
+        with self.docs.buffered_writer(max_docs=3, max_delay=60) as writer:
+            handles = [writer.create({"n": n}) for n in range(7)]
+
+        assert_true(all(h.done() for h in handles))
+        assert_equal([len(lines) for url, lines in self.bodies], [3, 3, 1])
+        assert_equal(
+            [h.result() for h in handles],
+            ["test/{0}".format(doc["_key"])
+             for url, lines in self.bodies for doc in lines])
+
+        url = self.bodies[0][0]
+        assert_true("details=true" in url and "type=documents" in url)
+        assert_equal(writer.stats()["created"], 7)
+
+    def test_keep_key(self):
+        with self.docs.buffered_writer() as writer:
+            handle = writer.create({"_key": "mine"})
+
+        assert_equal(handle.result(), "test/mine")
+
+    def test_max_delay(self):
+        writer = self.docs.buffered_writer(max_docs=100, max_delay=0.01)
+        handle = writer.create({"n": 1})
+
+        assert_equal(handle.result(timeout=5), handle.id)
+        writer.close()
+
+    def test_max_bytes(self):
+        with self.docs.buffered_writer(max_bytes=100, max_delay=60) as w:
+            for n in range(10):
+                w.create({"n": n, "_key": "k{0}".format(n)})
+
+        assert_true(len(self.bodies) > 1)
+        assert_true(all(
+            len(b"\n".join(json.dumps(d).encode() for d in lines)) <= 100
+            for url, lines in self.bodies))
+
+    def test_failed_documents(self):
+        self.fail_keys.add("bad")
+
+        with self.docs.buffered_writer() as writer:
+            good = writer.create({"_key": "good"})
+            bad = writer.create({"_key": "bad"})
+
+        assert_equal(good.result(), "test/good")
+        assert_true(isinstance(bad.exception(), DocumentCreateError))
+        assert_equal(writer.stats()["failed"], 1)
+
+    def test_back_pressure(self):
+        self.release.clear()
+        writer = self.docs.buffered_writer(
+            max_docs=1, max_delay=0, max_pending=2)
+
+        writer.create({"n": 0})
+
+        # first document in flight, two more fill the buffer
+        for n in range(1, 3):
+            writer.create({"n": n})
+
+        try:
+            writer.create({"n": 3}, timeout=0.05)
+        except DocumentCreateError:
+            pass
+        else:
+            self.fail("Writer should block when buffer is full")
+        finally:
+            self.release.set()
+            writer.close()
+
+        assert_equal(len(self.bodies), 3)
+
+    @raises(DocumentCreateError)
+    def test_closed(self):
+        writer = self.docs.buffered_writer()
+        writer.close()
+        writer.create({"n": 1})
+
+    def test_handle(self):
+        handle = DocumentHandle("test/1")
+        assert_false(handle.done())
+
+        handle.resolve()
+        assert_equal(handle.result(), "test/1")
@@ -0,0 +1,136 @@
+import logging
+import threading
+
+from collections import OrderedDict
+
+__all__ = ("BatchSizeTuner",)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSizeTuner(object):
+    """
+    Choose ``batchSize`` for cursors created with
+    ``batchSize="auto"``. Server doesn't allow to change
+    size of batches of existing cursor, so size is tuned
+    per query string across executions: first cursor
+    use ``initial`` size, next ones grow or shrink batches
+    based on observed latency and payload size of full batches.
+
+    - ``initial`` - size of batches for unknown query (``None``
+      for server-controlled one). Small size gives fast first row
+      at cost of more round trips.
+    - ``minimum``, ``maximum`` - bounds of the size
+    - ``latency`` - target seconds per batch
+    - ``max_bytes`` - maximum size of encoded batch
+    - ``growth`` - maximum factor of growth per batch
+    - ``maxsize`` - maximum number of remembered queries
+
+    .. code::
+
+        conn = Connection(batch_tuner=BatchSizeTuner(latency=0.05))
+
+        for doc in conn.query("FOR d IN test RETURN d",
+                              batchSize="auto"):
+            pass
+
+        print(conn.batch_tuner.stats())
+
+    """
+
+    def __init__(self, initial=100, minimum=10, maximum=10000,
+                 latency=0.1, max_bytes=4 * 1024 * 1024, growth=2.0,
+                 maxsize=1000):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency = latency
+        self.max_bytes = max_bytes
+        self.growth = growth
+        self.maxsize = maxsize
+
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def size(self, query):
+        """
+        Get size of batches for ``query``
+        """
+        with self._lock:
+            entry = self._queries.get(query)
+
+            if entry is None:
+                return self.initial
+
+            return entry["size"]
+
+    def observe(self, query, size, rows, size_bytes, elapsed):
+        """
+        Record batch of ``rows`` (``size_bytes`` of payload)
+        fetched within ``elapsed`` seconds by cursor with
+        ``size`` batches and return new size for ``query``
+        """
+        with self._lock:
+            entry = self._queries.pop(query, None) or {
+                "size": size, "batches": 0, "rows": 0,
+                "bytes": 0, "elapsed": 0.0}
+            self._queries[query] = entry
+
+            while len(self._queries) > self.maxsize:
+                self._queries.popitem(last=False)
+
+            entry["batches"] += 1
+            entry["rows"] += rows
+            entry["bytes"] += size_bytes
+            entry["elapsed"] += elapsed
+
+            if not rows:
+                return entry["size"]
+
+            ideal = self.maximum
+
+            if elapsed > 0:
+                ideal = min(ideal, self.latency * rows / elapsed)
+
+            if size_bytes > 0 and self.max_bytes:
+                ideal = min(ideal, self.max_bytes * rows / size_bytes)
+
+            current = entry["size"]
+
+            if rows < size:
+                # partial batch: result is exhausted, so
+                # it's not a reason to grow batches
+                ideal = min(ideal, current)
+
+            new = max(self.minimum,
+                      int(min(ideal, current * self.growth)))
+
+            if new != current:
+                logger.debug("batchSize for %r: %s -> %s",
+                             query, current, new)
+                entry["size"] = new
+
+            return new
+
+    def reset(self, query=None):
+        with self._lock:
+            if query is None:
+                self._queries.clear()
+            else:
+                self._queries.pop(query, None)
+
+    def stats(self):
+        """
+        Chosen sizes together with totals of observed
+        batches for every query
+        """
+        with self._lock:
+            return dict(
+                (query, dict(entry))
+                for query, entry in self._queries.items())
+
+    def __len__(self):
+        return len(self._queries)
+
+    def __repr__(self):
+        return "<BatchSizeTuner for {0} queries>".format(len(self))
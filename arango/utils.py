@@ -1,11 +1,14 @@
 
+import threading
+
 try:
     import simplejson as json
 except ImportError:
     import json
 
 
-__all__ = ("json", "proxied_document_ref", "parse_meta")
+__all__ = ("json", "proxied_document_ref", "parse_meta", "chunks",
+           "parallel_map", "parallel_each")
 
 
 def proxied_document_ref(ref_or_document):
@@ -33,3 +36,78 @@ def parse_meta(obj, response):
     obj._rev = str(response.data.get("_rev"))
 
     return response
+
+
+def chunks(items, size):
+    """
+    Split list ``items`` into lists of ``size`` items
+    """
+    size = max(int(size or len(items)), 1)
+    return [items[start:start + size]
+            for start in range(0, len(items), size)]
+
+
+def parallel_map(func, items, workers=1):
+    """
+    Like ``map`` but call ``func`` in ``workers`` threads.
+    ``items`` consumed lazily, order of results is the same
+    as order of ``items``, first exception from ``func``
+    raised after all threads finished.
+    """
+    if workers is None or workers <= 1:
+        return [func(item) for item in items]
+
+    results = {}
+
+    def call(pair):
+        index, item = pair
+        results[index] = func(item)
+
+    parallel_each(call, enumerate(items), workers)
+
+    return [results[index] for index in range(len(results))]
+
+
+def parallel_each(func, items, workers=1):
+    """
+    Like :py:func:`parallel_map` but results of ``func``
+    are not kept, so memory doesn't grow with number
+    of ``items``
+    """
+    if workers is None or workers <= 1:
+        for item in items:
+            func(item)
+        return
+
+    errors = []
+    pending = iter(items)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if errors:
+                    return
+
+                try:
+                    item = next(pending)
+                except StopIteration:
+                    return
+
+            try:
+                func(item)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for n in range(workers)]
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
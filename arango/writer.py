@@ -0,0 +1,289 @@
+import re
+import time
+import uuid
+import logging
+import threading
+
+from .exceptions import DocumentCreateError
+
+__all__ = ("BufferedWriter", "DocumentHandle")
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentHandle(object):
+    """
+    Result of :py:meth:`BufferedWriter.create`. ``id`` of the
+    document known immediately, ``result()`` wait until
+    document will be imported and return ``id`` or raise
+    :py:class:`arango.exceptions.DocumentCreateError`.
+    """
+
+    def __init__(self, id):
+        self.id = id
+        self._event = threading.Event()
+        self._exception = None
+
+    def done(self):
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        exception = self.exception(timeout)
+
+        if exception is not None:
+            raise exception
+
+        return self.id
+
+    def exception(self, timeout=None):
+        if not self._event.wait(timeout):
+            raise DocumentCreateError(
+                "Document `{0}` is not imported yet".format(self.id))
+
+        return self._exception
+
+    def resolve(self, exception=None):
+        self._exception = exception
+        self._event.set()
+
+    def __repr__(self):
+        return "<DocumentHandle {0} ({1})>".format(
+            self.id, "done" if self.done() else "pending")
+
+
+class BufferedWriter(object):
+    """
+    Write-behind buffer for documents creation. Documents are
+    collected and imported via **HTTP Interface for bulk imports**
+    in background thread when one of limits is reached:
+
+    - ``max_docs`` - number of documents in buffer
+    - ``max_bytes`` - size of encoded documents in buffer
+    - ``max_delay`` - seconds since first document added to buffer
+
+    ``create`` block in case ``max_pending`` documents are waiting
+    for import (by default ten times ``max_docs``).
+
+    ``_key`` generated on client side in case it's not specified,
+    so ``id`` of document known before import.
+
+    .. code::
+
+        with c.test.documents.buffered_writer(max_docs=500) as writer:
+            handles = [writer.create({"n": n}) for n in range(10000)]
+
+        # all documents imported on exit
+        ids = [handle.result() for handle in handles]
+
+    """
+    DETAILS_POSITION = re.compile(r"at position (\d+)")
+
+    def __init__(self, documents, max_docs=1000, max_bytes=1024 * 1024,
+                 max_delay=1.0, max_pending=None):
+        self.documents = documents
+        self.connection = documents.connection
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.max_pending = max_pending or max_docs * 10
+
+        self.path = self.connection.qs(
+            documents.BULK_INSERT_PATH,
+            collection=documents.collection.cid,
+            createCollection="true", type="documents", details="true")
+
+        self.created = 0
+        self.failed = 0
+        self.flushes = 0
+
+        self._buffer = []
+        self._bytes = 0
+        self._first_at = None
+        self._in_flight = 0
+        self._flush = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def create(self, body, timeout=None):
+        """
+        Queue creation of document with ``body``.
+        Return :py:class:`DocumentHandle`.
+        """
+        body = dict(body)
+        key = body.setdefault("_key", uuid.uuid4().hex)
+        line = self.connection.codec.dumpb(body)
+
+        handle = DocumentHandle(
+            "{0}/{1}".format(self.documents.collection.cid, key))
+
+        with self._cond:
+            deadline = time.time() + timeout if timeout else None
+
+            # back-pressure
+            while len(self._buffer) >= self.max_pending \
+                    and not self._closed:
+                wait = deadline - time.time() if deadline else None
+
+                if wait is not None and wait <= 0:
+                    raise DocumentCreateError(
+                        "Buffer is full: {0} documents pending".format(
+                            len(self._buffer)))
+
+                self._cond.wait(wait)
+
+            if self._closed:
+                raise DocumentCreateError("Writer is closed")
+
+            if not self._buffer:
+                self._first_at = time.time()
+
+            self._buffer.append((handle, line))
+            self._bytes += len(line) + 1
+            self._cond.notify_all()
+
+        return handle
+
+    def flush(self):
+        """
+        Import all buffered documents and wait until done
+        """
+        with self._cond:
+            self._flush = True
+            self._cond.notify_all()
+
+            while self._buffer or self._in_flight:
+                self._cond.wait()
+
+            self._flush = False
+
+    def close(self):
+        """
+        Import all buffered documents and stop background thread
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join()
+
+    def stats(self):
+        return {
+            "pending": len(self._buffer),
+            "created": self.created,
+            "failed": self.failed,
+            "flushes": self.flushes}
+
+    def _ready(self):
+        if not self._buffer:
+            return False
+
+        return (self._flush or self._closed or
+                len(self._buffer) >= self.max_docs or
+                (self.max_bytes and self._bytes >= self.max_bytes) or
+                time.time() - self._first_at >= self.max_delay)
+
+    def _take(self):
+        """
+        Take chunk of documents from the buffer
+        """
+        size = 0
+        count = 0
+
+        for handle, line in self._buffer:
+            if count and (count >= self.max_docs or (
+                    self.max_bytes and size + len(line) + 1 > self.max_bytes)):
+                break
+
+            size += len(line) + 1
+            count += 1
+
+        chunk, self._buffer = self._buffer[:count], self._buffer[count:]
+        self._bytes -= size
+        self._first_at = time.time() if self._buffer else None
+
+        return chunk
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._ready():
+                    if self._closed and not self._buffer:
+                        return
+
+                    wait = None
+                    if self._buffer:
+                        wait = max(
+                            self.max_delay - (time.time() - self._first_at),
+                            0.001)
+
+                    self._cond.wait(wait)
+
+                chunk = self._take()
+                self._in_flight += len(chunk)
+                self._cond.notify_all()
+
+            try:
+                self._send(chunk)
+            finally:
+                with self._cond:
+                    self._in_flight -= len(chunk)
+                    self._cond.notify_all()
+
+    def _send(self, chunk):
+        handles = [handle for handle, line in chunk]
+        self.flushes += 1
+
+        try:
+            response = self.connection.post(
+                self.path, data=b"\n".join(line for handle, line in chunk),
+                ignore_request_args=True)
+        except Exception as e:
+            logger.error("Can't import %s documents", len(chunk),
+                         exc_info=True)
+            self._resolve(handles, {}, DocumentCreateError(str(e)))
+            return
+
+        if response.status != 201:
+            self._resolve(handles, {}, DocumentCreateError(
+                response.get("errorMessage", "Unknown error")))
+            return
+
+        errors = {}
+        for message in response.get("details", []):
+            match = self.DETAILS_POSITION.search(message)
+
+            if match is not None:
+                errors[int(match.group(1))] = message
+
+        self._resolve(handles, errors)
+
+    def _resolve(self, handles, errors, error=None):
+        for position, handle in enumerate(handles):
+            failure = error
+
+            if position in errors:
+                failure = DocumentCreateError(errors[position])
+
+            if failure is None:
+                self.created += 1
+            else:
+                self.failed += 1
+
+            handle.resolve(failure)
+
+    def __repr__(self):
+        return "<BufferedWriter for {0}: {1} pending>".format(
+            self.documents.collection.cid, len(self._buffer))